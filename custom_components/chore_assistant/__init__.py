@@ -1,14 +1,23 @@
 """The Chore Assistant integration."""
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import time
+from typing import Awaitable, Callable, Dict, Any
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
-from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.discovery import async_load_platform
 
 from .const import (
@@ -18,386 +27,606 @@ from .const import (
     SERVICE_COMPLETE_CHORE,
     SERVICE_RESET_CHORE,
     SERVICE_UPDATE_CHORE,
-    EVENT_CHORE_ADDED,
-    EVENT_CHORE_REMOVED,
-    EVENT_CHORE_COMPLETED,
-    EVENT_CHORE_RESET,
+    SERVICE_QUERY_HISTORY,
+    SERVICE_GET_REPORT,
+    SERVICE_CREATE_BACKUP,
+    SERVICE_LIST_BACKUPS,
+    SERVICE_RESTORE_BACKUP,
+    SERVICE_REBALANCE,
+    SERVICE_GET_FORECAST,
+    SERVICE_ANALYZE_STORAGE,
+    SERVICE_GET_CHANGES,
+    SERVICE_START_TRACE,
+    SERVICE_STOP_TRACE,
+    SERVICE_GET_DIAGNOSTICS,
+    COMMAND_COMPLETE,
+    COMMAND_RESET,
+    COMMAND_UPDATE,
+    ATTR_CHORE_NAME,
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_HOUSEHOLD,
+    DEFAULT_HOUSEHOLD,
+    DEFAULT_HOUSEHOLD_NAME,
     EVENT_CHORE_OVERDUE,
-    EVENT_CHORE_UPDATED,
 )
-from .models import Chore
+from . import actions, clock
+from .command_queue import ChoreCommandQueue
+from .household import Household
+from .idempotency import IdempotencyCache, request_fingerprint
 from .storage import ChoreStorage
 from .state_manager import ChoreStateManager
+from .trace import ServiceCallTracer
+from .websocket_api import async_register_websocket_commands
 from .validation import (
+    CONFIG_SCHEMA,
     ADD_CHORE_SCHEMA,
     REMOVE_CHORE_SCHEMA,
     COMPLETE_CHORE_SCHEMA,
     RESET_CHORE_SCHEMA,
     UPDATE_CHORE_SCHEMA,
     LIST_CHORES_SCHEMA,
+    HOUSEHOLD_SCHEMA,
+    QUERY_HISTORY_SCHEMA,
+    GET_REPORT_SCHEMA,
+    RESTORE_BACKUP_SCHEMA,
+    REBALANCE_SCHEMA,
+    GET_FORECAST_SCHEMA,
+    ANALYZE_STORAGE_SCHEMA,
+    GET_CHANGES_SCHEMA,
+    TRACE_SCHEMA,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 # Platforms supported by this integration
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "calendar", "todo"]
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Chore Assistant component."""
     _LOGGER.info("Setting up Chore Assistant component")
 
-    # Initialize storage
-    storage = ChoreStorage(hass)
-    await storage.async_load()
-
-    # Initialize state manager
-    state_manager = ChoreStateManager(storage)
-
-    # Store references in hass.data
     hass.data[DOMAIN] = {
-        "storage": storage,
-        "state_manager": state_manager,
+        "households": {},
+        "idempotency": IdempotencyCache(),
+        "tracer": ServiceCallTracer(hass),
     }
 
+    async def async_stop_households(event: Event) -> None:
+        """Close every household's storage on shutdown."""
+        await hass.data[DOMAIN]["tracer"].async_stop()
+        for household in list(hass.data[DOMAIN]["households"].values()):
+            await household.async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_households)
+    async_register_websocket_commands(hass)
+
     # Register services
     hass.services.async_register(
-        DOMAIN, SERVICE_ADD_CHORE, async_add_chore, schema=ADD_CHORE_SCHEMA
+        DOMAIN,
+        SERVICE_ADD_CHORE,
+        _traced(_when_ready(_idempotent(async_add_chore))),
+        schema=ADD_CHORE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_REMOVE_CHORE, async_remove_chore, schema=REMOVE_CHORE_SCHEMA
+        DOMAIN,
+        SERVICE_REMOVE_CHORE,
+        _traced(_when_ready(_idempotent(async_remove_chore))),
+        schema=REMOVE_CHORE_SCHEMA,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_COMPLETE_CHORE, async_complete_chore, schema=COMPLETE_CHORE_SCHEMA
+        DOMAIN,
+        SERVICE_COMPLETE_CHORE,
+        _traced(_when_ready(_idempotent(async_complete_chore))),
+        schema=COMPLETE_CHORE_SCHEMA,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_RESET_CHORE, async_reset_chore, schema=RESET_CHORE_SCHEMA
+        DOMAIN,
+        SERVICE_RESET_CHORE,
+        _traced(_when_ready(_idempotent(async_reset_chore))),
+        schema=RESET_CHORE_SCHEMA,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_UPDATE_CHORE, async_update_chore, schema=UPDATE_CHORE_SCHEMA
+        DOMAIN,
+        SERVICE_UPDATE_CHORE,
+        _traced(_when_ready(_idempotent(async_update_chore))),
+        schema=UPDATE_CHORE_SCHEMA,
     )
     hass.services.async_register(
-        DOMAIN, "list_chores", async_list_chores, schema=LIST_CHORES_SCHEMA
+        DOMAIN,
+        "list_chores",
+        _traced(_when_ready(async_list_chores)),
+        schema=LIST_CHORES_SCHEMA,
     )
     hass.services.async_register(
-        DOMAIN, "check_recurring", async_check_recurring_chores, schema=LIST_CHORES_SCHEMA
+        DOMAIN,
+        "check_recurring",
+        _traced(_when_ready(async_check_recurring_chores)),
+        schema=HOUSEHOLD_SCHEMA,
     )
-
-    # Schedule daily check for overdue chores and recurring chores
-    async_track_time_change(
-        hass, async_check_overdue_chores, hour=0, minute=0, second=0
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_HISTORY,
+        _traced(_when_ready(async_query_history)),
+        schema=QUERY_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_REPORT,
+        _traced(_when_ready(async_get_report)),
+        schema=GET_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CREATE_BACKUP,
+        _traced(_when_ready(async_create_backup)),
+        schema=HOUSEHOLD_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST_BACKUPS,
+        _traced(_when_ready(async_list_backups)),
+        schema=HOUSEHOLD_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_BACKUP,
+        _traced(_when_ready(async_restore_backup)),
+        schema=RESTORE_BACKUP_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FORECAST,
+        _traced(_when_ready(async_get_forecast)),
+        schema=GET_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REBALANCE,
+        _traced(_when_ready(async_rebalance)),
+        schema=REBALANCE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ANALYZE_STORAGE,
+        _traced(_when_ready(async_analyze_storage)),
+        schema=ANALYZE_STORAGE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CHANGES,
+        _traced(_when_ready(async_get_changes)),
+        schema=GET_CHANGES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DIAGNOSTICS,
+        _traced(async_get_diagnostics),
+        schema=HOUSEHOLD_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
     )
 
-    # Forward setup to sensor platform
-    _LOGGER.info("Loading sensor platform")
-    hass.async_create_task(
-        async_load_platform(hass, "sensor", DOMAIN, {}, config)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_TRACE,
+        async_start_trace,
+        schema=TRACE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_TRACE,
+        async_stop_trace,
+        schema=TRACE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    if DOMAIN in config:
+        # The YAML configuration is the default household
+        household = _async_add_household(
+            hass, DEFAULT_HOUSEHOLD, DEFAULT_HOUSEHOLD_NAME, config[DOMAIN] or {}
+        )
+
+        # Forward setup to the entity platforms
+        for platform in PLATFORMS:
+            _LOGGER.info("Loading %s platform", platform)
+            hass.async_create_task(
+                async_load_platform(
+                    hass, platform, DOMAIN, {ATTR_HOUSEHOLD: household.id}, config
+                )
+            )
 
     _LOGGER.info("Chore Assistant component setup complete")
     return True
 
 
-async def async_add_chore(call: ServiceCall) -> None:
-    """Add a new chore."""
-    hass = call.hass
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
-    state_manager: ChoreStateManager = hass.data[DOMAIN]["state_manager"]
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up a household from a config entry."""
+    _async_add_household(hass, entry.entry_id, entry.title, entry.data)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
 
-    name = call.data.get("chore_name")
-    due_date = call.data.get("due_date")
-    interval_days = call.data.get("interval_days", 7)
-    assigned_to = call.data.get("assigned_to")
-    priority = call.data.get("priority", "medium")
-    category = call.data.get("category", "general")
-    estimated_duration = call.data.get("estimated_duration", 30)
 
-    try:
-        # Generate unique chore ID
-        import uuid
-        chore_id = str(uuid.uuid4())[:8]  # Short unique ID
-        
-        # Create new chore
-        from datetime import datetime
-        from .models import ChoreMetadata
-        
-        chore = Chore(
-            id=chore_id,
-            name=name,
-            state="pending",
-            created_date=datetime.now(),
-            due_date=due_date,
-            interval_days=interval_days,
-            assigned_to=assigned_to,
-            metadata=ChoreMetadata(
-                priority=priority,
-                category=category,
-                estimated_duration=estimated_duration
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a household's platforms and close its storage."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    household: Household = hass.data[DOMAIN]["households"].pop(entry.entry_id)
+    await household.async_stop()
+    return True
+
+
+@callback
+def _async_add_household(
+    hass: HomeAssistant, household_id: str, name: str, conf: Dict[str, Any]
+) -> Household:
+    """Create a household and start loading its chores in the background."""
+    household = Household(
+        hass,
+        household_id,
+        name,
+        conf,
+        {
+            COMMAND_COMPLETE: actions.async_apply_complete,
+            COMMAND_RESET: actions.async_apply_reset,
+            COMMAND_UPDATE: actions.async_apply_update,
+        },
+    )
+    hass.data[DOMAIN]["households"][household_id] = household
+    household.async_start()
+    return household
+
+
+async def _async_resolve_household(call: ServiceCall) -> Household:
+    """Return the household a service call targets."""
+    return await actions.async_resolve_household(
+        call.hass.data[DOMAIN]["households"], call.service, call.data
+    )
+
+
+def _idempotent(
+    handler: Callable[[ServiceCall, Household], Awaitable[Any]]
+) -> Callable[[ServiceCall, Household], Awaitable[Any]]:
+    """Return the earlier result for a repeated request instead of running it again.
+
+    Requests are identified by the caller's idempotency key, or without
+    one by the call's context ID and data, so different calls made by one
+    automation run are not mistaken for repeats. Keys are scoped to the
+    household.
+    """
+
+    @functools.wraps(handler)
+    async def async_handle_once(call: ServiceCall, household: Household) -> Any:
+        cache: IdempotencyCache = call.hass.data[DOMAIN]["idempotency"]
+        key = call.data.get(ATTR_IDEMPOTENCY_KEY) or (
+            call.context.id,
+            request_fingerprint(call.data, exclude=ATTR_IDEMPOTENCY_KEY),
+        )
+        return await cache.async_run(
+            (household.id, call.service, key), lambda: handler(call, household)
+        )
+
+    return async_handle_once
+
+
+def _traced(
+    handler: Callable[[ServiceCall], Awaitable[Any]]
+) -> Callable[[ServiceCall], Awaitable[Any]]:
+    """Add each call to the service call trace while one is being recorded."""
+
+    @functools.wraps(handler)
+    async def async_handle_traced(call: ServiceCall) -> Any:
+        tracer: ServiceCallTracer = call.hass.data[DOMAIN]["tracer"]
+        if not tracer.enabled:
+            return await handler(call)
+
+        timestamp = clock.utcnow().timestamp()
+        started = time.perf_counter()
+        try:
+            result = await handler(call)
+        except Exception as err:
+            tracer.async_record(
+                call.service, call.data, timestamp, time.perf_counter() - started, error=err
             )
+            raise
+        # Replays only need the IDs of added chores; query responses can be large
+        tracer.async_record(
+            call.service,
+            call.data,
+            timestamp,
+            time.perf_counter() - started,
+            result=result if call.service == SERVICE_ADD_CHORE else None,
         )
+        return result
 
-        # Add to storage
-        await storage.async_add_chore(chore)
-        _LOGGER.debug("Chore stored successfully: %s", chore_id)
-
-        # Get the sensor platform's async_add_entities callback
-        if "sensor_platform" not in hass.data[DOMAIN]:
-            _LOGGER.warning("Sensor platform not yet loaded, chore will be loaded on next restart")
-            # Fire event anyway so platform can pick it up when loaded
-            hass.bus.async_fire(EVENT_CHORE_ADDED, {
-                "chore_id": chore_id,
-                "name": name,
-                "due_date": due_date.isoformat() if due_date else None,
-                "interval_days": interval_days,
-            })
-            return
+    return async_handle_traced
+
+
+def _when_ready(
+    handler: Callable[[ServiceCall, Household], Awaitable[Any]]
+) -> Callable[[ServiceCall], Awaitable[Any]]:
+    """Resolve the target household, holding calls until its chores are loaded."""
+
+    @functools.wraps(handler)
+    async def async_handle_when_ready(call: ServiceCall) -> Any:
+        household = await _async_resolve_household(call)
+        if not household.storage.ready:
+            _LOGGER.debug("Queuing %s until chores are loaded", call.service)
+            await household.storage.async_wait_ready()
+        return await handler(call, household)
 
-        # Create and register sensor entity
-        from .sensor import ChoreSensor
-        entity = ChoreSensor(hass, chore)
-        
-        # Add entity through the platform's async_add_entities
-        async_add_entities = hass.data[DOMAIN]["sensor_platform"]["async_add_entities"]
-        async_add_entities([entity])
-        
-        # Store entity reference
-        if "entities" not in hass.data[DOMAIN]:
-            hass.data[DOMAIN]["entities"] = {}
-        hass.data[DOMAIN]["entities"][chore_id] = entity
-            
-        # Fire event to notify other components
-        hass.bus.async_fire(EVENT_CHORE_ADDED, {
-            "chore_id": chore_id,
-            "name": name,
-            "due_date": due_date.isoformat() if due_date else None,
-            "interval_days": interval_days,
-        })
-
-        _LOGGER.info("Successfully added chore '%s' with ID: %s", name, chore_id)
+    return async_handle_when_ready
+
+
+async def async_add_chore(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Add a new chore and return its ID."""
+    try:
+        chore = await actions.async_add_chore(household, call.data)
+        return {"chore_id": chore.id}
 
     except Exception as err:
-        _LOGGER.error("Failed to add chore '%s': %s", name, err)
+        _LOGGER.error("Failed to add chore '%s': %s", call.data.get(ATTR_CHORE_NAME), err)
         raise
 
 
-async def async_remove_chore(call: ServiceCall) -> None:
+async def async_remove_chore(call: ServiceCall, household: Household) -> None:
     """Remove a chore."""
-    hass = call.hass
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
-    state_manager: ChoreStateManager = hass.data[DOMAIN]["state_manager"]
-
     chore_id = call.data.get("chore_id")
 
     try:
-        # Get chore
-        chore = await storage.async_get_chore(chore_id)
-        if not chore:
-            _LOGGER.warning("Chore with ID '%s' not found", chore_id)
+        chore_id = actions.resolve_chore_id(household, call.data)
+        if await actions.async_remove_chore(household, chore_id) is None:
             return
 
-        # Remove from storage
-        await storage.async_remove_chore(chore_id)
-
         # Remove entity if it exists
-        entity_registry = async_get_entity_registry(hass)
+        entity_registry = async_get_entity_registry(call.hass)
         entity_id = f"sensor.chore_assistant_{chore_id}"
         if entity_registry.async_get(entity_id):
             entity_registry.async_remove(entity_id)
 
-        # Fire event
-        hass.bus.async_fire(EVENT_CHORE_REMOVED, {
-            "chore_id": chore_id,
-            "name": chore.name,
-        })
-
-        _LOGGER.info("Removed chore: %s", chore.name)
-
     except Exception as err:
-        _LOGGER.error("Failed to remove chore '%s': %s", chore_id, err)
+        _LOGGER.error(
+            "Failed to remove chore '%s': %s", chore_id or call.data.get(ATTR_CHORE_NAME), err
+        )
         raise
 
 
-async def async_complete_chore(call: ServiceCall) -> None:
+async def async_complete_chore(call: ServiceCall, household: Household) -> None:
     """Mark a chore as completed."""
-    hass = call.hass
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
-    state_manager: ChoreStateManager = hass.data[DOMAIN]["state_manager"]
+    command_queue: ChoreCommandQueue = household.command_queue
 
     chore_id = call.data.get("chore_id")
-    completed_by = call.data.get("completed_by")
-    notes = call.data.get("notes")
 
     try:
-        # Get chore
-        chore = await storage.async_get_chore(chore_id)
-        if not chore:
-            _LOGGER.warning("Chore with ID '%s' not found", chore_id)
-            return
+        chore_id = actions.resolve_chore_id(household, call.data)
+        await command_queue.async_submit(COMMAND_COMPLETE, chore_id, dict(call.data))
+
+    except Exception as err:
+        _LOGGER.error(
+            "Failed to complete chore '%s': %s", chore_id or call.data.get(ATTR_CHORE_NAME), err
+        )
+        raise
 
-        # Complete the chore
-        await state_manager.complete_chore(chore_id, completed_by=completed_by, notes=notes)
 
-        # Fire event
-        hass.bus.async_fire(EVENT_CHORE_COMPLETED, {
-            "chore_id": chore_id,
-            "name": chore.name,
-            "completed_by": completed_by,
-            "notes": notes,
-        })
+async def async_reset_chore(call: ServiceCall, household: Household) -> None:
+    """Reset a chore to pending state."""
+    command_queue: ChoreCommandQueue = household.command_queue
 
-        _LOGGER.info("Completed chore: %s", chore.name)
+    chore_id = call.data.get("chore_id")
+
+    try:
+        chore_id = actions.resolve_chore_id(household, call.data)
+        await command_queue.async_submit(COMMAND_RESET, chore_id, dict(call.data))
 
     except Exception as err:
-        _LOGGER.error("Failed to complete chore '%s': %s", chore_id, err)
+        _LOGGER.error(
+            "Failed to reset chore '%s': %s", chore_id or call.data.get(ATTR_CHORE_NAME), err
+        )
         raise
 
 
-async def async_reset_chore(call: ServiceCall) -> None:
-    """Reset a chore to pending state."""
-    hass = call.hass
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
-    state_manager: ChoreStateManager = hass.data[DOMAIN]["state_manager"]
+async def async_update_chore(call: ServiceCall, household: Household) -> None:
+    """Update an existing chore's details."""
+    command_queue: ChoreCommandQueue = household.command_queue
 
     chore_id = call.data.get("chore_id")
-    reason = call.data.get("reason")
 
     try:
-        # Get chore
-        chore = await storage.async_get_chore(chore_id)
-        if not chore:
-            _LOGGER.warning("Chore with ID '%s' not found", chore_id)
-            return
+        await command_queue.async_submit(COMMAND_UPDATE, chore_id, dict(call.data))
 
-        # Reset the chore
-        await state_manager.reset_chore(chore_id, reason=reason)
+    except Exception as err:
+        _LOGGER.error("Failed to update chore '%s': %s", chore_id, err)
+        raise
 
-        # Fire event
-        hass.bus.async_fire(EVENT_CHORE_RESET, {
-            "chore_id": chore_id,
-            "name": chore.name,
-            "reason": reason,
-        })
 
-        _LOGGER.info("Reset chore: %s", chore.name)
+async def async_list_chores(call: ServiceCall, household: Household) -> None:
+    """List all chores."""
+    try:
+        await actions.async_list_chores(household, call.data)
 
     except Exception as err:
-        _LOGGER.error("Failed to reset chore '%s': %s", chore_id, err)
+        _LOGGER.error("Failed to list chores: %s", err)
         raise
 
 
-async def async_update_chore(call: ServiceCall) -> None:
-    """Update an existing chore's details."""
-    hass = call.hass
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
-    state_manager: ChoreStateManager = hass.data[DOMAIN]["state_manager"]
+async def async_query_history(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Return chore history entries within a time range."""
+    try:
+        return await actions.async_query_history(household, call.data)
 
-    chore_id = call.data.get("chore_id")
-    chore_name = call.data.get("chore_name")
-    interval_days = call.data.get("interval_days")
-    due_date = call.data.get("due_date")
-    assigned_to = call.data.get("assigned_to")
-    priority = call.data.get("priority")
-    category = call.data.get("category")
-    estimated_duration = call.data.get("estimated_duration")
+    except Exception as err:
+        _LOGGER.error("Failed to query chore history: %s", err)
+        raise
+
+
+async def async_get_report(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Return completion analytics grouped by assignee or category."""
+    try:
+        return actions.get_report(household, call.data)
+
+    except Exception as err:
+        _LOGGER.error("Failed to build chore report: %s", err)
+        raise
+
+
+async def async_create_backup(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Create a backup of all chores."""
+    storage: ChoreStorage = household.storage
 
     try:
-        # Get chore
-        chore = await storage.async_get_chore(chore_id)
-        if not chore:
-            _LOGGER.warning("Chore with ID '%s' not found", chore_id)
+        backup = await storage.async_create_backup()
+        return {"backup": backup}
+
+    except Exception as err:
+        _LOGGER.error("Failed to create backup: %s", err)
+        raise
+
+
+async def async_list_backups(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Return the backup catalog."""
+    storage: ChoreStorage = household.storage
+
+    try:
+        return {"backups": await storage.async_list_backups()}
+
+    except Exception as err:
+        _LOGGER.error("Failed to list backups: %s", err)
+        raise
+
+
+async def async_restore_backup(call: ServiceCall, household: Household) -> None:
+    """Replace all chores with the contents of a backup file."""
+    storage: ChoreStorage = household.storage
+
+    backup = call.data.get("backup")
+
+    try:
+        if not await storage.async_restore_backup(backup):
+            _LOGGER.error("Backup '%s' was not restored", backup)
             return
 
-        # Update chore fields if provided
-        if chore_name is not None:
-            chore.name = chore_name
-        if interval_days is not None:
-            chore.interval_days = interval_days
-        if due_date is not None:
-            chore.due_date = due_date
-        if assigned_to is not None:
-            chore.assigned_to = assigned_to
-        if priority is not None:
-            chore.metadata.priority = priority
-        if category is not None:
-            chore.metadata.category = category
-        if estimated_duration is not None:
-            chore.metadata.estimated_duration = estimated_duration
-
-        # Update in storage
-        await storage.async_update_chore(chore)
-
-        # Fire event
-        hass.bus.async_fire(EVENT_CHORE_UPDATED, {
-            "chore_id": chore_id,
-            "name": chore.name,
-            "updated_fields": list(call.data.keys()),
-        })
-
-        _LOGGER.info("Updated chore: %s", chore.name)
+        _LOGGER.info("Restored chores from backup: %s", backup)
 
     except Exception as err:
-        _LOGGER.error("Failed to update chore '%s': %s", chore_id, err)
+        _LOGGER.error("Failed to restore backup '%s': %s", backup, err)
         raise
 
 
-async def async_list_chores(call: ServiceCall) -> None:
-    """List all chores."""
+async def async_get_forecast(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Return completion forecasts for one chore or for every chore at risk."""
+    try:
+        return actions.get_forecast(household, call.data)
+
+    except Exception as err:
+        _LOGGER.error("Failed to forecast chores: %s", err)
+        raise
+
+
+async def async_rebalance(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Reassign every chore of a household across its members."""
+    try:
+        return await actions.async_rebalance(household, call.data)
+
+    except Exception as err:
+        _LOGGER.error("Failed to rebalance chores: %s", err)
+        raise
+
+
+async def async_analyze_storage(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Return the serialized size of a household's chores and the largest ones."""
+    try:
+        return actions.analyze_storage(household, call.data)
+
+    except Exception as err:
+        _LOGGER.error("Failed to analyze storage: %s", err)
+        raise
+
+
+async def async_get_changes(call: ServiceCall, household: Household) -> ServiceResponse:
+    """Return the chore deltas committed after a sequence number."""
+    try:
+        return actions.get_changes(household, call.data)
+
+    except Exception as err:
+        _LOGGER.error("Failed to get changes: %s", err)
+        raise
+
+
+async def async_get_diagnostics(call: ServiceCall) -> ServiceResponse:
+    """Return storage statistics, startup timings and queue metrics per household."""
     hass = call.hass
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
+    households: Dict[str, Household] = hass.data[DOMAIN]["households"]
 
     try:
-        chores = await storage.async_get_all_chores()
-        
-        _LOGGER.info("Listing all chores:")
-        for chore in chores:
-            _LOGGER.info("  - %s (%s): %s", chore.name, chore.id, chore.state)
-            _LOGGER.info("    Due: %s, Interval: %s days", 
-                        chore.due_date, chore.interval_days)
-            _LOGGER.info("    History entries: %d", len(chore.history))
-            _LOGGER.info("    Statistics: %s", chore.statistics.to_dict())
+        if ATTR_HOUSEHOLD in call.data:
+            household = await _async_resolve_household(call)
+            households = {household.id: household}
+        return {
+            "households": {
+                household_id: await household.async_get_diagnostics()
+                for household_id, household in households.items()
+            },
+            "idempotency": hass.data[DOMAIN]["idempotency"].metrics,
+            "trace": hass.data[DOMAIN]["tracer"].metrics,
+        }
 
     except Exception as err:
-        _LOGGER.error("Failed to list chores: %s", err)
+        _LOGGER.error("Failed to get diagnostics: %s", err)
         raise
 
 
-async def async_check_recurring_chores(call: ServiceCall) -> None:
-    """Manually check for recurring chores that need to be reset."""
+async def async_start_trace(call: ServiceCall) -> ServiceResponse:
+    """Start recording service calls, beginning with a copy of every household's chores."""
     hass = call.hass
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
-    state_manager: ChoreStateManager = hass.data[DOMAIN]["state_manager"]
+    tracer: ServiceCallTracer = hass.data[DOMAIN]["tracer"]
+    households: Dict[str, Household] = hass.data[DOMAIN]["households"]
 
     try:
-        _LOGGER.info("Manually checking for recurring chores...")
-        
-        # Get all chores
-        chores = await storage.async_get_all_chores()
-        
-        # Check each chore
-        for chore in chores:
-            if chore.state == "completed" and chore.interval_days:
-                # Check if it's time to reset
-                if chore.due_date and chore.due_date <= datetime.now().date():
-                    await state_manager.reset_chore(chore.id, reason="recurring")
-                    _LOGGER.info("Reset recurring chore: %s", chore.name)
+        chores = {}
+        for household_id, household in households.items():
+            await household.storage.async_wait_ready()
+            chores[household_id] = {
+                chore_id: chore.to_dict() for chore_id, chore in household.storage.chores.items()
+            }
+        names = {household_id: household.name for household_id, household in households.items()}
+        return {"path": await tracer.async_start(chores, names)}
 
-        _LOGGER.info("Recurring chore check completed")
+    except Exception as err:
+        _LOGGER.error("Failed to start service call trace: %s", err)
+        raise
+
+
+async def async_stop_trace(call: ServiceCall) -> ServiceResponse:
+    """Stop recording service calls and return the trace file."""
+    hass = call.hass
+    tracer: ServiceCallTracer = hass.data[DOMAIN]["tracer"]
+
+    try:
+        return await tracer.async_stop()
 
     except Exception as err:
-        _LOGGER.error("Failed to check recurring chores: %s", err)
+        _LOGGER.error("Failed to stop service call trace: %s", err)
         raise
 
 
-async def async_check_overdue_chores(time) -> None:
-    """Check for overdue chores and reset recurring chores."""
-    hass = None  # This will be set by the caller
-    
-    # Find the Home Assistant instance
-    # Note: This is called from async_track_time_change, so we need to get hass differently
-    # This is a limitation of the current approach - we'll fix this in the sensor platform
-    
-    _LOGGER.info("Checking for overdue chores...")
-    
-    # This function will be properly implemented in the sensor platform
-    # where we have access to the hass instance
-    pass
+async def async_check_recurring_chores(call: ServiceCall, household: Household) -> None:
+    """Manually check for recurring chores that need to be reset."""
+    state_manager: ChoreStateManager = household.state_manager
+
+    try:
+        _LOGGER.info("Manually checking for recurring chores...")
+        await state_manager.check_recurring_chores()
+        _LOGGER.info("Recurring chore check completed")
+
+    except Exception as err:
+        _LOGGER.error("Failed to check recurring chores: %s", err)
+        raise
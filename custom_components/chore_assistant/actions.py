@@ -0,0 +1,416 @@
+"""Service actions for Chore Assistant integration.
+
+The service handlers in __init__ validate and route calls; the work
+itself is done here, on a household and the call's validated data. This
+module only needs the parts of Home Assistant that the storage does, so
+offline tools such as the trace replay run the same code as the services.
+"""
+import logging
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
+
+from homeassistant.exceptions import HomeAssistantError
+
+from . import clock
+from .models import Chore, ChoreMetadata
+from .const import (
+    SERVICE_ADD_CHORE,
+    ATTR_CHORE_ID,
+    ATTR_CHORE_NAME,
+    ATTR_HOUSEHOLD,
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_LIMIT,
+    ATTR_POLICY,
+    ATTR_SINCE,
+    ERROR_CHORE_NOT_FOUND,
+    ERROR_DUPLICATE_CHORE,
+    NAME_SUGGESTIONS,
+    EVENT_CHORE_ADDED,
+    EVENT_CHORE_REMOVED,
+    EVENT_CHORE_COMPLETED,
+    EVENT_CHORE_RESET,
+    EVENT_CHORE_UPDATED,
+)
+
+if TYPE_CHECKING:
+    from .household import Household
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_resolve_household(
+    households: Mapping[str, "Household"], service: str, data: Mapping[str, Any]
+) -> "Household":
+    """Return the household a service call targets.
+
+    An explicit household may be given by config entry ID or name. Without
+    one, a single household is used as is; with several, the household
+    holding the call's chore, by ID or exact name, is used.
+    """
+    target = data.get(ATTR_HOUSEHOLD)
+    if target is not None:
+        household = households.get(target) or next(
+            (item for item in households.values() if item.name.casefold() == target.casefold()),
+            None,
+        )
+        if household is None:
+            raise HomeAssistantError(f"Unknown household: {target}")
+        return household
+
+    if len(households) == 1:
+        return next(iter(households.values()))
+    if not households:
+        raise HomeAssistantError("No Chore Assistant household is configured")
+
+    chore_id = data.get(ATTR_CHORE_ID)
+    if isinstance(chore_id, list):
+        chore_id = chore_id[0] if chore_id else None
+    if chore_id is not None:
+        for household in households.values():
+            await household.storage.async_wait_ready()
+            if chore_id in household.storage.chores:
+                return household
+        raise HomeAssistantError(f"Chore {chore_id} was not found in any household")
+
+    # add_chore's name is the new chore's, not a target
+    chore_name = data.get(ATTR_CHORE_NAME)
+    if chore_name is not None and service != SERVICE_ADD_CHORE:
+        matches = []
+        for household in households.values():
+            await household.storage.async_wait_ready()
+            if household.storage.find_by_name(chore_name):
+                matches.append(household)
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            raise HomeAssistantError(
+                f"Chores named {chore_name} exist in several households; choose one with household"
+            )
+        similar = sorted(
+            (
+                item
+                for household in households.values()
+                for item in household.storage.search_names(chore_name, NAME_SUGGESTIONS)
+            ),
+            key=lambda item: -item[1],
+        )[:NAME_SUGGESTIONS]
+        message = f"Chore {chore_name} was not found in any household"
+        if similar:
+            message += " (did you mean: " + ", ".join(chore.name for chore, _ in similar) + "?)"
+        raise HomeAssistantError(message)
+
+    raise HomeAssistantError("Several households are configured; choose one with household")
+
+
+def resolve_chore_id(household: "Household", data: Mapping[str, Any]) -> Optional[str]:
+    """Return the ID of the chore a call targets by chore_id or chore_name.
+
+    Names match ignoring case, accents and spacing, but otherwise only
+    exactly: a misspelled name is never taken for a similar chore, since
+    the call may remove or complete it. The error suggests similar names.
+    """
+    chore_id = data.get(ATTR_CHORE_ID)
+    name = data.get(ATTR_CHORE_NAME)
+    if chore_id is not None or name is None:
+        return chore_id
+
+    storage = household.storage
+    matches = storage.find_by_name(name)
+    if len(matches) == 1:
+        return matches[0].id
+    if matches:
+        raise HomeAssistantError(f"Several chores are named {name}; use chore_id")
+
+    similar = storage.search_names(name, NAME_SUGGESTIONS)
+    message = f"{ERROR_CHORE_NOT_FOUND}: {name}"
+    if similar:
+        message += " (did you mean: " + ", ".join(chore.name for chore, _ in similar) + "?)"
+    raise HomeAssistantError(message)
+
+
+async def async_add_chore(
+    household: "Household", data: Mapping[str, Any], chore_id: Optional[str] = None
+) -> Chore:
+    """Add a new chore, with a new short ID unless one is given."""
+    hass = household.hass
+    storage = household.storage
+
+    name = data.get("chore_name")
+    due_date = data.get("due_date")
+    interval_days = data.get("interval_days", 7)
+    assigned_to = data.get("assigned_to")
+
+    if not storage.name_available(name):
+        raise HomeAssistantError(f"{ERROR_DUPLICATE_CHORE}: {name}")
+
+    chore = Chore(
+        id=chore_id or str(uuid.uuid4())[:8],
+        name=name,
+        state="pending",
+        created_date=clock.now(),
+        due_date=due_date,
+        interval_days=interval_days,
+        assigned_to=assigned_to,
+        metadata=ChoreMetadata(
+            priority=data.get("priority", "medium"),
+            category=data.get("category", "general"),
+            estimated_duration=data.get("estimated_duration", 30),
+        )
+    )
+
+    # Balance unassigned chores across the household's members
+    if not assigned_to and household.assigner.enabled:
+        chore.assigned_to = household.assigner.assign(chore)
+
+    # Add to storage
+    await storage.async_add_chore(chore)
+    _LOGGER.debug("Chore stored successfully: %s", chore.id)
+
+    # Add a sensor through the household's sensor platform
+    if household.async_add_entities is None:
+        _LOGGER.warning("Sensor platform not yet loaded, chore will be loaded on next restart")
+    else:
+        from .sensor import ChoreSensor
+        household.async_add_entities(
+            [ChoreSensor(hass, chore, storage, household.forecaster)]
+        )
+
+    # Fire event to notify other components
+    hass.bus.async_fire(EVENT_CHORE_ADDED, {
+        "chore_id": chore.id,
+        "name": name,
+        "due_date": due_date.isoformat() if due_date else None,
+        "interval_days": interval_days,
+    })
+
+    _LOGGER.info("Successfully added chore '%s' with ID: %s", name, chore.id)
+    return chore
+
+
+async def async_remove_chore(household: "Household", chore_id: str) -> Optional[Chore]:
+    """Remove a chore and return it, or None if there was no such chore."""
+    storage = household.storage
+
+    # Get chore
+    chore = await storage.async_get_chore(chore_id)
+    if not chore:
+        _LOGGER.warning("Chore with ID '%s' not found", chore_id)
+        return None
+
+    # Remove from storage
+    await storage.async_remove_chore(chore_id)
+
+    # Fire event
+    household.hass.bus.async_fire(EVENT_CHORE_REMOVED, {
+        "chore_id": chore_id,
+        "name": chore.name,
+    })
+
+    _LOGGER.info("Removed chore: %s", chore.name)
+    return chore
+
+
+async def async_apply_complete(
+    household: "Household", chore_id: str, data: Dict[str, Any]
+) -> None:
+    """Complete a chore from a queued command."""
+    completed_by = data.get("completed_by")
+    notes = data.get("notes")
+
+    # Get chore
+    chore = await household.storage.async_get_chore(chore_id)
+    if not chore:
+        _LOGGER.warning("Chore with ID '%s' not found", chore_id)
+        return
+
+    # Complete the chore
+    await household.state_manager.complete_chore(chore_id, completed_by=completed_by, notes=notes)
+
+    # Fire event
+    household.hass.bus.async_fire(EVENT_CHORE_COMPLETED, {
+        "chore_id": chore_id,
+        "name": chore.name,
+        "completed_by": completed_by,
+        "notes": notes,
+    })
+
+    _LOGGER.info("Completed chore: %s", chore.name)
+
+
+async def async_apply_reset(
+    household: "Household", chore_id: str, data: Dict[str, Any]
+) -> None:
+    """Reset a chore from a queued command."""
+    reason = data.get("reason")
+
+    # Get chore
+    chore = await household.storage.async_get_chore(chore_id)
+    if not chore:
+        _LOGGER.warning("Chore with ID '%s' not found", chore_id)
+        return
+
+    # Reset the chore
+    await household.state_manager.reset_chore(chore_id, reason=reason)
+
+    # Fire event
+    household.hass.bus.async_fire(EVENT_CHORE_RESET, {
+        "chore_id": chore_id,
+        "name": chore.name,
+        "reason": reason,
+    })
+
+    _LOGGER.info("Reset chore: %s", chore.name)
+
+
+async def async_apply_update(
+    household: "Household", chore_id: str, data: Dict[str, Any]
+) -> None:
+    """Update a chore from a queued command; merged commands arrive as one."""
+    storage = household.storage
+
+    chore_name = data.get("chore_name")
+    interval_days = data.get("interval_days")
+    due_date = data.get("due_date")
+    assigned_to = data.get("assigned_to")
+    priority = data.get("priority")
+    category = data.get("category")
+    estimated_duration = data.get("estimated_duration")
+
+    async with storage.chore_lock(chore_id):
+        # Get chore
+        chore = await storage.async_get_chore(chore_id)
+        if not chore:
+            _LOGGER.warning("Chore with ID '%s' not found", chore_id)
+            return
+
+        if chore_name is not None and not storage.name_available(chore_name, chore_id):
+            raise HomeAssistantError(f"{ERROR_DUPLICATE_CHORE}: {chore_name}")
+
+        # Update chore fields if provided
+        if chore_name is not None:
+            chore.name = chore_name
+        if interval_days is not None:
+            chore.interval_days = interval_days
+        if due_date is not None:
+            chore.due_date = due_date
+        if assigned_to is not None:
+            chore.assigned_to = assigned_to
+        if priority is not None:
+            chore.metadata.priority = priority
+        if category is not None:
+            chore.metadata.category = category
+        if estimated_duration is not None:
+            chore.metadata.estimated_duration = estimated_duration
+
+        # Update in storage
+        await storage.async_update_chore(chore)
+
+    # Fire event
+    household.hass.bus.async_fire(EVENT_CHORE_UPDATED, {
+        "chore_id": chore_id,
+        "name": chore.name,
+        "updated_fields": [key for key in data if key != ATTR_IDEMPOTENCY_KEY],
+    })
+
+    _LOGGER.info("Updated chore: %s", chore.name)
+
+
+async def async_list_chores(household: "Household", data: Mapping[str, Any]) -> List[Chore]:
+    """Log and return the chores matching the call's filters."""
+    chores = await household.storage.async_find_chores(
+        state=data.get("state"),
+        assigned_to=data.get("assigned_to"),
+        category=data.get("category"),
+    )
+
+    _LOGGER.info("Listing %d chores:", len(chores))
+    for chore in chores:
+        _LOGGER.info("  - %s (%s): %s", chore.name, chore.id, chore.state)
+        _LOGGER.info("    Due: %s, Interval: %s days",
+                    chore.due_date, chore.interval_days)
+        _LOGGER.info("    History entries: %d", len(chore.history))
+        _LOGGER.info("    Statistics: %s", chore.statistics.to_dict())
+    return chores
+
+
+async def async_query_history(household: "Household", data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return chore history entries within a time range."""
+    return await household.storage.async_query_history(
+        chore_ids=data.get("chore_id"),
+        start=data.get("start"),
+        end=data.get("end"),
+        limit=data["limit"],
+        offset=data["offset"],
+    )
+
+
+def get_report(household: "Household", data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return completion analytics grouped by assignee or category."""
+    return household.analytics.get_report(
+        group_by=data["group_by"],
+        group=data.get("group"),
+        days=data["days"],
+    )
+
+
+def get_forecast(household: "Household", data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return completion forecasts for one chore or for every chore at risk."""
+    forecaster = household.forecaster
+    chore_id = resolve_chore_id(household, data)
+    if chore_id is not None:
+        chores = {chore_id: forecaster.forecast(chore_id)}
+    else:
+        chores = forecaster.at_risk()
+    return {"chores": chores, "assignees": forecaster.assignee_models()}
+
+
+async def async_rebalance(household: "Household", data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Reassign every chore of a household across its members."""
+    storage = household.storage
+    assigner = household.assigner
+    if not assigner.enabled:
+        raise HomeAssistantError(f"Household {household.name} has no members configured")
+
+    plan = assigner.rebalance(list(storage.chores.values()), data.get(ATTR_POLICY))
+    changed = 0
+    async with storage.async_batch():
+        for chore_id, member in plan.items():
+            async with storage.chore_lock(chore_id):
+                chore = await storage.async_get_chore(chore_id)
+                if chore is None or chore.assigned_to == member:
+                    continue
+                chore.assigned_to = member
+                await storage.async_update_chore(chore)
+                changed += 1
+
+    _LOGGER.info("Rebalanced %d chores across %d members", changed, len(assigner.members))
+    return {"reassigned": changed, "assignments": plan, "loads": assigner.loads()}
+
+
+def analyze_storage(household: "Household", data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the serialized size of a household's chores and the largest ones."""
+    return household.footprint.analyze(data[ATTR_LIMIT])
+
+
+def get_changes(household: "Household", data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the chore deltas committed after a sequence number.
+
+    If the sequence number has fallen out of the change feed, every chore
+    is returned instead and resync is true.
+    """
+    storage = household.storage
+    # Read both at once so the resync and the sequence number agree
+    snapshot = storage.snapshot
+    seq = storage.change_seq
+    changes = storage.changes_since(data[ATTR_SINCE])
+    if changes is None:
+        return {
+            "seq": seq,
+            "resync": True,
+            "chores": [chore.to_compact_dict() for chore in snapshot.values()],
+        }
+    return {
+        "seq": seq,
+        "resync": False,
+        "changes": [record.to_dict() for record in changes],
+    }
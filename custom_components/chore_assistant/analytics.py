@@ -0,0 +1,222 @@
+"""Household analytics for Chore Assistant integration."""
+import logging
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from . import clock
+from .models import Chore, history_sort_key
+from .storage import ChoreStorage
+from .const import (
+    STATE_COMPLETED,
+    STATE_OVERDUE,
+    REPORT_GROUP_ASSIGNEE,
+    REPORT_GROUP_CATEGORY,
+    ANALYTICS_CACHE_TTL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+UNASSIGNED = "unassigned"
+
+
+@dataclass
+class ChoreColumns:
+    """Columnar view of a single chore's completions.
+
+    One row per completion, ordered by timestamp: the epoch time of the
+    completion, whether it was on time, and its lateness in days.
+    """
+    chore_id: str
+    assignee: str
+    category: str
+    created: float
+    interval_days: int
+    estimated_duration: int
+    timestamps: array = field(default_factory=lambda: array("d"))
+    on_time: array = field(default_factory=lambda: array("b"))
+    lateness: array = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_chore(cls, chore: Chore) -> "ChoreColumns":
+        """Build the columns from a chore's history in a single scan."""
+        columns = cls(
+            chore_id=chore.id,
+            assignee=chore.assigned_to or UNASSIGNED,
+            category=chore.metadata.category,
+            created=dt_util.as_utc(chore.created_date).timestamp(),
+            interval_days=max(chore.interval_days, 1),
+            estimated_duration=chore.metadata.estimated_duration,
+        )
+
+        overdue_since: Optional[float] = None
+        for entry in chore.history:
+            timestamp = history_sort_key(entry).timestamp()
+            if entry.new_state == STATE_OVERDUE:
+                overdue_since = timestamp
+            elif entry.new_state == STATE_COMPLETED:
+                columns.timestamps.append(timestamp)
+                if entry.previous_state == STATE_OVERDUE and overdue_since is not None:
+                    columns.on_time.append(0)
+                    columns.lateness.append(max(timestamp - overdue_since, 0.0) / 86400)
+                else:
+                    columns.on_time.append(1)
+                    columns.lateness.append(0.0)
+                overdue_since = None
+            elif entry.new_state is not None:
+                overdue_since = None
+
+        return columns
+
+    def group_key(self, group_by: str) -> str:
+        """Return the report group this chore belongs to."""
+        if group_by == REPORT_GROUP_CATEGORY:
+            return self.category
+        return self.assignee
+
+
+@dataclass
+class _CachedReport:
+    """A computed report and the inputs it depends on."""
+    report: Dict[str, Any]
+    group_by: str
+    group: Optional[str]
+    chore_ids: Set[str]
+    expires: float
+
+
+class ChoreAnalytics:
+    """Computes and caches per-assignee and per-category reports.
+
+    Completion history is kept as per-chore columns that are rebuilt only
+    for chores named in a storage mutation delta. Reports are cached per
+    query key and dropped when a delta touches a chore they depend on.
+    """
+
+    def __init__(self, storage: ChoreStorage):
+        """Initialize the analytics engine."""
+        self._storage = storage
+        self._columns: Dict[str, ChoreColumns] = {}
+        self._reports: Dict[Tuple[str, Optional[str], int], _CachedReport] = {}
+        self._unsub = storage.async_add_listener(self._async_handle_changes)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for storage changes."""
+        self._unsub()
+
+    @callback
+    def _async_handle_changes(self, changed: Set[str], removed: Set[str]) -> None:
+        """Invalidate columns and reports affected by a storage commit."""
+        touched = changed | removed
+        for chore_id in touched:
+            self._columns.pop(chore_id, None)
+
+        new_groups: Dict[str, Set[str]] = {
+            REPORT_GROUP_ASSIGNEE: set(),
+            REPORT_GROUP_CATEGORY: set(),
+        }
+        for chore_id in changed:
+            chore = self._storage.snapshot.get(chore_id)
+            if chore is not None:
+                new_groups[REPORT_GROUP_ASSIGNEE].add(chore.assigned_to or UNASSIGNED)
+                new_groups[REPORT_GROUP_CATEGORY].add(chore.metadata.category)
+
+        stale = [
+            key
+            for key, cached in self._reports.items()
+            if cached.chore_ids & touched
+            or (touched and cached.group is None)
+            or cached.group in new_groups[cached.group_by]
+        ]
+        for key in stale:
+            del self._reports[key]
+
+    def _get_columns(self) -> List[ChoreColumns]:
+        """Return up-to-date columns for every chore in the current snapshot."""
+        chores = self._storage.snapshot
+        for chore_id in self._columns.keys() - chores.keys():
+            del self._columns[chore_id]
+        for chore_id, chore in chores.items():
+            if chore_id not in self._columns:
+                self._columns[chore_id] = ChoreColumns.from_chore(chore)
+        return list(self._columns.values())
+
+    def get_report(
+        self,
+        group_by: str = REPORT_GROUP_ASSIGNEE,
+        group: Optional[str] = None,
+        days: int = 30,
+    ) -> Dict[str, Any]:
+        """Return a report over the last `days` days, computing it if not cached."""
+        key = (group_by, group, days)
+        now = time.monotonic()
+        cached = self._reports.get(key)
+        if cached is not None and cached.expires > now:
+            return cached.report
+
+        end = clock.utcnow()
+        start = end - timedelta(days=days)
+        report, chore_ids = self._compute(group_by, group, start, end)
+        self._reports[key] = _CachedReport(
+            report=report,
+            group_by=group_by,
+            group=group,
+            chore_ids=chore_ids,
+            expires=now + ANALYTICS_CACHE_TTL,
+        )
+        return report
+
+    def _compute(
+        self, group_by: str, group: Optional[str], start: datetime, end: datetime
+    ) -> Tuple[Dict[str, Any], Set[str]]:
+        """Aggregate every chore's columns into per-group metrics in one pass."""
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        totals: Dict[str, List[float]] = {}
+        chore_ids: Set[str] = set()
+
+        for columns in self._get_columns():
+            key = columns.group_key(group_by)
+            if group is not None and key != group:
+                continue
+            chore_ids.add(columns.chore_id)
+
+            # completions, expected, on_time, lateness, workload, chores
+            acc = totals.setdefault(key, [0, 0.0, 0, 0.0, 0, 0])
+            lo = bisect_left(columns.timestamps, start_ts)
+            hi = bisect_right(columns.timestamps, end_ts, lo=lo)
+            completions = hi - lo
+            active_days = (end_ts - max(start_ts, columns.created)) / 86400
+
+            acc[0] += completions
+            acc[1] += max(active_days / columns.interval_days, 1.0)
+            acc[2] += sum(columns.on_time[lo:hi])
+            acc[3] += sum(columns.lateness[lo:hi])
+            acc[4] += completions * columns.estimated_duration
+            acc[5] += 1
+
+        groups = {}
+        for key, (completions, expected, on_time, lateness, workload, chores) in totals.items():
+            groups[key] = {
+                "chores": chores,
+                "completions": completions,
+                "completion_rate": round(min(completions / expected, 1.0), 3),
+                "on_time_ratio": round(on_time / completions, 3) if completions else None,
+                "mean_lateness_days": round(lateness / completions, 3) if completions else None,
+                "workload_minutes": workload,
+            }
+
+        report = {
+            "group_by": group_by,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "groups": groups,
+        }
+        return report, chore_ids
@@ -0,0 +1,206 @@
+"""Workload-balancing chore assignment for Chore Assistant integration."""
+import heapq
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from homeassistant.core import callback
+
+from .models import Chore
+from .storage import ChoreStorage
+from .const import (
+    ASSIGNMENT_LEAST_LOADED,
+    ASSIGNMENT_ROTATION,
+    DEFAULT_ASSIGNMENT_WINDOW,
+    PRIORITY_WEIGHTS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def chore_load(chore: Chore, window_days: int) -> float:
+    """Return the minutes of work a chore adds over a rolling window.
+
+    A chore recurs window_days / interval_days times within the window, and
+    each occurrence costs its estimated duration scaled by its priority.
+    """
+    occurrences = window_days / max(chore.interval_days, 1)
+    weight = PRIORITY_WEIGHTS.get(chore.metadata.priority, 1.0)
+    return chore.metadata.estimated_duration * weight * occurrences
+
+
+class AssignmentEngine:
+    """Assigns chores to household members by running load or in rotation.
+
+    Each member's load is the sum of chore_load over the chores assigned to
+    them. Loads are kept up to date from storage deltas, and each policy
+    keeps a heap over the members so a decision costs O(log members):
+    least-loaded pops the member with the lowest load, rotation the member
+    who was assigned a chore longest ago. Heap entries are invalidated
+    lazily when a member's load changes.
+    """
+
+    def __init__(
+        self,
+        storage: ChoreStorage,
+        members: Sequence[str],
+        policy: str = ASSIGNMENT_LEAST_LOADED,
+        window_days: int = DEFAULT_ASSIGNMENT_WINDOW,
+    ):
+        """Initialize the engine."""
+        self._storage = storage
+        self._members = list(dict.fromkeys(member for member in members if member))
+        self._member_index = {member: index for index, member in enumerate(self._members)}
+        self._policy = policy
+        self._window_days = window_days
+        # chore ID -> (assignee, load) as last counted
+        self._contributions: Dict[str, Tuple[str, float]] = {}
+        self._loads: Dict[str, float] = {member: 0.0 for member in self._members}
+        self._dirty: Set[str] = set()
+        self._built = False
+        # least-loaded heap of (load, member index, member), possibly stale
+        self._load_heap: List[Tuple[float, int, str]] = []
+        # rotation heap of (last assignment tick, member index, member)
+        self._rotation_heap: List[Tuple[int, int, str]] = [
+            (0, index, member) for index, member in enumerate(self._members)
+        ]
+        self._tick = 0
+        self._unsub = storage.async_add_listener(self._async_handle_changes)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether any members are configured."""
+        return bool(self._members)
+
+    @property
+    def members(self) -> List[str]:
+        """Return the configured members in rotation order."""
+        return list(self._members)
+
+    @property
+    def policy(self) -> str:
+        """Return the assignment policy."""
+        return self._policy
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for storage changes."""
+        self._unsub()
+
+    @callback
+    def _async_handle_changes(self, changed: Set[str], removed: Set[str]) -> None:
+        """Recount the load of chores touched by a storage commit."""
+        self._dirty |= changed | removed
+
+    def loads(self) -> Dict[str, float]:
+        """Return each assignee's current load in minutes over the window."""
+        self._sync()
+        return {person: round(load, 1) for person, load in self._loads.items()}
+
+    def assign(self, chore: Chore, policy: Optional[str] = None) -> Optional[str]:
+        """Pick a member for a chore and count the chore against them.
+
+        The caller stores the returned member in chore.assigned_to. Returns
+        None when no members are configured.
+        """
+        if not self._members:
+            return None
+        self._sync()
+
+        if (policy or self._policy) == ASSIGNMENT_ROTATION:
+            member = self._pop_rotation()
+        else:
+            member = self._pop_least_loaded()
+        self._set_contribution(chore.id, member, chore_load(chore, self._window_days))
+        return member
+
+    def rebalance(self, chores: Sequence[Chore], policy: Optional[str] = None) -> Dict[str, str]:
+        """Plan a fresh assignment of chores; returns chore ID -> member.
+
+        Loads are recounted from zero and the heaviest chores are placed
+        first, which keeps least-loaded assignment close to even.
+        """
+        if not self._members:
+            return {}
+        self._sync()
+
+        for chore in chores:
+            self._set_contribution(chore.id, None, 0.0)
+        ordered = sorted(
+            chores, key=lambda chore: chore_load(chore, self._window_days), reverse=True
+        )
+        return {chore.id: self.assign(chore, policy) for chore in ordered}
+
+    def _sync(self) -> None:
+        """Apply chores changed since the last decision."""
+        chores = self._storage.chores
+        if not self._built and self._storage.ready:
+            self._built = True
+            self._dirty = set(chores)
+            self._load_heap = [(0.0, index, member) for index, member in enumerate(self._members)]
+
+        dirty, self._dirty = self._dirty, set()
+        for chore_id in dirty:
+            chore = chores.get(chore_id)
+            if chore is None:
+                self._set_contribution(chore_id, None, 0.0)
+            else:
+                self._set_contribution(
+                    chore_id, chore.assigned_to or None, chore_load(chore, self._window_days)
+                )
+
+    def _set_contribution(self, chore_id: str, person: Optional[str], load: float) -> None:
+        """Move a chore's load to person, or drop it when person is None."""
+        previous = self._contributions.pop(chore_id, None)
+        if previous is not None:
+            if previous == (person, load):
+                self._contributions[chore_id] = previous
+                return
+            self._add_load(previous[0], -previous[1])
+        if person is not None:
+            self._contributions[chore_id] = (person, load)
+            self._add_load(person, load)
+
+    def _add_load(self, person: str, delta: float) -> None:
+        """Adjust a person's load and push a fresh heap entry for members."""
+        load = self._loads.get(person, 0.0) + delta
+        index = self._member_index.get(person)
+        if index is None:
+            # Assignees outside the member list are reported but never picked
+            if abs(load) < 1e-9:
+                self._loads.pop(person, None)
+            else:
+                self._loads[person] = load
+            return
+
+        self._loads[person] = load
+        heapq.heappush(self._load_heap, (load, index, person))
+        if len(self._load_heap) > 4 * len(self._members) + 64:
+            self._load_heap = [
+                (self._loads[member], index, member)
+                for index, member in enumerate(self._members)
+            ]
+            heapq.heapify(self._load_heap)
+
+    def _pop_least_loaded(self) -> str:
+        """Return the member with the lowest current load."""
+        while True:
+            load, index, member = self._load_heap[0]
+            if load == self._loads[member]:
+                return member
+            heapq.heappop(self._load_heap)
+
+    def _pop_rotation(self) -> str:
+        """Return the member whose last assignment is oldest."""
+        self._tick += 1
+        _, index, member = self._rotation_heap[0]
+        heapq.heapreplace(self._rotation_heap, (self._tick, index, member))
+        return member
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the engine settings and loads for diagnostics."""
+        return {
+            "members": self.members,
+            "policy": self._policy,
+            "window_days": self._window_days,
+            "loads": self.loads(),
+        }
@@ -0,0 +1,128 @@
+"""Storage backends for Chore Assistant integration."""
+import logging
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .models import Chore
+from .const import STORAGE_KEY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StorageBackend:
+    """Interface between ChoreStorage and the files or database it persists to.
+
+    Backends exchange data in the single-file Store shape:
+    {"chores": {chore_id: chore_dict}, "metadata": {...}}.
+    """
+
+    name = "base"
+
+    @property
+    def needs_full_write(self) -> bool:
+        """Return True if the stored layout must be rewritten after loading."""
+        return False
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load stored data, or None if this backend holds no data."""
+        raise NotImplementedError
+
+    async def async_save(
+        self,
+        chores: Mapping[str, Chore],
+        metadata: Dict[str, Any],
+        dirty: Optional[Set[str]] = None,
+    ) -> int:
+        """Persist chores. `dirty` names the chores changed or removed since
+        the last save; None means everything. Returns the number of units
+        (files, shards or rows) written.
+        """
+        raise NotImplementedError
+
+    async def async_remove(self) -> None:
+        """Remove all persisted data."""
+        raise NotImplementedError
+
+    async def async_close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class JsonStoreBackend(StorageBackend):
+    """Keeps every chore in a single Home Assistant Store file."""
+
+    name = "json"
+
+    def __init__(self, hass: HomeAssistant, key: str = STORAGE_KEY):
+        """Initialize the backend."""
+        self._store = Store(hass, STORAGE_VERSION, key)
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load the Store file."""
+        return await self._store.async_load()
+
+    async def async_save(
+        self,
+        chores: Mapping[str, Chore],
+        metadata: Dict[str, Any],
+        dirty: Optional[Set[str]] = None,
+    ) -> int:
+        """Rewrite the Store file; the format has no partial updates."""
+        await self._store.async_save({
+            "chores": {chore_id: chore.to_dict() for chore_id, chore in chores.items()},
+            "metadata": metadata,
+        })
+        return 1
+
+    async def async_remove(self) -> None:
+        """Remove the Store file."""
+        await self._store.async_remove()
+
+
+async def async_migrate_backend(
+    source: StorageBackend, target: StorageBackend, remove_source: bool = False
+) -> int:
+    """Copy all data from one backend to another; returns the chore count.
+
+    Chores that fail to parse are skipped and logged rather than aborting
+    the migration.
+    """
+    data = await source.async_load()
+    if data is None:
+        return 0
+
+    chores: Dict[str, Chore] = {}
+    for chore_id, chore_data in data.get("chores", {}).items():
+        try:
+            chores[chore_id] = Chore.from_dict(chore_data)
+        except Exception as err:
+            _LOGGER.error("Error migrating chore %s: %s", chore_id, err)
+
+    await target.async_save(chores, data.get("metadata", {}), None)
+    if remove_source:
+        await source.async_remove()
+
+    _LOGGER.info(
+        "Migrated %d chores from %s storage to %s storage",
+        len(chores),
+        source.name,
+        target.name,
+    )
+    return len(chores)
+
+
+def available_backends(
+    hass: HomeAssistant, exclude: StorageBackend, key: str = STORAGE_KEY
+) -> List[StorageBackend]:
+    """Return the other backends that may hold data from a previous layout."""
+    # Imported here because both modules build on StorageBackend
+    from .sharding import ShardedStore
+    from .sqlite_backend import SQLiteBackend
+
+    candidates: List[StorageBackend] = [
+        JsonStoreBackend(hass, key),
+        ShardedStore(hass, 1, key),
+        SQLiteBackend(hass, key=key),
+    ]
+    return [backend for backend in candidates if type(backend) is not type(exclude)]
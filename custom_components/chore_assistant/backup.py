@@ -0,0 +1,457 @@
+"""Backup reading and writing for Chore Assistant integration."""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from . import clock
+from .models import Chore
+from .const import (
+    VALID_STATES,
+    BACKUP_READ_SIZE,
+    BACKUP_FILENAME_PREFIX,
+    BACKUP_EXTENSION,
+    BACKUP_MANIFEST_FILENAME,
+    BACKUP_REFS_FILENAME,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\n\r"
+
+
+class BackupFormatError(ValueError):
+    """Raised when a backup file is malformed."""
+
+
+class StreamingBackupReader:
+    """Incrementally parses a backup file one chore record at a time.
+
+    Backups are a JSON object whose "chores" member maps chore IDs to chore
+    records. Only the record currently being decoded is held as text, so
+    restoring a large backup does not need the whole file, the whole parsed
+    document and the resulting chores in memory at once. All methods do
+    blocking I/O and must run in the executor.
+    """
+
+    def __init__(self, path: str, read_size: int = BACKUP_READ_SIZE):
+        """Initialize the reader."""
+        self._path = path
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._file: Optional[TextIO] = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._in_chores = False
+        self._chores_seen = False
+        self._record_count = 0
+        self.header: Dict[str, Any] = {}
+        self.total_bytes = 0
+        self.bytes_read = 0
+        self.done = False
+
+    def open(self) -> None:
+        """Open the file and read up to the first chore record."""
+        self.total_bytes = os.path.getsize(self._path)
+        self._file = open(self._path, "r", encoding="utf-8")
+        self._skip_whitespace()
+        self._expect("{")
+        self._advance_to_chores()
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read_chores(self, max_count: int) -> List[Chore]:
+        """Parse and validate up to max_count chores.
+
+        Raises BackupFormatError on the first invalid record.
+        """
+        chores: List[Chore] = []
+        while self._in_chores and len(chores) < max_count:
+            self._skip_whitespace()
+            if self._peek() == "}":
+                self._pos += 1
+                self._in_chores = False
+                self._advance_to_chores()
+                break
+            if self._record_count:
+                self._expect(",")
+                self._skip_whitespace()
+            chore_id = self._decode()
+            self._skip_whitespace()
+            self._expect(":")
+            self._skip_whitespace()
+            record = self._decode()
+            chores.append(validate_chore_record(chore_id, record))
+            self._record_count += 1
+        return chores
+
+    def _advance_to_chores(self) -> None:
+        """Read header members until the chores object or the end is reached."""
+        while True:
+            self._skip_whitespace()
+            char = self._peek()
+            if char == "}":
+                self._pos += 1
+                if not self._chores_seen:
+                    raise BackupFormatError("Backup has no chores")
+                self.done = True
+                return
+            if char == ",":
+                self._pos += 1
+                self._skip_whitespace()
+            key = self._decode()
+            self._skip_whitespace()
+            self._expect(":")
+            self._skip_whitespace()
+            if key == "chores":
+                self._expect("{")
+                self._in_chores = True
+                self._chores_seen = True
+                self._record_count = 0
+                return
+            self.header[key] = self._decode()
+
+    def _fill(self) -> bool:
+        """Read more of the file into the buffer; returns False at end of file."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        chunk = self._file.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Backups are written ASCII-only, so characters equal bytes
+        self.bytes_read += len(chunk)
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Return the next character without consuming it."""
+        if self._pos >= len(self._buffer) and not self._fill():
+            raise BackupFormatError("Unexpected end of backup file")
+        return self._buffer[self._pos]
+
+    def _skip_whitespace(self) -> None:
+        """Consume whitespace."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def _expect(self, char: str) -> None:
+        """Consume one expected character."""
+        if self._peek() != char:
+            raise BackupFormatError(f"Expected '{char}' in backup file")
+        self._pos += 1
+
+    def _decode(self) -> Any:
+        """Decode one complete JSON value, reading more input as needed."""
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                if self._fill():
+                    continue
+                raise BackupFormatError(f"Invalid JSON in backup file: {err}") from err
+            # A number at the very end of the buffer may continue in the next read
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def validate_chore_record(chore_id: Any, record: Any) -> Chore:
+    """Build a chore from a backup record, raising BackupFormatError if invalid."""
+    if not isinstance(chore_id, str) or not isinstance(record, dict):
+        raise BackupFormatError(f"Malformed chore record {chore_id!r}")
+    try:
+        chore = Chore.from_dict(record)
+    except Exception as err:
+        raise BackupFormatError(f"Invalid chore {chore_id}: {err}") from err
+    if chore.id != chore_id:
+        raise BackupFormatError(f"Chore {chore_id} has mismatched ID {chore.id}")
+    if chore.state not in VALID_STATES:
+        raise BackupFormatError(f"Chore {chore_id} has invalid state {chore.state}")
+    return chore
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a temporary file and move it into place."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+
+def _read_json(path: str, default: Any) -> Any:
+    """Read a JSON file, returning default if it does not exist."""
+    if not os.path.exists(path):
+        return default
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _as_aware(timestamp: datetime) -> datetime:
+    """Return a timestamp with its time zone; older backups stored naive local time."""
+    return timestamp if timestamp.tzinfo else timestamp.astimezone()
+
+
+def encode_chore_record(record: Dict[str, Any]) -> Tuple[str, bytes]:
+    """Return the content hash and canonical encoding of a chore record."""
+    encoded = json.dumps(record, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest(), encoded
+
+
+def index_checksum(index: Dict[str, str]) -> str:
+    """Return the checksum of a backup index."""
+    return hashlib.sha256(
+        json.dumps(index, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+class BackupCatalog:
+    """Indexed, content-addressed backups in a dedicated directory.
+
+    Layout:
+      manifest.json       one summary entry per backup (timestamp, size,
+                          chore count, checksum)
+      refs.json           reference count of every stored object
+      indexes/<name>.json chore ID -> object hash for one backup
+      objects/<aa>/<hash> one canonical chore record
+
+    Unchanged chores hash to the same object, so they are stored once no
+    matter how many backups include them. Listing, retention and cleanup
+    only read the manifest. All methods do blocking I/O and must run in
+    the executor.
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the catalog."""
+        self._directory = directory
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def directory(self) -> str:
+        """Return the catalog directory."""
+        return self._directory
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self._directory, *parts)
+
+    def object_path(self, digest: str) -> str:
+        return self._path("objects", digest[:2], digest)
+
+    def index_path(self, name: str) -> str:
+        return self._path("indexes", f"{name}{BACKUP_EXTENSION}")
+
+    def _get_manifest(self) -> Dict[str, Any]:
+        """Return the manifest, reading it on first use."""
+        if self._manifest is None:
+            self._manifest = _read_json(
+                self._path(BACKUP_MANIFEST_FILENAME), {"version": 1, "backups": []}
+            )
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        _write_json_atomic(self._path(BACKUP_MANIFEST_FILENAME), self._get_manifest())
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """Return the summary entry of every backup, oldest first."""
+        return list(self._get_manifest()["backups"])
+
+    def get_backup(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the summary entry of a backup."""
+        if name.endswith(BACKUP_EXTENSION):
+            name = name[: -len(BACKUP_EXTENSION)]
+        for entry in self._get_manifest()["backups"]:
+            if entry["name"] == name:
+                return entry
+        return None
+
+    def create_backup(
+        self,
+        records: Dict[str, Dict[str, Any]],
+        storage_version: int,
+        timestamp: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Store a backup of the given chore records and index it."""
+        timestamp = timestamp or clock.now()
+        os.makedirs(self._path("indexes"), exist_ok=True)
+        manifest = self._get_manifest()
+
+        name = f"{BACKUP_FILENAME_PREFIX}_{timestamp.strftime('%Y%m%d_%H%M%S')}"
+        existing = {entry["name"] for entry in manifest["backups"]}
+        suffix = 1
+        base_name = name
+        while name in existing:
+            suffix += 1
+            name = f"{base_name}_{suffix}"
+
+        refs = _read_json(self._path(BACKUP_REFS_FILENAME), {})
+        index: Dict[str, str] = {}
+        size = 0
+        new_objects = 0
+        for chore_id, record in records.items():
+            digest, encoded = encode_chore_record(record)
+            index[chore_id] = digest
+            size += len(encoded)
+            if digest not in refs:
+                object_path = self.object_path(digest)
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                with open(object_path, "wb") as file:
+                    file.write(encoded)
+                new_objects += 1
+            refs[digest] = refs.get(digest, 0) + 1
+
+        checksum = index_checksum(index)
+        entry = {
+            "name": name,
+            "timestamp": timestamp.isoformat(),
+            "size": size,
+            "chore_count": len(index),
+            "checksum": checksum,
+            "storage_version": storage_version,
+        }
+
+        # Objects and refs first, so the manifest never names missing data
+        _write_json_atomic(self.index_path(name), index)
+        _write_json_atomic(self._path(BACKUP_REFS_FILENAME), refs)
+        manifest["backups"].append(entry)
+        self._save_manifest()
+
+        _LOGGER.debug(
+            "Created backup %s with %d chores (%d new objects)", name, len(index), new_objects
+        )
+        return entry
+
+    def remove_backups(self, names: List[str]) -> int:
+        """Remove backups and any objects no other backup references."""
+        manifest = self._get_manifest()
+        names = set(names)
+        removing = [entry for entry in manifest["backups"] if entry["name"] in names]
+        if not removing:
+            return 0
+
+        manifest["backups"] = [
+            entry for entry in manifest["backups"] if entry["name"] not in names
+        ]
+        self._save_manifest()
+
+        refs = _read_json(self._path(BACKUP_REFS_FILENAME), {})
+        for entry in removing:
+            index = _read_json(self.index_path(entry["name"]), {})
+            for digest in index.values():
+                count = refs.get(digest, 0) - 1
+                if count > 0:
+                    refs[digest] = count
+                    continue
+                refs.pop(digest, None)
+                object_path = self.object_path(digest)
+                if os.path.exists(object_path):
+                    os.remove(object_path)
+            if os.path.exists(self.index_path(entry["name"])):
+                os.remove(self.index_path(entry["name"]))
+        _write_json_atomic(self._path(BACKUP_REFS_FILENAME), refs)
+        return len(removing)
+
+    def cleanup(self, cutoff: datetime) -> int:
+        """Remove backups older than cutoff."""
+        expired = [
+            entry["name"]
+            for entry in self._get_manifest()["backups"]
+            if _as_aware(datetime.fromisoformat(entry["timestamp"])) < cutoff
+        ]
+        return self.remove_backups(expired)
+
+    def import_legacy_backups(self, legacy_directory: str) -> int:
+        """Move single-file backups from legacy_directory into the catalog.
+
+        Only runs while the catalog has no manifest yet, so the config
+        directory is scanned at most once.
+        """
+        if os.path.exists(self._path(BACKUP_MANIFEST_FILENAME)):
+            return 0
+        os.makedirs(self._directory, exist_ok=True)
+
+        imported = 0
+        for filename in sorted(os.listdir(legacy_directory)):
+            if not (filename.startswith(BACKUP_FILENAME_PREFIX) and filename.endswith(BACKUP_EXTENSION)):
+                continue
+            path = os.path.join(legacy_directory, filename)
+            try:
+                data = _read_json(path, {})
+                timestamp = datetime.fromisoformat(data["timestamp"])
+                self.create_backup(data["chores"], data.get("version", 1), timestamp)
+                os.remove(path)
+                imported += 1
+            except Exception as err:
+                _LOGGER.error("Error importing backup file %s: %s", filename, err)
+
+        self._save_manifest()
+        return imported
+
+    def open_reader(self, name: str) -> Optional["CatalogBackupReader"]:
+        """Return a reader for a catalog backup, or None if it does not exist."""
+        entry = self.get_backup(name)
+        if entry is None:
+            return None
+        return CatalogBackupReader(self, entry)
+
+
+class CatalogBackupReader:
+    """Reads a catalog backup in chunks; same interface as StreamingBackupReader."""
+
+    def __init__(self, catalog: BackupCatalog, entry: Dict[str, Any]):
+        """Initialize the reader."""
+        self._catalog = catalog
+        self._entry = entry
+        self._items: List[Tuple[str, str]] = []
+        self._pos = 0
+        self.header: Dict[str, Any] = {
+            "timestamp": entry["timestamp"],
+            "version": entry["storage_version"],
+        }
+        self.total_bytes = entry["size"]
+        self.bytes_read = 0
+        self.done = False
+
+    def open(self) -> None:
+        """Load and verify the backup's index."""
+        index = _read_json(self._catalog.index_path(self._entry["name"]), None)
+        if index is None:
+            raise BackupFormatError(f"Backup index {self._entry['name']} is missing")
+        if index_checksum(index) != self._entry["checksum"]:
+            raise BackupFormatError(f"Backup index {self._entry['name']} is corrupt")
+        self._items = list(index.items())
+        self.done = not self._items
+
+    def close(self) -> None:
+        """Release the index."""
+        self._items = []
+
+    def read_chores(self, max_count: int) -> List[Chore]:
+        """Read, verify and validate up to max_count chores."""
+        chores: List[Chore] = []
+        for chore_id, digest in self._items[self._pos : self._pos + max_count]:
+            try:
+                with open(self._catalog.object_path(digest), "rb") as file:
+                    encoded = file.read()
+            except OSError as err:
+                raise BackupFormatError(f"Chore {chore_id} is missing from backup") from err
+            if hashlib.sha256(encoded).hexdigest() != digest:
+                raise BackupFormatError(f"Chore {chore_id} is corrupt in backup")
+            self.bytes_read += len(encoded)
+            chores.append(validate_chore_record(chore_id, json.loads(encoded)))
+        self._pos += len(chores)
+        self.done = self._pos >= len(self._items)
+        return chores
@@ -0,0 +1,105 @@
+"""Calendar platform for the Chore Assistant."""
+import logging
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING, List, Optional
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ATTR_HOUSEHOLD
+from .projection import Occurrence, OccurrenceProjection
+
+if TYPE_CHECKING:
+    from .household import Household
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: Optional[DiscoveryInfoType] = None,
+) -> None:
+    """Set up the Chore Assistant calendar for the YAML household."""
+    if discovery_info is None:
+        return
+    household = hass.data[DOMAIN]["households"][discovery_info[ATTR_HOUSEHOLD]]
+    async_add_entities([ChoreCalendar(household)])
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Chore Assistant calendar for a config entry's household."""
+    household = hass.data[DOMAIN]["households"][entry.entry_id]
+    async_add_entities([ChoreCalendar(household)])
+
+
+class ChoreCalendar(CalendarEntity):
+    """Upcoming chores of a household as all-day events."""
+
+    _attr_icon = "mdi:calendar-check"
+
+    def __init__(self, household: "Household") -> None:
+        """Initialize the calendar."""
+        self._household = household
+        self._projection: OccurrenceProjection = household.projection
+        self._attr_unique_id = f"chore_assistant_calendar_{household.id}"
+        self._attr_name = f"{household.name} chores"
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the next event whenever chores change."""
+        self.async_on_remove(
+            self._household.storage.async_add_listener(self._async_handle_changes)
+        )
+
+    @callback
+    def _async_handle_changes(self, changed, removed) -> None:
+        """Update the entity state after a storage commit."""
+        self.async_write_ha_state()
+
+    @property
+    def event(self) -> Optional[CalendarEvent]:
+        """Return the next upcoming or overdue chore."""
+        occurrence = self._projection.next_occurrence()
+        return self._to_event(occurrence) if occurrence else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> List[CalendarEvent]:
+        """Return chore occurrences between start_date and end_date."""
+        start = dt_util.as_local(start_date).date()
+        end_local = dt_util.as_local(end_date)
+        end = end_local.date()
+        if end_local.time() != time.min:
+            end += timedelta(days=1)
+        events = (
+            self._to_event(occurrence)
+            for occurrence in self._projection.occurrences(start, end)
+        )
+        return [event for event in events if event is not None]
+
+    def _to_event(self, occurrence: Occurrence) -> Optional[CalendarEvent]:
+        """Build an all-day calendar event for an occurrence.
+
+        Returns None if the chore was removed after the occurrence was
+        projected; the projection drops it once the removal is flushed.
+        """
+        chore = self._household.storage.snapshot.get(occurrence.chore_id)
+        if chore is None:
+            return None
+        description = f"Assigned to {chore.assigned_to}" if chore.assigned_to else None
+        return CalendarEvent(
+            start=occurrence.day,
+            end=occurrence.day + timedelta(days=1),
+            summary=chore.name,
+            description=description,
+            uid=f"{chore.id}_{occurrence.day.isoformat()}",
+        )
@@ -0,0 +1,130 @@
+"""Storage change feed for Chore Assistant integration."""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, Deque, Dict, List, Mapping, Optional
+
+from . import clock
+from .const import CHANGE_FEED_SIZE
+from .models import Chore
+from .snapshot import ChoreSnapshot
+
+
+@dataclass
+class ChangeRecord:
+    """The compact delta of one storage commit.
+
+    added holds the compact fields of new chores, changed only the compact
+    fields that differ from the previous commit, and removed the IDs of
+    removed chores. trimmed lists the changed chores whose only change was
+    the size budget dropping old history entries.
+    """
+    seq: int
+    timestamp: str
+    added: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    changed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    trimmed: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dictionary."""
+        return {
+            "seq": self.seq,
+            "timestamp": self.timestamp,
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "trimmed": self.trimmed,
+        }
+
+
+class ChangeFeed:
+    """A bounded in-memory ring of per-commit deltas.
+
+    Sequence numbers are the snapshot versions, so they increase with every
+    commit. Commits that changed no compact field leave no record, so
+    sequence numbers in the ring may have gaps. A consumer keeps the last
+    sequence number it has seen and catches up with changes_since; once it
+    has fallen out of the ring it has to resync from a full snapshot.
+    """
+
+    def __init__(self, size: int = CHANGE_FEED_SIZE):
+        """Initialize an empty feed."""
+        self._records: Deque[ChangeRecord] = deque()
+        self._size = size
+        # Changes at or below the floor are no longer in the ring
+        self._floor = 0
+        self._seq = 0
+
+    @property
+    def seq(self) -> int:
+        """Return the sequence number of the latest commit."""
+        return self._seq
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Return the current sequence number and the ring's extent."""
+        return {"seq": self._seq, "oldest_seq": self._floor, "records": len(self._records)}
+
+    def reset(self, seq: int) -> None:
+        """Drop every record; consumers behind seq must resync."""
+        self._records.clear()
+        self._floor = self._seq = seq
+
+    def record(
+        self,
+        previous: ChoreSnapshot,
+        current: ChoreSnapshot,
+        changes: Mapping[str, Optional[Chore]],
+        trimmed: AbstractSet[str] = frozenset(),
+    ) -> Optional[ChangeRecord]:
+        """Record the delta between two consecutive snapshots.
+
+        changes maps the chore IDs the commit touched to their new frozen
+        chore, or None if it was removed. trimmed holds the IDs that were
+        only trimmed to their size budget.
+        """
+        self._seq = current.version
+        record = ChangeRecord(seq=current.version, timestamp=clock.utcnow().isoformat())
+        for chore_id, chore in changes.items():
+            old = previous.get(chore_id)
+            if chore is None:
+                if old is not None:
+                    record.removed.append(chore_id)
+            elif old is None:
+                record.added[chore_id] = chore.to_compact_dict()
+            else:
+                before = old.to_compact_dict()
+                delta = {
+                    key: value
+                    for key, value in chore.to_compact_dict().items()
+                    if before.get(key) != value
+                }
+                if delta:
+                    record.changed[chore_id] = delta
+                    if chore_id in trimmed:
+                        record.trimmed.append(chore_id)
+
+        if not (record.added or record.changed or record.removed):
+            return None
+        if len(self._records) >= self._size:
+            self._floor = self._records.popleft().seq
+        self._records.append(record)
+        return record
+
+    def changes_since(self, seq: int) -> Optional[List[ChangeRecord]]:
+        """Return the records after seq, oldest first.
+
+        Returns None if seq is older than the ring, or newer than the feed
+        (as after a restart), in which case the consumer must resync.
+        """
+        if seq < self._floor or seq > self._seq:
+            return None
+        if seq == self._seq:
+            return []
+        records = []
+        for record in reversed(self._records):
+            if record.seq <= seq:
+                break
+            records.append(record)
+        records.reverse()
+        return records
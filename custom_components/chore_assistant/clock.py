@@ -0,0 +1,93 @@
+"""Injectable clock for Chore Assistant integration."""
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Union
+
+from homeassistant.util import dt as dt_util
+
+
+class Clock:
+    """Wall-clock time, always timezone-aware."""
+
+    def utcnow(self) -> datetime:
+        """Return the current time in UTC."""
+        return dt_util.utcnow()
+
+    def now(self) -> datetime:
+        """Return the current time in Home Assistant's time zone."""
+        return dt_util.as_local(self.utcnow())
+
+    def today(self) -> date:
+        """Return the current date in Home Assistant's time zone."""
+        return self.now().date()
+
+
+class VirtualClock(Clock):
+    """A clock that only moves when told to, for simulations and tests."""
+
+    def __init__(self, start: datetime):
+        """Initialize the clock at start; a naive start is taken as UTC."""
+        self._now = dt_util.as_utc(start)
+
+    def utcnow(self) -> datetime:
+        """Return the virtual time in UTC."""
+        return self._now
+
+    def advance(self, delta: timedelta) -> datetime:
+        """Move the clock forward and return the new time."""
+        self._now += delta
+        return self._now
+
+    def set(self, moment: datetime) -> None:
+        """Move the clock to a moment."""
+        self._now = dt_util.as_utc(moment)
+
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    """Return the clock every time read goes through."""
+    return _clock
+
+
+def set_clock(clock: Optional[Clock]) -> None:
+    """Replace the clock; None restores wall-clock time."""
+    global _clock
+    _clock = clock or Clock()
+
+
+def utcnow() -> datetime:
+    """Return the current time in UTC."""
+    return _clock.utcnow()
+
+
+def now() -> datetime:
+    """Return the current local time."""
+    return _clock.now()
+
+
+def today() -> date:
+    """Return the current local date."""
+    return _clock.today()
+
+
+def local_day(value: Union[date, datetime]) -> date:
+    """Return the calendar day of a date, or of a datetime in local time.
+
+    Aware datetimes are converted to Home Assistant's time zone first;
+    naive ones are taken as already local.
+    """
+    if isinstance(value, datetime):
+        return dt_util.as_local(value).date() if value.tzinfo else value.date()
+    return value
+
+
+def timestamp(value: Union[date, datetime]) -> float:
+    """Return the POSIX timestamp of a date or datetime, so mixed values order correctly.
+
+    Dates are taken as local midnight and naive datetimes as local time,
+    as in local_day.
+    """
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    return dt_util.as_local(value).timestamp()
@@ -0,0 +1,183 @@
+"""Bounded service command queue for Chore Assistant integration."""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .storage import ChoreStorage
+from .const import (
+    DOMAIN,
+    COMMAND_QUEUE_SIZE,
+    COMMAND_QUEUE_TIMEOUT,
+    COMMAND_BATCH_SIZE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Applies one command: (chore ID, service data) -> result
+CommandHandler = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+class CommandQueueFullError(HomeAssistantError):
+    """Raised when a command is dropped because the queue stayed full."""
+
+
+@dataclass
+class Command:
+    """A queued service call against one chore."""
+    kind: str
+    chore_id: str
+    data: Dict[str, Any]
+    futures: List[asyncio.Future] = field(default_factory=list)
+    result: Any = None
+
+
+class ChoreCommandQueue:
+    """Queues chore service calls and applies them in merged batches.
+
+    Callers wait for their command to be applied. While the queue is full,
+    new commands wait for room and are dropped after COMMAND_QUEUE_TIMEOUT.
+    A command for the same chore and of the same kind as the chore's last
+    queued command is merged into it, later fields winning. Each batch is
+    applied inside one storage batch: commands for different chores run
+    concurrently, commands for one chore in order, and all their mutations
+    are written in a single commit.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        storage: ChoreStorage,
+        handlers: Dict[str, CommandHandler],
+        max_size: int = COMMAND_QUEUE_SIZE,
+    ):
+        """Initialize the command queue."""
+        self._hass = hass
+        self._storage = storage
+        self._handlers = handlers
+        self._max_size = max_size
+        self._pending: List[Command] = []
+        self._last_for_chore: Dict[str, Command] = {}
+        self._space = asyncio.Condition()
+        self._worker: Optional[asyncio.Task] = None
+        self._metrics = {
+            "submitted": 0,
+            "merged": 0,
+            "dropped": 0,
+            "applied": 0,
+            "failed": 0,
+            "batches": 0,
+            "last_batch_size": 0,
+            "max_depth": 0,
+        }
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._pending)
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return queue depth and counters."""
+        return {"depth": self.depth, "max_size": self._max_size, **self._metrics}
+
+    async def async_submit(self, kind: str, chore_id: str, data: Dict[str, Any]) -> Any:
+        """Queue a command and wait for it to be applied."""
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown command: {kind}")
+
+        future = asyncio.get_running_loop().create_future()
+        self._metrics["submitted"] += 1
+
+        last = self._last_for_chore.get(chore_id)
+        if last is not None and last.kind == kind:
+            last.data.update(data)
+            last.futures.append(future)
+            self._metrics["merged"] += 1
+        else:
+            if len(self._pending) >= self._max_size:
+                await self._async_wait_for_space(kind, chore_id)
+            command = Command(kind, chore_id, dict(data), [future])
+            self._pending.append(command)
+            self._last_for_chore[chore_id] = command
+            self._metrics["max_depth"] = max(self._metrics["max_depth"], len(self._pending))
+
+        if self._worker is None:
+            self._worker = self._hass.async_create_background_task(
+                self._async_drain(), f"{DOMAIN} command queue"
+            )
+        return await future
+
+    async def _async_wait_for_space(self, kind: str, chore_id: str) -> None:
+        """Wait for the queue to drop below its limit, or drop the command."""
+        try:
+            async with self._space:
+                await asyncio.wait_for(
+                    self._space.wait_for(lambda: len(self._pending) < self._max_size),
+                    COMMAND_QUEUE_TIMEOUT,
+                )
+        except asyncio.TimeoutError as err:
+            self._metrics["dropped"] += 1
+            _LOGGER.warning("Command queue full, dropped %s for chore %s", kind, chore_id)
+            raise CommandQueueFullError(
+                f"Too many pending chore commands; {kind} for {chore_id} was dropped"
+            ) from err
+
+    async def _async_drain(self) -> None:
+        """Apply queued commands batch by batch until the queue is empty."""
+        try:
+            while self._pending:
+                batch = self._pending[:COMMAND_BATCH_SIZE]
+                del self._pending[:COMMAND_BATCH_SIZE]
+                for command in batch:
+                    if self._last_for_chore.get(command.chore_id) is command:
+                        del self._last_for_chore[command.chore_id]
+                async with self._space:
+                    self._space.notify_all()
+
+                await self._async_apply_batch(batch)
+        finally:
+            self._worker = None
+
+    async def _async_apply_batch(self, batch: List[Command]) -> None:
+        """Apply a batch with one storage commit."""
+        by_chore: Dict[str, List[Command]] = {}
+        for command in batch:
+            by_chore.setdefault(command.chore_id, []).append(command)
+
+        self._metrics["batches"] += 1
+        self._metrics["last_batch_size"] = len(batch)
+        try:
+            async with self._storage.async_batch():
+                await asyncio.gather(
+                    *(self._async_apply_chore(commands) for commands in by_chore.values())
+                )
+        except Exception as err:
+            # The commit failed; nothing in the batch is durable
+            _LOGGER.error("Error committing chore command batch: %s", err)
+            for command in batch:
+                for future in command.futures:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+
+        for command in batch:
+            for future in command.futures:
+                if not future.done():
+                    future.set_result(command.result)
+
+    async def _async_apply_chore(self, commands: List[Command]) -> None:
+        """Apply one chore's commands in order."""
+        for command in commands:
+            try:
+                command.result = await self._handlers[command.kind](
+                    command.chore_id, command.data
+                )
+                self._metrics["applied"] += 1
+            except Exception as err:
+                self._metrics["failed"] += 1
+                for future in command.futures:
+                    future.set_exception(err)
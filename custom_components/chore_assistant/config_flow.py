@@ -0,0 +1,119 @@
+"""Config flow for Chore Assistant integration."""
+import logging
+from typing import Any, Dict, Optional
+
+import voluptuous as vol
+from homeassistant import config_entries
+from homeassistant.data_entry_flow import FlowResult
+from homeassistant.util import slugify
+
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_STORAGE_BACKEND,
+    CONF_STORAGE_SHARDS,
+    CONF_OPERATION_LOG,
+    CONF_DIGEST,
+    CONF_DIGEST_WINDOW,
+    CONF_DUE_SOON_DAYS,
+    CONF_MEMBERS,
+    CONF_ASSIGNMENT_POLICY,
+    CONF_ASSIGNMENT_WINDOW,
+    CONF_TODO_GROUPING,
+    CONF_MAX_CHORE_BYTES,
+    CONF_MAX_HISTORY_ENTRIES,
+    CONF_BUDGET_ACTION,
+    CONF_UNIQUE_NAMES,
+    BUDGET_ACTION_WARN,
+    VALID_BUDGET_ACTIONS,
+    DEFAULT_MAX_CHORE_BYTES,
+    DEFAULT_MAX_HISTORY_ENTRIES,
+    ASSIGNMENT_LEAST_LOADED,
+    VALID_ASSIGNMENT_POLICIES,
+    DEFAULT_ASSIGNMENT_WINDOW,
+    MAX_ASSIGNMENT_WINDOW,
+    REPORT_GROUP_ASSIGNEE,
+    VALID_REPORT_GROUPS,
+    DEFAULT_HOUSEHOLD,
+    DEFAULT_STORAGE_SHARDS,
+    DEFAULT_DIGEST_WINDOW,
+    DEFAULT_DUE_SOON_DAYS,
+    STORAGE_BACKEND_JSON,
+    VALID_STORAGE_BACKENDS,
+    MAX_STORAGE_SHARDS,
+    MAX_DIGEST_WINDOW,
+    MAX_DUE_SOON_DAYS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUSEHOLD_FLOW_SCHEMA = vol.Schema({
+    vol.Required(CONF_NAME): str,
+    vol.Optional(CONF_STORAGE_BACKEND, default=STORAGE_BACKEND_JSON): vol.In(
+        VALID_STORAGE_BACKENDS
+    ),
+    vol.Optional(CONF_STORAGE_SHARDS, default=DEFAULT_STORAGE_SHARDS): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_STORAGE_SHARDS)
+    ),
+    vol.Optional(CONF_OPERATION_LOG, default=False): bool,
+    vol.Optional(CONF_DIGEST, default=False): bool,
+    vol.Optional(CONF_DIGEST_WINDOW, default=DEFAULT_DIGEST_WINDOW): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_DIGEST_WINDOW)
+    ),
+    vol.Optional(CONF_DUE_SOON_DAYS, default=DEFAULT_DUE_SOON_DAYS): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_DUE_SOON_DAYS)
+    ),
+    # Comma-separated member names
+    vol.Optional(CONF_MEMBERS, default=""): str,
+    vol.Optional(CONF_ASSIGNMENT_POLICY, default=ASSIGNMENT_LEAST_LOADED): vol.In(
+        VALID_ASSIGNMENT_POLICIES
+    ),
+    vol.Optional(CONF_ASSIGNMENT_WINDOW, default=DEFAULT_ASSIGNMENT_WINDOW): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_ASSIGNMENT_WINDOW)
+    ),
+    vol.Optional(CONF_TODO_GROUPING, default=REPORT_GROUP_ASSIGNEE): vol.In(
+        VALID_REPORT_GROUPS
+    ),
+    vol.Optional(CONF_MAX_CHORE_BYTES, default=DEFAULT_MAX_CHORE_BYTES): vol.All(
+        vol.Coerce(int), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_MAX_HISTORY_ENTRIES, default=DEFAULT_MAX_HISTORY_ENTRIES): vol.All(
+        vol.Coerce(int), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_BUDGET_ACTION, default=BUDGET_ACTION_WARN): vol.In(
+        VALID_BUDGET_ACTIONS
+    ),
+    vol.Optional(CONF_UNIQUE_NAMES, default=False): bool,
+})
+
+
+class ChoreAssistantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+    """Add a household with its own chores and storage."""
+
+    VERSION = 1
+
+    async def async_step_user(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Ask for the household name and its storage options."""
+        errors: Dict[str, str] = {}
+        if user_input is not None:
+            name = user_input[CONF_NAME].strip()
+            household_id = slugify(name)
+            if not household_id or household_id == DEFAULT_HOUSEHOLD:
+                errors[CONF_NAME] = "invalid_name"
+            else:
+                await self.async_set_unique_id(household_id)
+                self._abort_if_unique_id_configured()
+                _LOGGER.info("Adding household %s", name)
+                data = {key: value for key, value in user_input.items() if key != CONF_NAME}
+                data[CONF_MEMBERS] = [
+                    member.strip()
+                    for member in user_input.get(CONF_MEMBERS, "").split(",")
+                    if member.strip()
+                ]
+                return self.async_create_entry(title=name, data=data)
+
+        return self.async_show_form(
+            step_id="user", data_schema=HOUSEHOLD_FLOW_SCHEMA, errors=errors
+        )
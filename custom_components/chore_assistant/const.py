@@ -5,6 +5,26 @@ DOMAIN = "chore_assistant"
 # Storage configuration
 STORAGE_VERSION = 2
 STORAGE_KEY = f"{DOMAIN}_storage"
+SQLITE_FILENAME = f"{DOMAIN}.db"
+OPLOG_EXTENSION = ".oplog"
+OPLOG_CHECKPOINT_OPS = 200  # logged operations before a checkpoint
+OPLOG_CHECKPOINT_INTERVAL = 300  # seconds
+IDEMPOTENCY_CACHE_SIZE = 512  # recent request keys remembered
+IDEMPOTENCY_TTL = 300  # seconds a request key is remembered
+COMMAND_QUEUE_SIZE = 256  # queued service commands before callers wait
+COMMAND_QUEUE_TIMEOUT = 10  # seconds a caller waits for room before its command is dropped
+COMMAND_BATCH_SIZE = 64  # commands applied per storage commit
+CHORE_LOCK_STRIPES = 64  # per-chore locks, striped by chore ID
+LOAD_BATCH_SIZE = 100  # chores hydrated between event loop yields
+SNAPSHOT_BUCKETS = 64  # snapshot buckets, copied individually when their chores change
+CHANGE_FEED_SIZE = 1024  # commit deltas kept for consumers catching up
+MIGRATION_CHUNK_SIZE = 200  # chores migrated per executor job and checkpoint
+
+# Storage backends
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+
+VALID_STORAGE_BACKENDS = [STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE]
 
 # Chore states
 STATE_PENDING = "pending"
@@ -20,6 +40,27 @@ SERVICE_COMPLETE_CHORE = "complete_chore"
 SERVICE_RESET_CHORE = "reset_chore"
 SERVICE_LIST_CHORES = "list_chores"
 SERVICE_UPDATE_CHORE = "update_chore"
+SERVICE_QUERY_HISTORY = "query_history"
+SERVICE_GET_REPORT = "get_report"
+SERVICE_CREATE_BACKUP = "create_backup"
+SERVICE_LIST_BACKUPS = "list_backups"
+SERVICE_RESTORE_BACKUP = "restore_backup"
+SERVICE_REBALANCE = "rebalance"
+SERVICE_GET_FORECAST = "get_forecast"
+SERVICE_ANALYZE_STORAGE = "analyze_storage"
+SERVICE_GET_CHANGES = "get_changes"
+SERVICE_START_TRACE = "start_trace"
+SERVICE_STOP_TRACE = "stop_trace"
+SERVICE_GET_DIAGNOSTICS = "get_diagnostics"
+
+# WebSocket command types
+WS_TYPE_CHORES = f"{DOMAIN}/chores"
+WS_TYPE_SUBSCRIBE = f"{DOMAIN}/subscribe"
+
+# Queued service commands
+COMMAND_COMPLETE = "complete"
+COMMAND_RESET = "reset"
+COMMAND_UPDATE = "update"
 
 # Service fields
 ATTR_CHORE_ID = "chore_id"
@@ -35,6 +76,25 @@ ATTR_COMPLETED_BY = "completed_by"
 ATTR_TAGS = "tags"
 ATTR_DESCRIPTION = "description"
 ATTR_REASON = "reason"
+ATTR_STATE = "state"
+ATTR_BACKUP = "backup"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_OFFSET = "offset"
+ATTR_GROUP_BY = "group_by"
+ATTR_GROUP = "group"
+ATTR_DAYS = "days"
+ATTR_IDEMPOTENCY_KEY = "idempotency_key"
+ATTR_HOUSEHOLD = "household"
+ATTR_POLICY = "policy"
+ATTR_SINCE = "since"
+
+# Report groupings
+REPORT_GROUP_ASSIGNEE = "assignee"
+REPORT_GROUP_CATEGORY = "category"
+
+VALID_REPORT_GROUPS = [REPORT_GROUP_ASSIGNEE, REPORT_GROUP_CATEGORY]
 
 # Priority levels
 PRIORITY_LOW = "low"
@@ -44,11 +104,30 @@ PRIORITY_CRITICAL = "critical"
 
 VALID_PRIORITIES = [PRIORITY_LOW, PRIORITY_MEDIUM, PRIORITY_HIGH, PRIORITY_CRITICAL]
 
+# Workload multiplier per priority when balancing assignments
+PRIORITY_WEIGHTS = {
+    PRIORITY_LOW: 0.5,
+    PRIORITY_MEDIUM: 1.0,
+    PRIORITY_HIGH: 1.5,
+    PRIORITY_CRITICAL: 2.0,
+}
+
+# Assignment policies
+ASSIGNMENT_LEAST_LOADED = "least_loaded"
+ASSIGNMENT_ROTATION = "rotation"
+
+VALID_ASSIGNMENT_POLICIES = [ASSIGNMENT_LEAST_LOADED, ASSIGNMENT_ROTATION]
+
 # Default values
 DEFAULT_INTERVAL_DAYS = 7
 DEFAULT_PRIORITY = PRIORITY_MEDIUM
 DEFAULT_CATEGORY = "general"
 DEFAULT_ESTIMATED_DURATION = 30
+DEFAULT_HISTORY_LIMIT = 100
+DEFAULT_REPORT_DAYS = 30
+DEFAULT_STORAGE_SHARDS = 0  # single Store file
+DEFAULT_ASSIGNMENT_WINDOW = 28  # days of recurrences counted toward a member's load
+MAX_ASSIGNMENT_WINDOW = 365
 
 # Event names
 EVENT_CHORE_CREATED = f"{DOMAIN}_chore_created"
@@ -56,13 +135,64 @@ EVENT_CHORE_COMPLETED = f"{DOMAIN}_chore_completed"
 EVENT_CHORE_RESET = f"{DOMAIN}_chore_reset"
 EVENT_CHORE_REMOVED = f"{DOMAIN}_chore_removed"
 EVENT_CHORE_OVERDUE = f"{DOMAIN}_chore_overdue"
+EVENT_CHORE_DUE_SOON = f"{DOMAIN}_chore_due_soon"
+EVENT_CHORE_DIGEST = f"{DOMAIN}_digest"
 EVENT_CHORE_UPDATED = f"{DOMAIN}_chore_updated"
 EVENT_CHORE_ADDED = f"{DOMAIN}_chore_added"
+EVENT_RESTORE_PROGRESS = f"{DOMAIN}_restore_progress"
 
 # Configuration
+CONF_STORAGE_BACKEND = "storage_backend"
+CONF_STORAGE_SHARDS = "storage_shards"
+CONF_OPERATION_LOG = "operation_log"
+CONF_NAME = "name"
+CONF_DIGEST = "digest"
+CONF_DIGEST_WINDOW = "digest_window"
+CONF_DUE_SOON_DAYS = "due_soon_days"
+CONF_MEMBERS = "members"
+CONF_ASSIGNMENT_POLICY = "assignment_policy"
+CONF_ASSIGNMENT_WINDOW = "assignment_window"
+CONF_TODO_GROUPING = "todo_grouping"
+CONF_MAX_CHORE_BYTES = "max_chore_bytes"
+CONF_MAX_HISTORY_ENTRIES = "max_history_entries"
+CONF_BUDGET_ACTION = "budget_action"
+CONF_UNIQUE_NAMES = "unique_names"
 CONF_BACKUP_COUNT = 10
 CONF_BACKUP_RETENTION_DAYS = 30
 
+# Household used for the YAML configuration; it keeps the original file names
+DEFAULT_HOUSEHOLD = "default"
+DEFAULT_HOUSEHOLD_NAME = "Home"
+
+# Notifications: overdue and due-soon chores, per chore or per assignee digest
+DEFAULT_DIGEST_WINDOW = 60  # seconds
+MAX_DIGEST_WINDOW = 3600
+DEFAULT_DUE_SOON_DAYS = 1
+MAX_DUE_SOON_DAYS = 30
+
+# Analytics
+ANALYTICS_CACHE_TTL = 300  # seconds
+
+# Forecasting
+FORECAST_ALPHA = 0.3  # weight of the latest completion in the lag averages
+FORECAST_PRIOR_WEIGHT = 3  # completions before a chore's own model outweighs its assignee's
+FORECAST_MISS_PROBABILITY = 0.6  # miss probability at which a chore is flagged
+
+# Calendar
+CALENDAR_HORIZON_DAYS = 90  # days of occurrences kept projected
+
+# Name lookup
+NAME_SUGGESTIONS = 3  # similar names offered when a name does not match
+
+# Storage size budgets; 0 disables a budget
+DEFAULT_MAX_CHORE_BYTES = 0
+DEFAULT_MAX_HISTORY_ENTRIES = 0
+BUDGET_ACTION_WARN = "warn"
+BUDGET_ACTION_TRIM = "trim"
+VALID_BUDGET_ACTIONS = [BUDGET_ACTION_WARN, BUDGET_ACTION_TRIM]
+DEFAULT_ANALYZE_LIMIT = 10
+MAX_ANALYZE_LIMIT = 100
+
 # Error messages
 ERROR_CHORE_NOT_FOUND = "Chore not found"
 ERROR_INVALID_STATE = "Invalid state transition"
@@ -77,7 +207,22 @@ MIN_INTERVAL_DAYS = 1
 MAX_INTERVAL_DAYS = 365
 MIN_ESTIMATED_DURATION = 1
 MAX_ESTIMATED_DURATION = 1440  # 24 hours in minutes
+MAX_HISTORY_LIMIT = 1000
+MAX_REPORT_DAYS = 365
+MAX_STORAGE_SHARDS = 64
 
 # Backup configuration
+BACKUP_DIRECTORY = f"{DOMAIN}_backups"
+BACKUP_MANIFEST_FILENAME = "manifest.json"
+BACKUP_REFS_FILENAME = "refs.json"
 BACKUP_FILENAME_PREFIX = "chore_assistant_backup"
 BACKUP_EXTENSION = ".json"
+BACKUP_READ_SIZE = 65536  # characters per file read while restoring
+BACKUP_RESTORE_CHUNK_SIZE = 200  # chores parsed per executor job
+
+# Service call traces
+TRACE_DIRECTORY = f"{DOMAIN}_traces"
+TRACE_EXTENSION = ".jsonl"
+TRACE_FORMAT_VERSION = 1
+TRACE_FLUSH_INTERVAL = 5  # seconds calls are buffered before they are written
+TRACE_FLUSH_SIZE = 100  # buffered calls that trigger an early write
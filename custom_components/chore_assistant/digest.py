@@ -0,0 +1,114 @@
+"""Overdue and due-soon notifications for Chore Assistant integration."""
+import logging
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .models import Chore
+from .const import (
+    EVENT_CHORE_OVERDUE,
+    EVENT_CHORE_DUE_SOON,
+    EVENT_CHORE_DIGEST,
+    DEFAULT_DIGEST_WINDOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+KIND_OVERDUE = "overdue"
+KIND_DUE_SOON = "due_soon"
+
+PER_CHORE_EVENTS = {
+    KIND_OVERDUE: EVENT_CHORE_OVERDUE,
+    KIND_DUE_SOON: EVENT_CHORE_DUE_SOON,
+}
+
+
+def _digest_entry(chore: Chore) -> Dict[str, Any]:
+    """Return the fields a digest lists for one chore."""
+    due_date = chore.due_date
+    return {
+        "chore_id": chore.id,
+        "name": chore.name,
+        "priority": chore.metadata.priority,
+        "due_date": due_date.isoformat() if isinstance(due_date, (date, datetime)) else due_date,
+    }
+
+
+class ChoreNotifier:
+    """Fires overdue and due-soon events, per chore or as per-assignee digests.
+
+    In digest mode, chores reported within one window are grouped by
+    assigned_to and one event per assignee is fired when the window closes,
+    so a sweep that marks many chores overdue produces one notification per
+    person instead of one per chore.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        household: str,
+        digest: bool = False,
+        window: float = DEFAULT_DIGEST_WINDOW,
+    ):
+        """Initialize the notifier."""
+        self._hass = hass
+        self._household = household
+        self._digest = digest
+        self._window = window
+        # assigned_to -> kind -> chore ID -> digest entry
+        self._pending: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        self._cancel_flush: Optional[Callable[[], None]] = None
+
+    @callback
+    def async_notify(
+        self,
+        overdue: Iterable[Chore] = (),
+        due_soon: Iterable[Chore] = (),
+    ) -> None:
+        """Report chores that went overdue or are due soon."""
+        for kind, chores in ((KIND_OVERDUE, overdue), (KIND_DUE_SOON, due_soon)):
+            for chore in chores:
+                if self._digest:
+                    assignee = self._pending.setdefault(chore.assigned_to or "", {})
+                    assignee.setdefault(kind, {})[chore.id] = _digest_entry(chore)
+                else:
+                    self._hass.bus.async_fire(PER_CHORE_EVENTS[kind], {
+                        "household": self._household,
+                        "assigned_to": chore.assigned_to or None,
+                        **_digest_entry(chore),
+                    })
+
+        if self._pending and self._cancel_flush is None:
+            if self._window:
+                self._cancel_flush = async_call_later(
+                    self._hass, self._window, self._async_flush_window
+                )
+            else:
+                self.async_flush()
+
+    async def _async_flush_window(self, _now: Any) -> None:
+        """Fire the digests once the window closes."""
+        self._cancel_flush = None
+        self.async_flush()
+
+    @callback
+    def async_flush(self) -> None:
+        """Fire one digest event per assignee with everything pending."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+
+        pending, self._pending = self._pending, {}
+        for assigned_to, kinds in pending.items():
+            event_data: Dict[str, Any] = {
+                "household": self._household,
+                "assigned_to": assigned_to or None,
+            }
+            for kind in PER_CHORE_EVENTS:
+                event_data[kind] = list(kinds.get(kind, {}).values())
+            self._hass.bus.async_fire(EVENT_CHORE_DIGEST, event_data)
+
+        if pending:
+            _LOGGER.debug("Fired chore digests for %d assignees", len(pending))
@@ -0,0 +1,227 @@
+"""Storage footprint analysis and size budgets for Chore Assistant integration."""
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Set
+
+from homeassistant.core import HomeAssistant, callback
+
+from .models import Chore
+from .oplog import OP_TRIM
+from .storage import ChoreStorage
+from .const import (
+    BUDGET_ACTION_TRIM,
+    BUDGET_ACTION_WARN,
+    DEFAULT_MAX_CHORE_BYTES,
+    DEFAULT_MAX_HISTORY_ENTRIES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Trimming never drops the most recent history entries
+MIN_TRIMMED_HISTORY = 5
+
+# The key and separator a record spends on its history besides the list itself
+_HISTORY_KEY_BYTES = len(',"history":')
+
+
+def _json_size(value: Any) -> int:
+    """Return the size of a value serialized as compact JSON, in bytes."""
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode())
+
+
+@dataclass
+class ChoreFootprint:
+    """Serialized sizes of one chore."""
+    chore_id: str
+    name: str
+    bytes: int
+    history_entries: int
+    history_bytes: int
+    notes_bytes: int
+    attribute_bytes: int
+
+    @classmethod
+    def from_chore(cls, chore: Chore) -> "ChoreFootprint":
+        """Measure a chore's stored record and sensor attributes.
+
+        Snapshot chores hand out the record they already built for the
+        operation log, and the history is serialized apart from the other
+        fields so no part of the record is encoded twice.
+        """
+        record = chore.to_dict()
+        history_bytes = _json_size(record.pop("history"))
+        return cls(
+            chore_id=chore.id,
+            name=chore.name,
+            bytes=_json_size(record) + _HISTORY_KEY_BYTES + history_bytes,
+            history_entries=len(chore.history),
+            history_bytes=history_bytes,
+            notes_bytes=sum(len(entry.notes.encode()) for entry in chore.history if entry.notes),
+            attribute_bytes=_json_size(chore.to_state_attributes()),
+        )
+
+    @property
+    def largest_part(self) -> str:
+        """Return which part of the chore contributes most to its size."""
+        parts = {
+            "history_notes": self.notes_bytes,
+            "history": self.history_bytes - self.notes_bytes,
+            "fields": self.bytes - self.history_bytes,
+        }
+        return max(parts, key=parts.get)
+
+
+class FootprintAnalyzer:
+    """Keeps per-chore serialized sizes and enforces size budgets.
+
+    Sizes are measured as chores are loaded and then only for the chores
+    named in each storage delta, read from the latest snapshot, so the
+    totals stay current without re-serializing the whole store. A chore over max_chore_bytes or
+    max_history_entries is logged once, or with the trim action has its
+    oldest history entries dropped until it fits.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        storage: ChoreStorage,
+        max_chore_bytes: int = DEFAULT_MAX_CHORE_BYTES,
+        max_history_entries: int = DEFAULT_MAX_HISTORY_ENTRIES,
+        action: str = BUDGET_ACTION_WARN,
+    ):
+        """Initialize the analyzer."""
+        self._hass = hass
+        self._storage = storage
+        self._max_chore_bytes = max_chore_bytes
+        self._max_history_entries = max_history_entries
+        self._action = action
+        self._footprints: Dict[str, ChoreFootprint] = {}
+        self._total_bytes = 0
+        self._over_budget: Set[str] = set()
+        self._trimming: Set[str] = set()
+        self._trimmed_entries = 0
+        self._unsub = storage.async_add_listener(self._async_handle_changes)
+        if not storage.ready:
+            storage.async_add_load_listener(self._async_measure_chores)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for storage changes."""
+        self._unsub()
+
+    @callback
+    def _async_handle_changes(self, changed: Set[str], removed: Set[str]) -> None:
+        """Re-measure chores touched by a storage commit."""
+        snapshot = self._storage.snapshot
+        for chore_id in removed:
+            self._async_forget(chore_id)
+        self._async_measure_chores(
+            snapshot[chore_id] for chore_id in changed if chore_id in snapshot
+        )
+
+    @callback
+    def _async_forget(self, chore_id: str) -> None:
+        """Drop a removed chore's size from the totals."""
+        old = self._footprints.pop(chore_id, None)
+        if old is not None:
+            self._total_bytes -= old.bytes
+        self._over_budget.discard(chore_id)
+
+    @callback
+    def _async_measure_chores(self, chores: Iterable[Chore]) -> None:
+        """Update the sizes of chores and check them against the budgets."""
+        for chore in chores:
+            old = self._footprints.get(chore.id)
+            if old is not None:
+                self._total_bytes -= old.bytes
+            footprint = ChoreFootprint.from_chore(chore)
+            self._footprints[chore.id] = footprint
+            self._total_bytes += footprint.bytes
+            self._check_budget(footprint)
+
+    def _exceeds(self, footprint: ChoreFootprint) -> bool:
+        """Return whether a chore is over either budget."""
+        return (
+            bool(self._max_chore_bytes) and footprint.bytes > self._max_chore_bytes
+        ) or (
+            bool(self._max_history_entries)
+            and footprint.history_entries > self._max_history_entries
+        )
+
+    def _check_budget(self, footprint: ChoreFootprint) -> None:
+        """Warn about or trim a chore over budget."""
+        if not self._exceeds(footprint):
+            self._over_budget.discard(footprint.chore_id)
+            return
+
+        if self._action == BUDGET_ACTION_TRIM:
+            if footprint.chore_id not in self._trimming:
+                self._trimming.add(footprint.chore_id)
+                self._hass.async_create_task(self._async_trim(footprint.chore_id))
+        elif footprint.chore_id not in self._over_budget:
+            _LOGGER.warning(
+                "Chore %s (%s) is over its size budget: %d bytes, %d history entries; "
+                "most of it is %s",
+                footprint.name,
+                footprint.chore_id,
+                footprint.bytes,
+                footprint.history_entries,
+                footprint.largest_part,
+            )
+        self._over_budget.add(footprint.chore_id)
+
+    async def _async_trim(self, chore_id: str) -> None:
+        """Drop a chore's oldest history entries until it fits its budgets."""
+        try:
+            async with self._storage.chore_lock(chore_id):
+                chore = await self._storage.async_get_chore(chore_id)
+                if chore is None:
+                    return
+
+                keep = len(chore.history)
+                if self._max_history_entries:
+                    keep = min(keep, self._max_history_entries)
+                if self._max_chore_bytes:
+                    # Subtract each dropped entry instead of re-serializing the chore
+                    size = _json_size(chore.to_dict())
+                    while keep > MIN_TRIMMED_HISTORY and size > self._max_chore_bytes:
+                        dropped = chore.history[len(chore.history) - keep]
+                        size -= _json_size(dropped.to_dict()) + 1
+                        keep -= 1
+                keep = max(keep, min(MIN_TRIMMED_HISTORY, len(chore.history)))
+
+                trimmed = len(chore.history) - keep
+                if trimmed <= 0:
+                    return
+                del chore.history[:trimmed]
+                await self._storage.async_update_chore(chore, operation=OP_TRIM)
+
+            self._trimmed_entries += trimmed
+            _LOGGER.info("Trimmed %d history entries of chore %s to fit its size budget", trimmed, chore.name)
+        except Exception as err:
+            _LOGGER.error("Error trimming chore %s: %s", chore_id, err)
+        finally:
+            self._trimming.discard(chore_id)
+
+    def analyze(self, limit: int) -> Dict[str, Any]:
+        """Return total sizes and the largest chores."""
+        largest = sorted(self._footprints.values(), key=lambda item: item.bytes, reverse=True)
+        return {
+            "chores": len(self._footprints),
+            "total_bytes": self._total_bytes,
+            "history_entries": sum(item.history_entries for item in self._footprints.values()),
+            "attribute_bytes": sum(item.attribute_bytes for item in self._footprints.values()),
+            "budgets": {
+                "max_chore_bytes": self._max_chore_bytes,
+                "max_history_entries": self._max_history_entries,
+                "action": self._action,
+            },
+            "over_budget": sorted(self._over_budget),
+            "trimmed_entries": self._trimmed_entries,
+            "largest": [
+                {**asdict(item), "largest_part": item.largest_part}
+                for item in largest[:limit]
+            ],
+        }
+
@@ -0,0 +1,285 @@
+"""Completion forecasting for Chore Assistant integration."""
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from . import clock
+from .models import Chore, ChoreHistoryEntry, history_sort_key
+from .storage import ChoreStorage
+from .const import (
+    STATE_COMPLETED,
+    STATE_OVERDUE,
+    STATE_PENDING,
+    FORECAST_ALPHA,
+    FORECAST_PRIOR_WEIGHT,
+    FORECAST_MISS_PROBABILITY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Floor on the lag spread, in days, so a few identical samples are not certain
+MIN_LAG_STD = 0.25
+
+
+@dataclass
+class LagModel:
+    """Exponentially weighted mean and variance of completion lag in days.
+
+    Lag is the time from a chore falling due to its completion; negative
+    lag means it was done early.
+    """
+    mean: float = 0.0
+    variance: float = 0.0
+    samples: int = 0
+
+    def update(self, lag: float, alpha: float) -> None:
+        """Fold in one completion."""
+        if self.samples == 0:
+            self.mean = lag
+        else:
+            delta = lag - self.mean
+            self.mean += alpha * delta
+            self.variance = (1 - alpha) * (self.variance + alpha * delta * delta)
+        self.samples += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "mean_lag_days": round(self.mean, 3),
+            "std_lag_days": round(math.sqrt(self.variance), 3),
+            "samples": self.samples,
+        }
+
+
+@dataclass
+class _Cursor:
+    """Where the forecaster stopped reading a chore's history.
+
+    first and last are the first and last entries read, so a history that
+    was trimmed or replaced is noticed even if its length did not change.
+    """
+    seen: int
+    cycle_start: float
+    overdue_since: Optional[float] = None
+    first: Optional[ChoreHistoryEntry] = None
+    last: Optional[ChoreHistoryEntry] = None
+
+    def continues(self, history: List[ChoreHistoryEntry]) -> bool:
+        """Return whether history still starts with the entries read."""
+        if not self.seen:
+            return True
+        return (
+            len(history) >= self.seen
+            and history[0] is self.first
+            and history[self.seen - 1] is self.last
+        )
+
+
+def _due_timestamp(due_date: Any) -> float:
+    """Return the end of a due day, or a due time, as an epoch timestamp."""
+    if isinstance(due_date, datetime):
+        return dt_util.as_utc(due_date).timestamp()
+    end_of_day = datetime.combine(due_date + timedelta(days=1), time.min)
+    return dt_util.as_utc(end_of_day.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)).timestamp()
+
+
+class CompletionForecaster:
+    """Per-chore and per-assignee models of how late chores get done.
+
+    Each completion updates the chore's model and its assignee's model with
+    the lag from when that cycle fell due: when the chore went overdue, the
+    end of its due date, or interval_days after the cycle started. The
+    assignee is the one recorded on the completion entry, so reassigning a
+    chore does not move its past lags. New history entries are read
+    incrementally from storage deltas. A forecast
+    blends both models, leaning on the assignee until the chore has enough
+    completions of its own.
+
+    Each chore's lags are kept so that when its history is trimmed or
+    replaced, or the chore is removed, the assignee models can be rebuilt
+    without its old completions instead of counting them twice.
+    """
+
+    def __init__(self, storage: ChoreStorage, alpha: float = FORECAST_ALPHA):
+        """Initialize the forecaster."""
+        self._storage = storage
+        self._alpha = alpha
+        self._chores: Dict[str, LagModel] = {}
+        self._assignees: Dict[str, LagModel] = {}
+        # Per chore: (completion timestamp, assignee, lag) of each completion read
+        self._lags: Dict[str, List[Tuple[float, str, float]]] = {}
+        self._assignees_stale = False
+        self._cursors: Dict[str, _Cursor] = {}
+        self._dirty: Set[str] = set()
+        self._built = False
+        self._unsub = storage.async_add_listener(self._async_handle_changes)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for storage changes."""
+        self._unsub()
+
+    @callback
+    def _async_handle_changes(self, changed: Set[str], removed: Set[str]) -> None:
+        """Read new history of chores touched by a storage commit."""
+        self._dirty |= changed | removed
+
+    def _sync(self) -> None:
+        """Fold in completions recorded since the last forecast."""
+        chores = self._storage.chores
+        if not self._built and self._storage.ready:
+            self._built = True
+            self._dirty = set(chores)
+            # Fold every chore's completions into the assignee models in time order
+            self._assignees_stale = True
+
+        dirty, self._dirty = self._dirty, set()
+        for chore_id in dirty:
+            chore = chores.get(chore_id)
+            if chore is None:
+                self._forget(chore_id)
+                continue
+            self._read_history(chore)
+
+        if self._assignees_stale:
+            self._rebuild_assignees()
+
+    def _forget(self, chore_id: str) -> None:
+        """Drop what was read from a chore's history."""
+        self._chores.pop(chore_id, None)
+        self._cursors.pop(chore_id, None)
+        if self._lags.pop(chore_id, None):
+            self._assignees_stale = True
+
+    def _rebuild_assignees(self) -> None:
+        """Refold the assignee models from every chore's completions in time order."""
+        self._assignees = {}
+        samples = sorted(sample for lags in self._lags.values() for sample in lags)
+        for _, assignee, lag in samples:
+            self._assignees.setdefault(assignee, LagModel()).update(lag, self._alpha)
+        self._assignees_stale = False
+
+    def _read_history(self, chore: Chore) -> None:
+        """Update the models from history entries not yet seen."""
+        cursor = self._cursors.get(chore.id)
+        if cursor is not None and not cursor.continues(chore.history):
+            # The history was trimmed or replaced by a restore; read it again
+            self._forget(chore.id)
+            cursor = None
+        if cursor is None:
+            cursor = _Cursor(0, dt_util.as_utc(chore.created_date).timestamp())
+            self._cursors[chore.id] = cursor
+        lags = self._lags.setdefault(chore.id, [])
+
+        # The due date only describes the cycle after the chore's last reset
+        current_cycle = next(
+            (
+                index
+                for index in range(len(chore.history) - 1, -1, -1)
+                if chore.history[index].new_state == STATE_PENDING
+            ),
+            0,
+        )
+        interval = max(chore.interval_days, 1) * 86400
+        for index in range(cursor.seen, len(chore.history)):
+            entry = chore.history[index]
+            timestamp = history_sort_key(entry).timestamp()
+            if entry.new_state == STATE_OVERDUE:
+                cursor.overdue_since = timestamp
+            elif entry.new_state == STATE_COMPLETED:
+                due = cursor.overdue_since
+                if due is None and chore.due_date is not None and index >= current_cycle:
+                    due = _due_timestamp(chore.due_date)
+                if due is None:
+                    due = cursor.cycle_start + interval
+                lag = (timestamp - due) / 86400
+                # Entries written before completions recorded their assignee fall back to the current one
+                assignee = (
+                    entry.assigned_to if entry.assigned_to is not None else chore.assigned_to
+                ) or ""
+                self._chores.setdefault(chore.id, LagModel()).update(lag, self._alpha)
+                lags.append((timestamp, assignee, lag))
+                if not self._assignees_stale:
+                    self._assignees.setdefault(assignee, LagModel()).update(lag, self._alpha)
+                cursor.cycle_start = timestamp
+                cursor.overdue_since = None
+            elif entry.new_state == STATE_PENDING:
+                cursor.cycle_start = timestamp
+                cursor.overdue_since = None
+        cursor.seen = len(chore.history)
+        if chore.history:
+            cursor.first = chore.history[0]
+            cursor.last = chore.history[-1]
+
+    def _blend(self, chore: Chore) -> Optional[LagModel]:
+        """Return the chore's model shrunk toward its assignee's."""
+        own = self._chores.get(chore.id)
+        prior = self._assignees.get(chore.assigned_to or "")
+        if own is None:
+            return prior
+        if prior is None:
+            return own
+        weight = own.samples / (own.samples + FORECAST_PRIOR_WEIGHT)
+        return LagModel(
+            mean=weight * own.mean + (1 - weight) * prior.mean,
+            variance=weight * own.variance + (1 - weight) * prior.variance,
+            samples=own.samples,
+        )
+
+    def forecast(self, chore_id: str) -> Optional[Dict[str, Any]]:
+        """Return the predicted completion time and miss risk of an open chore."""
+        self._sync()
+        chore = self._storage.chores.get(chore_id)
+        if chore is None or chore.state == STATE_COMPLETED:
+            return None
+
+        cursor = self._cursors.get(chore_id)
+        if chore.due_date is not None:
+            due = _due_timestamp(chore.due_date)
+        elif cursor is not None:
+            due = cursor.cycle_start + max(chore.interval_days, 1) * 86400
+        else:
+            return None
+
+        model = self._blend(chore)
+        now = clock.utcnow().timestamp()
+        if model is None:
+            predicted = due
+            probability = 1.0 if chore.state == STATE_OVERDUE else None
+        else:
+            predicted = due + model.mean * 86400
+            std = max(math.sqrt(model.variance), MIN_LAG_STD)
+            # P(lag > 0) under a normal approximation of the lag
+            probability = 0.5 * math.erfc(-model.mean / (std * math.sqrt(2)))
+            if chore.state == STATE_OVERDUE:
+                probability = 1.0
+
+        return {
+            "predicted_completion": dt_util.utc_from_timestamp(max(predicted, now)).isoformat(),
+            "miss_probability": round(probability, 3) if probability is not None else None,
+            "likely_missed": probability is not None and probability >= FORECAST_MISS_PROBABILITY,
+            "samples": model.samples if model else 0,
+        }
+
+    def at_risk(self) -> Dict[str, Dict[str, Any]]:
+        """Return forecasts of open chores that are likely to be missed."""
+        self._sync()
+        forecasts = {}
+        for chore_id in self._storage.chores:
+            forecast = self.forecast(chore_id)
+            if forecast is not None and forecast["likely_missed"]:
+                forecasts[chore_id] = forecast
+        return forecasts
+
+    def assignee_models(self) -> Dict[str, Dict[str, Any]]:
+        """Return each assignee's lag model."""
+        self._sync()
+        return {
+            assignee or "unassigned": model.to_dict()
+            for assignee, model in self._assignees.items()
+        }
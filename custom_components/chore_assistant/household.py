@@ -0,0 +1,175 @@
+"""Household partitioning for Chore Assistant integration."""
+import functools
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+
+from .analytics import ChoreAnalytics
+from .assignment import AssignmentEngine
+from .command_queue import ChoreCommandQueue
+from .digest import ChoreNotifier
+from .footprint import FootprintAnalyzer
+from .forecast import CompletionForecaster
+from .projection import OccurrenceProjection
+from .state_manager import ChoreStateManager
+from .storage import ChoreStorage
+from .const import (
+    DOMAIN,
+    DEFAULT_HOUSEHOLD,
+    CONF_STORAGE_BACKEND,
+    CONF_STORAGE_SHARDS,
+    CONF_OPERATION_LOG,
+    CONF_DIGEST,
+    CONF_DIGEST_WINDOW,
+    CONF_DUE_SOON_DAYS,
+    CONF_MEMBERS,
+    CONF_ASSIGNMENT_POLICY,
+    CONF_ASSIGNMENT_WINDOW,
+    CONF_MAX_CHORE_BYTES,
+    CONF_MAX_HISTORY_ENTRIES,
+    CONF_BUDGET_ACTION,
+    CONF_UNIQUE_NAMES,
+    ASSIGNMENT_LEAST_LOADED,
+    BUDGET_ACTION_WARN,
+    DEFAULT_ASSIGNMENT_WINDOW,
+    DEFAULT_STORAGE_SHARDS,
+    DEFAULT_DIGEST_WINDOW,
+    DEFAULT_DUE_SOON_DAYS,
+    DEFAULT_MAX_CHORE_BYTES,
+    DEFAULT_MAX_HISTORY_ENTRIES,
+    STORAGE_BACKEND_JSON,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Applies a queued command: (household, chore ID, service data) -> result
+HouseholdCommandHandler = Callable[["Household", str, Dict[str, Any]], Awaitable[Any]]
+
+
+class Household:
+    """One household's chores with its own storage, lock, queue and scheduler.
+
+    Households share nothing, so loading, saving and the midnight sweep of
+    one household never wait on another. The YAML-configured household uses
+    the original storage files; each config entry gets files of its own.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        household_id: str,
+        name: str,
+        conf: Dict[str, Any],
+        command_handlers: Dict[str, HouseholdCommandHandler],
+    ):
+        """Initialize the household."""
+        self.hass = hass
+        self.id = household_id
+        self.name = name
+        self.conf = conf
+        self.storage = ChoreStorage(
+            hass,
+            shard_count=conf.get(CONF_STORAGE_SHARDS, DEFAULT_STORAGE_SHARDS),
+            backend=conf.get(CONF_STORAGE_BACKEND, STORAGE_BACKEND_JSON),
+            operation_log=conf.get(CONF_OPERATION_LOG, False),
+            household_id=None if household_id == DEFAULT_HOUSEHOLD else household_id,
+            unique_names=conf.get(CONF_UNIQUE_NAMES, False),
+        )
+        self.assigner = AssignmentEngine(
+            self.storage,
+            conf.get(CONF_MEMBERS, []),
+            policy=conf.get(CONF_ASSIGNMENT_POLICY, ASSIGNMENT_LEAST_LOADED),
+            window_days=conf.get(CONF_ASSIGNMENT_WINDOW, DEFAULT_ASSIGNMENT_WINDOW),
+        )
+        self.state_manager = ChoreStateManager(self.storage, assigner=self.assigner)
+        self.analytics = ChoreAnalytics(self.storage)
+        self.projection = OccurrenceProjection(self.storage)
+        self.forecaster = CompletionForecaster(self.storage)
+        self.footprint = FootprintAnalyzer(
+            hass,
+            self.storage,
+            max_chore_bytes=conf.get(CONF_MAX_CHORE_BYTES, DEFAULT_MAX_CHORE_BYTES),
+            max_history_entries=conf.get(CONF_MAX_HISTORY_ENTRIES, DEFAULT_MAX_HISTORY_ENTRIES),
+            action=conf.get(CONF_BUDGET_ACTION, BUDGET_ACTION_WARN),
+        )
+        self.command_queue = ChoreCommandQueue(
+            hass,
+            self.storage,
+            {
+                kind: functools.partial(handler, self)
+                for kind, handler in command_handlers.items()
+            },
+        )
+        self.notifier = ChoreNotifier(
+            hass,
+            name,
+            digest=conf.get(CONF_DIGEST, False),
+            window=conf.get(CONF_DIGEST_WINDOW, DEFAULT_DIGEST_WINDOW),
+        )
+        self._due_soon_days = conf.get(CONF_DUE_SOON_DAYS, DEFAULT_DUE_SOON_DAYS)
+        self.entities: Set[Any] = set()
+        # Set by the sensor platform once it is set up for this household
+        self.async_add_entities: Optional[Callable[[List[Any]], None]] = None
+        self.startup_timings: Dict[str, float] = {}
+        self._on_stop: List[Callable[[], None]] = [
+            self.assigner.async_shutdown,
+            self.analytics.async_shutdown,
+            self.projection.async_shutdown,
+            self.forecaster.async_shutdown,
+            self.footprint.async_shutdown,
+        ]
+
+    @callback
+    def async_start(self) -> None:
+        """Start loading in the background and schedule the midnight sweep."""
+        started = time.monotonic()
+        self.hass.async_create_background_task(
+            self.storage.async_load(), f"{DOMAIN} {self.id} storage load"
+        )
+        self.async_on_stop(
+            async_track_time_change(
+                self.hass, self.async_midnight_sweep, hour=0, minute=0, second=0
+            )
+        )
+        self.startup_timings["setup"] = round(time.monotonic() - started, 3)
+
+    @callback
+    def async_on_stop(self, unsub: Callable[[], None]) -> None:
+        """Register a callback to run when the household stops."""
+        self._on_stop.append(unsub)
+
+    async def async_stop(self) -> None:
+        """Cancel the sweep and listeners and close the storage."""
+        while self._on_stop:
+            self._on_stop.pop()()
+        self.async_add_entities = None
+        self.notifier.async_flush()
+        await self.storage.async_close()
+
+    async def async_midnight_sweep(self, now: datetime) -> None:
+        """Mark overdue chores, reset recurring ones and notify assignees."""
+        await self.storage.async_wait_ready()
+        _LOGGER.info("Checking chores of household %s", self.name)
+        async with self.storage.async_batch():
+            overdue = await self.state_manager.check_overdue_chores()
+            await self.state_manager.check_recurring_chores()
+        due_soon = await self.state_manager.find_due_soon_chores(self._due_soon_days)
+
+        chores = self.storage.chores
+        self.notifier.async_notify(
+            overdue=[chores[chore_id] for chore_id in overdue if chore_id in chores],
+            due_soon=due_soon,
+        )
+
+    async def async_get_diagnostics(self) -> Dict[str, Any]:
+        """Return this household's storage, startup and queue metrics."""
+        stats = await self.storage.async_get_storage_stats()
+        stats["name"] = self.name
+        stats["startup_timings"] = {**self.startup_timings, **stats["startup_timings"]}
+        stats["command_queue"] = self.command_queue.metrics
+        stats["assignment"] = self.assigner.to_dict()
+        return stats
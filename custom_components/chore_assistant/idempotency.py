@@ -0,0 +1,98 @@
+"""Idempotency key cache for Chore Assistant service calls."""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from .const import IDEMPOTENCY_CACHE_SIZE, IDEMPOTENCY_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def request_fingerprint(data: Mapping[str, Any], exclude: Optional[str] = None) -> str:
+    """Return a stable hash of a call's data, ignoring the exclude field."""
+    payload = json.dumps(
+        {key: value for key, value in data.items() if key != exclude},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class IdempotencyCache:
+    """LRU cache of recent request keys and their results, with a TTL.
+
+    A request whose key is already cached gets the earlier result without
+    running again. Requests still in flight are cached as well, so a
+    duplicate arriving mid-flight waits for the first one. Failed requests
+    are forgotten so they can be retried.
+    """
+
+    def __init__(self, max_size: int = IDEMPOTENCY_CACHE_SIZE, ttl: float = IDEMPOTENCY_TTL):
+        """Initialize the cache."""
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, asyncio.Future]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the cache size and hit counters."""
+        return {"size": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    async def async_run(self, key: Hashable, run: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached result for key, or run the request and cache it."""
+        now = time.monotonic()
+        self._expire(now)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            _LOGGER.debug("Duplicate request %s, returning the earlier result", key)
+            return await asyncio.shield(entry[1])
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = (now + self._ttl, future)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+        try:
+            result = await run()
+        except asyncio.CancelledError:
+            self._forget(key, future)
+            future.cancel()
+            raise
+        except Exception as err:
+            self._forget(key, future)
+            future.set_exception(err)
+            # Mark retrieved so an unawaited failure is not reported twice
+            future.exception()
+            raise
+
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """Remove a failed request so it can be retried."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is future:
+            del self._entries[key]
+
+    def _expire(self, now: float) -> None:
+        """Drop expired entries from the least recently used end.
+
+        Entries behind a recently used one may outlive their TTL until they
+        reach the front, but lookups check the expiry themselves.
+        """
+        while self._entries:
+            key, (expires, _) = next(iter(self._entries.items()))
+            if expires > now:
+                break
+            del self._entries[key]
@@ -0,0 +1,138 @@
+"""Versioned, resumable storage migrations for Chore Assistant integration."""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from homeassistant.core import HomeAssistant
+
+from .models import Chore, history_sort_key
+from .oplog import OperationLog, OP_MIGRATION, OP_UPDATE
+from .const import MIGRATION_CHUNK_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MigrationStep:
+    """Rewrites raw chore records from one schema version to the next."""
+    from_version: int
+    description: str
+    migrate_chore: Callable[[Dict[str, Any]], Dict[str, Any]]
+
+    @property
+    def to_version(self) -> int:
+        """Return the schema version this step produces."""
+        return self.from_version + 1
+
+    def migrate_chunk(self, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Migrate a chunk of raw chore records in the executor.
+
+        Records that fail to migrate are kept unchanged so the error surfaces
+        when that chore is loaded, rather than aborting the whole migration.
+        """
+        migrated = []
+        for chore_data in chunk:
+            try:
+                migrated.append(self.migrate_chore(chore_data))
+            except Exception as err:
+                _LOGGER.error("Error migrating chore %s: %s", chore_data.get("id"), err)
+                migrated.append(chore_data)
+        return migrated
+
+
+def _normalize_chore(chore_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill defaulted fields and order history chronologically."""
+    chore = Chore.from_dict(chore_data)
+    chore.history.sort(key=history_sort_key)
+    return chore.to_dict()
+
+
+# Ordered by from_version; each step's to_version is the next step's from_version
+MIGRATIONS: List[MigrationStep] = [
+    MigrationStep(1, "Normalize chore records and sort history", _normalize_chore),
+]
+
+
+async def async_run_migrations(
+    hass: HomeAssistant,
+    data: Dict[str, Any],
+    oplog: OperationLog,
+    target_version: int,
+    chunk_size: int = MIGRATION_CHUNK_SIZE,
+) -> List[Dict[str, Any]]:
+    """Run pending migration steps on raw data in place; returns step timings.
+
+    Chores are migrated in chunks in the executor. After each chunk the
+    migrated records and the step's position are appended to the operation
+    log, so a restart replays the finished chunks and continues from there
+    instead of starting the step over. The caller persists the result and
+    truncates the log.
+    """
+    metadata = data.setdefault("metadata", {})
+    chores = data.setdefault("chores", {})
+    timings: List[Dict[str, Any]] = []
+
+    for step in MIGRATIONS:
+        version = metadata.get("version", 1)
+        if step.from_version != version or version >= target_version:
+            continue
+
+        progress = metadata.get("migration") or {}
+        position = progress.get("position", 0) if progress.get("version") == version else 0
+        chore_ids = sorted(chores)
+        if position:
+            _LOGGER.info(
+                "Resuming storage migration to version %d at chore %d of %d",
+                step.to_version,
+                position,
+                len(chore_ids),
+            )
+        else:
+            _LOGGER.info(
+                "Migrating storage from version %d to %d: %s",
+                version,
+                step.to_version,
+                step.description,
+            )
+
+        started = time.monotonic()
+        chunks = 0
+        while position < len(chore_ids):
+            chunk_ids = chore_ids[position:position + chunk_size]
+            migrated = await hass.async_add_executor_job(
+                step.migrate_chunk, [chores[chore_id] for chore_id in chunk_ids]
+            )
+            position += len(chunk_ids)
+            chunks += 1
+
+            records = []
+            for chore_id, chore_data in zip(chunk_ids, migrated):
+                chores[chore_id] = chore_data
+                records.append({"op": OP_UPDATE, "id": chore_id, "chore": chore_data})
+            records.append({"op": OP_MIGRATION, "version": version, "position": position})
+            await oplog.async_append(records)
+
+        metadata["version"] = step.to_version
+        metadata.pop("migration", None)
+        duration = time.monotonic() - started
+        timings.append({
+            "from_version": version,
+            "to_version": step.to_version,
+            "description": step.description,
+            "chores": len(chore_ids),
+            "chunks": chunks,
+            "duration": round(duration, 3),
+        })
+        _LOGGER.info(
+            "Migrated %d chores to storage version %d in %.2fs",
+            len(chore_ids),
+            step.to_version,
+            duration,
+        )
+
+    if metadata.get("version", 1) < target_version:
+        # No registered steps cover the remaining versions
+        metadata["version"] = target_version
+
+    return timings
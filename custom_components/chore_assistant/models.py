@@ -1,11 +1,14 @@
 """Data models and validation schemas for Chore Assistant."""
 
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from dataclasses import FrozenInstanceError, dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import voluptuous as vol
 from homeassistant.util import dt as dt_util
 
+from . import clock
+
 # Validation schemas
 CHORE_ID_SCHEMA = vol.Schema({
     vol.Required("id"): str,
@@ -62,24 +65,33 @@ CHORE_UPDATE_SCHEMA = vol.Schema({
     vol.Optional("estimated_duration"): vol.All(int, vol.Range(min=1, max=480)),
 })
 
-@dataclass
+@dataclass(frozen=True)
 class ChoreHistoryEntry:
-    """Represents a single entry in chore history."""
+    """Represents a single entry in chore history.
+    
+    Entries are immutable, so snapshots share them with the live chore.
+    """
     timestamp: datetime
     action: str  # "created", "completed", "reset", "overdue", "updated"
     previous_state: Optional[str] = None
     new_state: Optional[str] = None
     notes: Optional[str] = None
+    # Who the chore was assigned to when it was completed; None on other entries
+    assigned_to: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return {
+        data = {
             "timestamp": self.timestamp.isoformat(),
             "action": self.action,
             "previous_state": self.previous_state,
             "new_state": self.new_state,
             "notes": self.notes,
         }
+        # Only completions carry an assignee; leave the key out of every other entry
+        if self.assigned_to is not None:
+            data["assigned_to"] = self.assigned_to
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChoreHistoryEntry":
@@ -90,8 +102,17 @@ class ChoreHistoryEntry:
             previous_state=data.get("previous_state"),
             new_state=data.get("new_state"),
             notes=data.get("notes"),
+            assigned_to=data.get("assigned_to"),
         )
 
+def history_sort_key(entry: ChoreHistoryEntry) -> datetime:
+    """Return a comparable timestamp for a history entry.
+    
+    Older entries were written with naive local timestamps, newer ones with
+    aware UTC timestamps; normalising both lets them be ordered together.
+    """
+    return dt_util.as_utc(entry.timestamp)
+
 @dataclass
 class ChoreStatistics:
     """Statistics for a chore."""
@@ -196,22 +217,106 @@ class Chore:
             statistics=ChoreStatistics.from_dict(data.get("statistics", {})),
         )
     
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """Return the chore's flat, JSON-friendly fields without its history."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "interval_days": self.interval_days,
+            "assigned_to": self.assigned_to,
+            "priority": self.metadata.priority,
+            "category": self.metadata.category,
+            "estimated_duration": self.metadata.estimated_duration,
+            "history_count": len(self.history),
+            "total_completions": self.statistics.total_completions,
+            "last_completed": self.statistics.last_completed.isoformat() if self.statistics.last_completed else None,
+            "completion_streak": self.statistics.completion_streak,
+        }
+    
+    def freeze(self) -> "FrozenChore":
+        """Return a read-only copy for snapshots; history entries are shared."""
+        return _frozen_copy(
+            FrozenChore,
+            self,
+            metadata=_frozen_copy(FrozenChoreMetadata, self.metadata),
+            statistics=_frozen_copy(FrozenChoreStatistics, self.statistics),
+            history=tuple(self.history),
+        )
+    
     def add_history_entry(self, action: str, previous_state: Optional[str] = None, 
-                         new_state: Optional[str] = None, notes: Optional[str] = None) -> None:
+                         new_state: Optional[str] = None, notes: Optional[str] = None,
+                         assigned_to: Optional[str] = None) -> None:
         """Add a history entry."""
         entry = ChoreHistoryEntry(
-            timestamp=dt_util.utcnow(),
+            timestamp=clock.utcnow(),
             action=action,
             previous_state=previous_state,
             new_state=new_state,
             notes=notes,
+            assigned_to=assigned_to,
         )
         self.history.append(entry)
     
+    def to_state_attributes(self) -> Dict[str, Any]:
+        """Return the attributes shown on the chore's sensor."""
+        attrs = {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "created_date": self.created_date.isoformat() if self.created_date else None,
+            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "interval_days": self.interval_days,
+            "assigned_to": self.assigned_to,
+            "priority": self.metadata.priority,
+            "category": self.metadata.category,
+            "estimated_duration": self.metadata.estimated_duration,
+            "history_count": len(self.history),
+            "statistics": {
+                "total_completions": self.statistics.total_completions,
+                "last_completed": self.statistics.last_completed.isoformat() if self.statistics.last_completed else None,
+                "average_completion_time": self.statistics.average_completion_time,
+                "completion_streak": self.statistics.completion_streak,
+            }
+        }
+        
+        # Add recent history
+        if self.history:
+            recent_history = self.history[-5:]  # Last 5 entries
+            attrs["recent_history"] = [
+                {
+                    "timestamp": entry.timestamp.isoformat(),
+                    "action": entry.action,
+                    "previous_state": entry.previous_state,
+                    "new_state": entry.new_state,
+                    "notes": entry.notes,
+                }
+                for entry in recent_history
+            ]
+        
+        return attrs
+    
+    def get_history_bounds(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """Return the [lo, hi) index range of history entries within start..end.
+        
+        History is append-only and therefore ordered by timestamp, so both
+        bounds are found by binary search instead of a linear scan.
+        """
+        lo = 0
+        hi = len(self.history)
+        if start is not None:
+            lo = bisect_left(self.history, dt_util.as_utc(start), key=history_sort_key)
+        if end is not None:
+            hi = bisect_right(self.history, dt_util.as_utc(end), lo=lo, key=history_sort_key)
+        return lo, hi
+    
     def update_statistics_on_completion(self) -> None:
         """Update statistics when chore is completed."""
         self.statistics.total_completions += 1
-        self.statistics.last_completed = dt_util.utcnow()
+        self.statistics.last_completed = clock.utcnow()
         
         # Calculate average completion time
         if len(self.history) >= 2:
@@ -230,7 +335,7 @@ class Chore:
         
         # Update completion streak
         if self.statistics.last_completed:
-            days_since_last = (dt_util.utcnow() - self.statistics.last_completed).total_seconds() / 86400
+            days_since_last = (clock.utcnow() - self.statistics.last_completed).total_seconds() / 86400
             if days_since_last <= self.interval_days + 1:
                 self.statistics.completion_streak += 1
             else:
@@ -244,7 +349,9 @@ class Chore:
         if not self.due_date:
             return False
         
-        return dt_util.utcnow() > self.due_date
+        if isinstance(self.due_date, datetime):
+            return clock.utcnow() > dt_util.as_utc(self.due_date)
+        return clock.today() > self.due_date
     
     def get_next_due_date(self) -> Optional[datetime]:
         """Calculate next due date for recurring chores."""
@@ -264,4 +371,53 @@ class Chore:
             "overdue": ["completed", "pending"],
         }
         
-        return new_state in valid_transitions.get(self.state, [])
\ No newline at end of file
+        return new_state in valid_transitions.get(self.state, [])
+
+
+class _ReadOnly:
+    """Mixin that rejects attribute assignment on snapshot copies."""
+    
+    __slots__ = ()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}' of a snapshot copy")
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}' of a snapshot copy")
+
+
+def _frozen_copy(cls: type, source: Any, **overrides: Any) -> Any:
+    """Return a read-only instance of cls with source's fields."""
+    copy = object.__new__(cls)
+    copy.__dict__.update(vars(source), **overrides)
+    return copy
+
+
+class FrozenChoreMetadata(_ReadOnly, ChoreMetadata):
+    """Read-only chore metadata held by snapshots."""
+
+
+class FrozenChoreStatistics(_ReadOnly, ChoreStatistics):
+    """Read-only chore statistics held by snapshots."""
+
+
+class FrozenChore(_ReadOnly, Chore):
+    """Read-only copy of a chore held by snapshots; history is a tuple."""
+    
+    def freeze(self) -> "FrozenChore":
+        """Return the chore itself; it is already read-only."""
+        return self
+    
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """Return the compact fields, computed once per snapshot copy."""
+        compact = self.__dict__.get("_compact")
+        if compact is None:
+            compact = self.__dict__["_compact"] = super().to_compact_dict()
+        return dict(compact)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stored record, built once per snapshot copy."""
+        record = self.__dict__.get("_record")
+        if record is None:
+            record = self.__dict__["_record"] = super().to_dict()
+        return dict(record)
@@ -0,0 +1,92 @@
+"""Normalized chore name index for Chore Assistant integration."""
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Return the form of a chore name used for matching.
+
+    Accents are stripped, case is folded and runs of whitespace collapse to
+    one space, so "Vacuum  Living-Room" and "vacuum living-room" match.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WHITESPACE.sub(" ", stripped.casefold()).strip()
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Return the trigrams of a normalized name, padded to weigh word starts."""
+    padded = f"  {key} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class ChoreNameIndex:
+    """Maps normalized chore names to chore IDs.
+
+    Exact lookups are one dictionary probe. Fuzzy lookups use an inverted
+    index of name trigrams: only names sharing a trigram with the query are
+    scored, by the Jaccard similarity of their trigram sets.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._ids: Dict[str, Set[str]] = {}
+        self._key_of: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+
+    def clear(self) -> None:
+        """Drop every name."""
+        self._ids.clear()
+        self._key_of.clear()
+        self._postings.clear()
+
+    def add(self, chore_id: str, name: str) -> None:
+        """Index a chore under its name, replacing any earlier name."""
+        key = normalize_name(name)
+        if self._key_of.get(chore_id) == key:
+            return
+        self.discard(chore_id)
+        self._key_of[chore_id] = key
+        ids = self._ids.setdefault(key, set())
+        if not ids:
+            for trigram in _trigrams(key):
+                self._postings.setdefault(trigram, set()).add(key)
+        ids.add(chore_id)
+
+    def discard(self, chore_id: str) -> None:
+        """Remove a chore from the index."""
+        key = self._key_of.pop(chore_id, None)
+        if key is None:
+            return
+        ids = self._ids[key]
+        ids.discard(chore_id)
+        if ids:
+            return
+        del self._ids[key]
+        for trigram in _trigrams(key):
+            keys = self._postings[trigram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[trigram]
+
+    def lookup(self, name: str) -> Set[str]:
+        """Return the IDs of chores whose name matches exactly once normalized."""
+        return set(self._ids.get(normalize_name(name), ()))
+
+    def search(self, name: str, limit: int) -> List[Tuple[str, float]]:
+        """Return up to limit (chore ID, similarity) pairs, best first."""
+        query = _trigrams(normalize_name(name))
+        shared: Counter = Counter()
+        for trigram in query:
+            shared.update(self._postings.get(trigram, ()))
+
+        scored = []
+        for key, count in shared.items():
+            similarity = count / (len(query) + len(_trigrams(key)) - count)
+            scored.extend((chore_id, similarity) for chore_id in self._ids[key])
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return [(chore_id, round(similarity, 3)) for chore_id, similarity in scored[:limit]]
@@ -0,0 +1,110 @@
+"""Write-ahead operation log for Chore Assistant integration."""
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+
+from .const import STORAGE_KEY, OPLOG_EXTENSION
+
+_LOGGER = logging.getLogger(__name__)
+
+OP_ADD = "add"
+OP_UPDATE = "update"
+OP_TRANSITION = "transition"
+OP_REMOVE = "remove"
+OP_TRIM = "trim"
+OP_MIGRATION = "migration"
+
+
+class OperationLog:
+    """Append-only log of chore mutations, folded into the store at checkpoints.
+
+    Each mutation is appended as one JSON line and fsync'd, so its write cost
+    is proportional to the chores it touched rather than the whole store.
+    Records carry a sequence number; the store records the last sequence it
+    contains at each checkpoint, and replay skips anything at or below it.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: Optional[str] = None, key: str = STORAGE_KEY
+    ):
+        """Initialize the operation log."""
+        self._hass = hass
+        self._path = path or hass.config.path(".storage", f"{key}{OPLOG_EXTENSION}")
+        self.seq = 0
+        self.pending = 0
+
+    async def async_append(self, records: List[Dict[str, Any]]) -> None:
+        """Assign sequence numbers to records and durably append them."""
+        lines = []
+        for record in records:
+            self.seq += 1
+            lines.append(json.dumps({"seq": self.seq, **record}, separators=(",", ":")))
+        await self._hass.async_add_executor_job(self._append, "\n".join(lines) + "\n")
+        self.pending += len(records)
+
+    def _append(self, text: str) -> None:
+        """Append and fsync in the executor."""
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with open(self._path, "a", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+
+    async def async_read(self, after_seq: int) -> List[Dict[str, Any]]:
+        """Return records with a sequence number above after_seq."""
+        records = await self._hass.async_add_executor_job(self._read, after_seq)
+        if records:
+            self.seq = max(self.seq, records[-1]["seq"])
+        self.seq = max(self.seq, after_seq)
+        self.pending = len(records)
+        return records
+
+    def _read(self, after_seq: int) -> List[Dict[str, Any]]:
+        """Read the log in the executor, stopping at a torn final record."""
+        if not os.path.exists(self._path):
+            return []
+        records = []
+        with open(self._path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    _LOGGER.warning("Ignoring incomplete operation log record")
+                    break
+                if record["seq"] > after_seq:
+                    records.append(record)
+        return records
+
+    async def async_truncate(self) -> None:
+        """Empty the log after its records were folded into a checkpoint."""
+        await self._hass.async_add_executor_job(self._truncate)
+        self.pending = 0
+
+    def _truncate(self) -> None:
+        """Truncate in the executor."""
+        if os.path.exists(self._path):
+            with open(self._path, "w", encoding="utf-8") as file:
+                file.flush()
+                os.fsync(file.fileno())
+
+
+def apply_records(data: Dict[str, Any], records: List[Dict[str, Any]]) -> None:
+    """Replay log records onto raw stored data in order.
+    
+    Migration records carry the position of an interrupted schema migration
+    and are kept in the metadata for the migration engine to resume from.
+    """
+    chores = data.setdefault("chores", {})
+    for record in records:
+        if record["op"] == OP_MIGRATION:
+            data.setdefault("metadata", {})["migration"] = {
+                "version": record["version"],
+                "position": record["position"],
+            }
+        elif record["op"] == OP_REMOVE:
+            chores.pop(record["id"], None)
+        else:
+            chores[record["id"]] = record["chore"]
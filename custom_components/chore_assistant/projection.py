@@ -0,0 +1,138 @@
+"""Projected chore occurrences for Chore Assistant integration."""
+import logging
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from homeassistant.core import callback
+
+from . import clock
+from .models import Chore
+from .storage import ChoreStorage
+from .const import CALENDAR_HORIZON_DAYS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """One projected all-day occurrence of a chore."""
+    day: date
+    chore_id: str
+    index: int  # 0 for the next occurrence, counting up
+
+
+def project_chore(chore: Chore, start: date, end: date) -> List[date]:
+    """Return the days in [start, end) a chore falls due on.
+
+    The first occurrence is the chore's next due date, however long ago
+    for an overdue chore; the rest repeat every interval_days from it.
+    """
+    next_due = chore.get_next_due_date()
+    if next_due is None:
+        return []
+    first = clock.local_day(next_due)
+    interval = max(chore.interval_days, 1)
+
+    days = []
+    if first < start:
+        if chore.state != "completed":
+            days.append(first)
+        skipped = -(-(start - first).days // interval)
+        first += timedelta(days=skipped * interval)
+    while first < end:
+        days.append(first)
+        first += timedelta(days=interval)
+    return days
+
+
+class OccurrenceProjection:
+    """Cache of every chore's occurrences over a rolling horizon.
+
+    Projections are kept per chore and in one sorted index of
+    (day, chore ID, index) keys. Storage deltas mark chores stale and only
+    those are re-projected on the next query, by removing and inserting
+    their keys with binary search. A range query is two bisects plus the
+    matching slice. The horizon starts today and is rebuilt when the day
+    changes; queries reaching past it are projected directly.
+    """
+
+    def __init__(self, storage: ChoreStorage, horizon_days: int = CALENDAR_HORIZON_DAYS):
+        """Initialize the projection."""
+        self._storage = storage
+        self._horizon_days = horizon_days
+        self._start: Optional[date] = None
+        self._end: Optional[date] = None
+        self._by_chore: Dict[str, List[Tuple[date, str, int]]] = {}
+        self._index: List[Tuple[date, str, int]] = []
+        self._dirty: Set[str] = set()
+        self._unsub = storage.async_add_listener(self._async_handle_changes)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for storage changes."""
+        self._unsub()
+
+    @callback
+    def _async_handle_changes(self, changed: Set[str], removed: Set[str]) -> None:
+        """Mark chores touched by a storage commit for re-projection."""
+        self._dirty |= changed | removed
+
+    def occurrences(self, start: date, end: date) -> List[Occurrence]:
+        """Return occurrences on days in [start, end), ordered by day."""
+        self._refresh()
+        chores = self._storage.snapshot
+
+        if start < self._start or end > self._end:
+            found = [
+                Occurrence(day, chore.id, index)
+                for chore in chores.values()
+                for index, day in enumerate(project_chore(chore, self._start, end))
+                if day >= start
+            ]
+            found.sort(key=lambda occurrence: (occurrence.day, occurrence.chore_id))
+            return found
+
+        lo = bisect_left(self._index, (start,))
+        hi = bisect_left(self._index, (end,), lo=lo)
+        return [Occurrence(*key) for key in self._index[lo:hi]]
+
+    def next_occurrence(self) -> Optional[Occurrence]:
+        """Return the earliest occurrence in the horizon."""
+        self._refresh()
+        return Occurrence(*self._index[0]) if self._index else None
+
+    def _refresh(self) -> None:
+        """Roll the horizon forward and re-project stale chores."""
+        today = clock.today()
+        chores = self._storage.snapshot
+        if self._start != today:
+            self._start = today
+            self._end = today + timedelta(days=self._horizon_days)
+            self._by_chore = {}
+            self._index = []
+            self._dirty = set(chores)
+
+        dirty, self._dirty = self._dirty, set()
+        rebuild = len(dirty) > len(self._index) // 4
+        for chore_id in dirty:
+            old = self._by_chore.pop(chore_id, [])
+            if not rebuild:
+                for key in old:
+                    del self._index[bisect_left(self._index, key)]
+
+            chore = chores.get(chore_id)
+            if chore is None:
+                continue
+            keys = [
+                (day, chore_id, index)
+                for index, day in enumerate(project_chore(chore, self._start, self._end))
+            ]
+            self._by_chore[chore_id] = keys
+            if not rebuild:
+                for key in keys:
+                    insort(self._index, key)
+
+        if rebuild:
+            self._index = sorted(key for keys in self._by_chore.values() for key in keys)
@@ -1,17 +1,22 @@
 """Sensor platform for the Chore Assistant."""
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, List
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import DOMAIN, STATE_COMPLETED, STATE_OVERDUE, STATE_PENDING
+from .const import DOMAIN, ATTR_HOUSEHOLD, STATE_COMPLETED, STATE_OVERDUE, STATE_PENDING
 from .storage import ChoreStorage
 from .models import Chore
 
+if TYPE_CHECKING:
+    from .forecast import CompletionForecaster
+    from .household import Household
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -21,24 +26,65 @@ async def async_setup_platform(
     async_add_entities: AddEntitiesCallback,
     discovery_info: Optional[DiscoveryInfoType] = None,
 ) -> None:
-    """Set up the Chore Assistant sensor platform."""
-    _LOGGER.info("Setting up Chore Assistant sensor platform")
-    
-    storage: ChoreStorage = hass.data[DOMAIN]["storage"]
+    """Set up the Chore Assistant sensor platform for the YAML household."""
+    if discovery_info is None:
+        return
+    household = hass.data[DOMAIN]["households"][discovery_info[ATTR_HOUSEHOLD]]
+    _async_setup_household_sensors(hass, household, async_add_entities)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Chore Assistant sensors for a config entry's household."""
+    household = hass.data[DOMAIN]["households"][entry.entry_id]
+    _async_setup_household_sensors(hass, household, async_add_entities)
+
+
+@callback
+def _async_setup_household_sensors(
+    hass: HomeAssistant,
+    household: "Household",
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Create sensors for a household's chores, now and as they load."""
+    _LOGGER.info("Setting up Chore Assistant sensors for household %s", household.name)
     
-    # Create sensor entities for each existing chore
-    chores = await storage.async_get_all_chores()
-    entities = []
+    storage: ChoreStorage = household.storage
+
+    def add_entities(entities: List["ChoreSensor"]) -> None:
+        """Add sensors and track them on the household."""
+        household.entities.update(entities)
+        async_add_entities(entities)
+
+    def add_sensors(chores: List[Chore]) -> None:
+        """Create sensors for chores."""
+        add_entities([
+            ChoreSensor(hass, chore, storage, household.forecaster) for chore in chores
+        ])
+
+    household.async_add_entities = add_entities
     
-    for chore in chores:
-        _LOGGER.info("Creating sensor for chore: %s", chore.name)
-        entities.append(ChoreSensor(hass, chore))
+    # Create sensor entities for chores hydrated so far
+    chores = list(storage.chores.values())
+    if chores:
+        _LOGGER.info("Adding %d chore sensors", len(chores))
+        add_sensors(chores)
     
-    if entities:
-        _LOGGER.info("Adding %d chore sensors", len(entities))
-        async_add_entities(entities)
+    if storage.ready:
+        if not chores:
+            _LOGGER.info("No chores to create sensors for")
     else:
-        _LOGGER.info("No chores to create sensors for")
+        # Add the rest in batches as the background load hydrates them
+        def handle_loaded_batch(chores: List[Chore]) -> None:
+            """Create sensors for a batch of freshly loaded chores."""
+            if chores:
+                _LOGGER.debug("Adding %d chore sensors", len(chores))
+                add_sensors(chores)
+        
+        storage.async_add_load_listener(handle_loaded_batch)
 
     # Set up listener for chore updates
     async def handle_chore_update(event):
@@ -46,43 +92,43 @@ async def async_setup_platform(
         _LOGGER.info("Handling chore update event")
         
         # Get current chores
-        current_chores = await storage.async_get_all_chores()
-        current_chore_ids = {chore.id for chore in current_chores}
+        current_chores = list(storage.snapshot.values())
         
         # Get existing entity IDs
-        existing_entity_ids = {entity.unique_id for entity in hass.data[DOMAIN].get("entities", set())}
+        existing_entity_ids = {entity.unique_id for entity in household.entities}
         
         # Find new chores
         new_chores = [chore for chore in current_chores
                      if f"chore_assistant_{chore.id}" not in existing_entity_ids]
         
         if new_chores:
-            new_entities = [ChoreSensor(hass, chore) for chore in new_chores]
-            _LOGGER.info("Adding %d new chore sensors", len(new_entities))
-            async_add_entities(new_entities)
+            _LOGGER.info("Adding %d new chore sensors", len(new_chores))
+            add_sensors(new_chores)
     
     # Register event listener
-    hass.bus.async_listen(f"{DOMAIN}_updated", handle_chore_update)
+    household.async_on_stop(hass.bus.async_listen(f"{DOMAIN}_updated", handle_chore_update))
 
 
 class ChoreSensor(SensorEntity):
     """Representation of a Chore sensor."""
 
-    def __init__(self, hass: HomeAssistant, chore: Chore) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        chore: Chore,
+        storage: ChoreStorage,
+        forecaster: Optional["CompletionForecaster"] = None,
+    ) -> None:
         """Initialize the Chore sensor."""
         self.hass = hass
         self._chore = chore
-        self._storage: ChoreStorage = hass.data[DOMAIN]["storage"]
+        self._storage = storage
+        self._forecaster = forecaster
         
         # Set entity properties
         self._attr_unique_id = f"chore_assistant_{chore.id}"
         self._attr_name = chore.name
         self._attr_icon = self._get_icon()
-        
-        # Track entity in hass.data
-        if "entities" not in hass.data[DOMAIN]:
-            hass.data[DOMAIN]["entities"] = set()
-        hass.data[DOMAIN]["entities"].add(self)
 
     def _get_icon(self) -> str:
         """Return the icon based on chore state."""
@@ -101,39 +147,14 @@ class ChoreSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return the state attributes."""
-        attrs = {
-            "id": self._chore.id,
-            "name": self._chore.name,
-            "state": self._chore.state,
-            "created_date": self._chore.created_date.isoformat() if self._chore.created_date else None,
-            "due_date": self._chore.due_date.isoformat() if self._chore.due_date else None,
-            "interval_days": self._chore.interval_days,
-            "assigned_to": self._chore.assigned_to,
-            "priority": self._chore.metadata.priority,
-            "category": self._chore.metadata.category,
-            "estimated_duration": self._chore.metadata.estimated_duration,
-            "history_count": len(self._chore.history),
-            "statistics": {
-                "total_completions": self._chore.statistics.total_completions,
-                "last_completed": self._chore.statistics.last_completed.isoformat() if self._chore.statistics.last_completed else None,
-                "average_completion_time": self._chore.statistics.average_completion_time,
-                "completion_streak": self._chore.statistics.completion_streak,
-            }
-        }
+        attrs = self._chore.to_state_attributes()
         
-        # Add recent history
-        if self._chore.history:
-            recent_history = self._chore.history[-5:]  # Last 5 entries
-            attrs["recent_history"] = [
-                {
-                    "timestamp": entry.timestamp.isoformat(),
-                    "action": entry.action,
-                    "previous_state": entry.previous_state,
-                    "new_state": entry.new_state,
-                    "notes": entry.notes,
-                }
-                for entry in recent_history
-            ]
+        # Add the completion forecast of open chores
+        if self._forecaster is not None:
+            forecast = self._forecaster.forecast(self._chore.id)
+            if forecast is not None:
+                attrs["predicted_completion"] = forecast["predicted_completion"]
+                attrs["likely_missed"] = forecast["likely_missed"]
         
         return attrs
 
@@ -145,8 +166,8 @@ class ChoreSensor(SensorEntity):
     async def async_update(self) -> None:
         """Fetch new state data for the sensor."""
         try:
-            # Refresh chore data from storage
-            updated_chore = await self._storage.async_get_chore(self._chore.id)
+            # Refresh from the latest snapshot, which later commits never change
+            updated_chore = self._storage.snapshot.get(self._chore.id)
             if updated_chore:
                 self._chore = updated_chore
                 self._attr_icon = self._get_icon()
@@ -0,0 +1,191 @@
+"""Sharded Store layout for Chore Assistant integration."""
+import asyncio
+import logging
+import zlib
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .backends import StorageBackend
+from .models import Chore
+from .const import STORAGE_KEY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+
+def shard_for(chore_id: str, shard_count: int) -> int:
+    """Return the shard a chore belongs to.
+
+    Uses CRC32 rather than hash() so the mapping is stable across restarts.
+    """
+    return zlib.crc32(chore_id.encode("utf-8")) % shard_count
+
+
+class ShardedStore(StorageBackend):
+    """Splits chores across several Store files by a stable hash of chore ID.
+
+    Each shard has two slots. A save writes the dirty shards into their
+    inactive slot and then commits by writing the manifest, which records
+    the active slot of every shard. A crash before the manifest write leaves
+    the previous generation intact, so commits spanning shards are atomic.
+    """
+
+    name = "sharded"
+
+    def __init__(self, hass: HomeAssistant, shard_count: int, key: str = STORAGE_KEY):
+        """Initialize the sharded store."""
+        self._hass = hass
+        self._key = key
+        self._shard_count = shard_count
+        self._manifest_store = Store(hass, STORAGE_VERSION, f"{key}_manifest")
+        self._shard_stores: Dict[Tuple[int, int], Store] = {}
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._members: List[Set[str]] = [set() for _ in range(shard_count)]
+        self._needs_full_write = False
+
+    @property
+    def shard_count(self) -> int:
+        """Return the number of shards."""
+        return self._shard_count
+
+    @property
+    def needs_full_write(self) -> bool:
+        """Return True if the stored layout must be rewritten, e.g. after resharding."""
+        return self._needs_full_write
+
+    def _get_shard_store(self, shard: int, slot: int) -> Store:
+        """Return the Store backing one slot of a shard."""
+        key = (shard, slot)
+        if key not in self._shard_stores:
+            self._shard_stores[key] = Store(
+                self._hass, STORAGE_VERSION, f"{self._key}_shard_{shard}_{slot}"
+            )
+        return self._shard_stores[key]
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load the committed generation, or None if no manifest exists.
+
+        The result has the same shape as the single-file Store data.
+        """
+        manifest = await self._manifest_store.async_load()
+        if manifest is None:
+            return None
+
+        slots = manifest["slots"]
+        shard_data = await asyncio.gather(
+            *(
+                self._get_shard_store(shard, slot).async_load()
+                for shard, slot in enumerate(slots)
+            )
+        )
+
+        chores: Dict[str, Any] = {}
+        for data in shard_data:
+            if data:
+                chores.update(data.get("chores", {}))
+
+        self._manifest = manifest
+        if manifest["shard_count"] != self._shard_count:
+            _LOGGER.info(
+                "Resharding storage from %d to %d shards",
+                manifest["shard_count"],
+                self._shard_count,
+            )
+            # Force a full rewrite into the new layout on the next save
+            self._needs_full_write = True
+
+        _LOGGER.debug(
+            "Loaded %d chores from %d shards (generation %d)",
+            len(chores),
+            len(slots),
+            manifest["generation"],
+        )
+        return {"chores": chores, "metadata": manifest.get("metadata", {})}
+
+    async def async_save(
+        self,
+        chores: Mapping[str, Chore],
+        metadata: Dict[str, Any],
+        dirty: Optional[Set[str]] = None,
+    ) -> int:
+        """Rewrite the shards touched by `dirty` and commit a new manifest.
+
+        Passing None for `dirty` rewrites every shard. Returns the number of
+        shards written.
+        """
+        previous = self._manifest
+        full = dirty is None or previous is None or self._needs_full_write
+
+        if full:
+            self._members = [set() for _ in range(self._shard_count)]
+            for chore_id in chores:
+                self._members[shard_for(chore_id, self._shard_count)].add(chore_id)
+            dirty_shards = set(range(self._shard_count))
+            previous_slots = (previous or {}).get("slots", [])
+            slots = [
+                previous_slots[shard] if shard < len(previous_slots) else 1
+                for shard in range(self._shard_count)
+            ]
+            generation = (previous or {}).get("generation", 0) + 1
+        else:
+            dirty_shards = set()
+            for chore_id in dirty:
+                shard = shard_for(chore_id, self._shard_count)
+                dirty_shards.add(shard)
+                if chore_id in chores:
+                    self._members[shard].add(chore_id)
+                else:
+                    self._members[shard].discard(chore_id)
+            slots = list(previous["slots"])
+            generation = previous["generation"] + 1
+
+        # Never overwrite a committed slot: write each dirty shard to its other slot
+        for shard in dirty_shards:
+            slots[shard] = 1 - slots[shard]
+
+        await asyncio.gather(
+            *(
+                self._get_shard_store(shard, slots[shard]).async_save({
+                    "generation": generation,
+                    "shard": shard,
+                    "chores": {
+                        chore_id: chores[chore_id].to_dict()
+                        for chore_id in self._members[shard]
+                    },
+                })
+                for shard in dirty_shards
+            )
+        )
+
+        manifest = {
+            "shard_count": self._shard_count,
+            "generation": generation,
+            "slots": slots,
+            "metadata": metadata,
+        }
+        # Commit point: the manifest names the slots that make up this generation
+        await self._manifest_store.async_save(manifest)
+        self._manifest = manifest
+        self._needs_full_write = False
+
+        if full and previous is not None and previous["shard_count"] > self._shard_count:
+            await self._async_remove_shards(range(self._shard_count, previous["shard_count"]))
+
+        return len(dirty_shards)
+
+    async def async_remove(self) -> None:
+        """Remove the manifest and every shard file."""
+        shard_count = max(
+            self._shard_count, (self._manifest or {}).get("shard_count", 0)
+        )
+        await self._manifest_store.async_remove()
+        await self._async_remove_shards(range(shard_count))
+        self._manifest = None
+
+    async def _async_remove_shards(self, shards) -> None:
+        """Remove both slots of the given shards."""
+        for shard in shards:
+            for slot in (0, 1):
+                await self._get_shard_store(shard, slot).async_remove()
@@ -0,0 +1,84 @@
+"""Immutable versioned chore snapshots for Chore Assistant integration."""
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from .const import SNAPSHOT_BUCKETS
+from .models import Chore
+
+_EMPTY: Dict[str, Chore] = {}
+
+
+class ChoreSnapshot(Mapping):
+    """A read-only mapping of chore ID to chore as of one storage commit.
+
+    Chores are frozen copies, so a snapshot can be held across awaits or
+    read in the executor without copying and never changes under a reader.
+    Chores are spread over buckets by ID; the next version copies only the
+    buckets holding changed chores and shares the rest with this one.
+    """
+
+    __slots__ = ("version", "_buckets", "_size")
+
+    def __init__(
+        self,
+        version: int = 0,
+        buckets: Optional[Tuple[Dict[str, Chore], ...]] = None,
+        size: int = 0,
+    ):
+        """Initialize a snapshot; without buckets it is empty."""
+        self.version = version
+        self._buckets = buckets or (_EMPTY,) * SNAPSHOT_BUCKETS
+        self._size = size
+
+    @classmethod
+    def build(cls, chores: Iterable[Chore], version: int = 0) -> "ChoreSnapshot":
+        """Return a snapshot of frozen copies of chores, one version after version."""
+        return cls(version).evolve({chore.id: chore.freeze() for chore in chores})
+
+    def _bucket(self, chore_id: str) -> Dict[str, Chore]:
+        """Return the bucket a chore ID belongs to."""
+        # Snapshots live in memory only, so the per-process string hash is enough
+        return self._buckets[hash(chore_id) % len(self._buckets)]
+
+    def __getitem__(self, chore_id: str) -> Chore:
+        """Return a chore by ID."""
+        return self._bucket(chore_id)[chore_id]
+
+    def get(self, chore_id: str, default: Optional[Chore] = None) -> Optional[Chore]:
+        """Return a chore by ID, or default."""
+        return self._bucket(chore_id).get(chore_id, default)
+
+    def __contains__(self, chore_id: object) -> bool:
+        """Return whether a chore is in the snapshot."""
+        return isinstance(chore_id, str) and chore_id in self._bucket(chore_id)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over chore IDs."""
+        for bucket in self._buckets:
+            yield from bucket
+
+    def __len__(self) -> int:
+        """Return the number of chores."""
+        return self._size
+
+    def evolve(self, changes: Mapping[str, Optional[Chore]]) -> "ChoreSnapshot":
+        """Return the next version with changed chores replaced.
+
+        changes maps chore IDs to frozen chores; None removes the chore.
+        """
+        buckets = list(self._buckets)
+        copied = set()
+        size = self._size
+        for chore_id, chore in changes.items():
+            index = hash(chore_id) % len(buckets)
+            if index not in copied:
+                buckets[index] = dict(buckets[index])
+                copied.add(index)
+            bucket = buckets[index]
+            if chore is None:
+                if bucket.pop(chore_id, None) is not None:
+                    size -= 1
+            else:
+                if chore_id not in bucket:
+                    size += 1
+                bucket[chore_id] = chore
+        return ChoreSnapshot(self.version + 1, tuple(buckets), size)
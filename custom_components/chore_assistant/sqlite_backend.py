@@ -0,0 +1,351 @@
+"""SQLite storage backend for Chore Assistant integration."""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from . import clock
+from .backends import StorageBackend
+from .models import Chore
+from .const import STORAGE_KEY, SQLITE_FILENAME
+
+_LOGGER = logging.getLogger(__name__)
+
+# (entry count, first entry, last entry) of a chore's stored history
+HistoryMark = Tuple[int, Optional[Tuple[str, str]], Optional[Tuple[str, str]]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chores (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    state TEXT NOT NULL,
+    due_date TEXT,
+    due_ts REAL,
+    assigned_to TEXT,
+    category TEXT,
+    priority TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_chores_state ON chores (state);
+CREATE INDEX IF NOT EXISTS idx_chores_assigned_to ON chores (assigned_to);
+CREATE INDEX IF NOT EXISTS idx_chores_category ON chores (category);
+CREATE TABLE IF NOT EXISTS history (
+    chore_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    action TEXT NOT NULL,
+    previous_state TEXT,
+    new_state TEXT,
+    notes TEXT,
+    assigned_to TEXT,
+    PRIMARY KEY (chore_id, seq)
+) WITHOUT ROWID;
+"""
+
+# Run after SCHEMA, once databases created before due_ts have the column
+SCHEMA_INDEXES = """
+DROP INDEX IF EXISTS idx_chores_due_date;
+DROP INDEX IF EXISTS idx_history_timestamp;
+CREATE INDEX IF NOT EXISTS idx_chores_due_ts ON chores (due_ts);
+"""
+
+# Statements are kept constant so sqlite3's statement cache reuses the
+# prepared form instead of recompiling on every call.
+SQL_UPSERT_CHORE = """
+INSERT INTO chores (id, name, state, due_date, due_ts, assigned_to, category, priority, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    name = excluded.name,
+    state = excluded.state,
+    due_date = excluded.due_date,
+    due_ts = excluded.due_ts,
+    assigned_to = excluded.assigned_to,
+    category = excluded.category,
+    priority = excluded.priority,
+    data = excluded.data
+"""
+SQL_DELETE_CHORE = "DELETE FROM chores WHERE id = ?"
+SQL_INSERT_HISTORY = """
+INSERT OR REPLACE INTO history (
+    chore_id, seq, timestamp, action, previous_state, new_state, notes, assigned_to
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_TRUNCATE_HISTORY = "DELETE FROM history WHERE chore_id = ? AND seq >= ?"
+SQL_COUNT_HISTORY = "SELECT chore_id, COUNT(*) FROM history GROUP BY chore_id"
+SQL_SELECT_CHORES = "SELECT id, data FROM chores"
+SQL_SELECT_HISTORY = """
+SELECT chore_id, timestamp, action, previous_state, new_state, notes, assigned_to
+FROM history ORDER BY chore_id, seq
+"""
+SQL_SELECT_METADATA = "SELECT value FROM metadata WHERE key = 'metadata'"
+SQL_UPSERT_METADATA = "INSERT OR REPLACE INTO metadata (key, value) VALUES ('metadata', ?)"
+
+SQL_FILTERS = {
+    "state": "SELECT id FROM chores WHERE state = ?",
+    "assigned_to": "SELECT id FROM chores WHERE assigned_to = ?",
+    "category": "SELECT id FROM chores WHERE category = ?",
+    "due_before": "SELECT id FROM chores WHERE due_ts < ?",
+}
+
+
+def _due_timestamp(due_date: Optional[str]) -> Optional[float]:
+    """Return the timestamp a stored due date is indexed by."""
+    return clock.timestamp(datetime.fromisoformat(due_date)) if due_date else None
+
+
+def _entry_key(entry: Dict[str, Any]) -> Tuple[str, str]:
+    """Return what identifies a stored history entry."""
+    return entry["timestamp"], entry["action"]
+
+
+def _history_mark(history: List[Dict[str, Any]]) -> HistoryMark:
+    """Return the mark of a chore's history as written."""
+    if not history:
+        return 0, None, None
+    return len(history), _entry_key(history[0]), _entry_key(history[-1])
+
+
+class SQLiteBackend(StorageBackend):
+    """Persists chores in a local SQLite database in WAL mode.
+
+    Chores and history live in indexed tables, so a save touches only the
+    rows of the chores that changed and appends only new history entries.
+    All database calls run in the executor.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self, hass: HomeAssistant, path: Optional[str] = None, key: str = STORAGE_KEY
+    ):
+        """Initialize the backend."""
+        self._hass = hass
+        filename = SQLITE_FILENAME if key == STORAGE_KEY else f"{key}.db"
+        self._path = path or hass.config.path(".storage", filename)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        self._history_marks: Dict[str, HistoryMark] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema if needed."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(chores)")}
+            if "due_ts" not in columns:
+                self._add_due_timestamps(conn)
+            if "assigned_to" not in {row[1] for row in conn.execute("PRAGMA table_info(history)")}:
+                with conn:
+                    conn.execute("ALTER TABLE history ADD COLUMN assigned_to TEXT")
+            conn.executescript(SCHEMA_INDEXES)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _add_due_timestamps(conn: sqlite3.Connection) -> None:
+        """Add and fill the due_ts column of a database created without it."""
+        with conn:
+            conn.execute("ALTER TABLE chores ADD COLUMN due_ts REAL")
+            conn.executemany(
+                "UPDATE chores SET due_ts = ? WHERE id = ?",
+                [
+                    (_due_timestamp(due_date), chore_id)
+                    for chore_id, due_date in conn.execute(
+                        "SELECT id, due_date FROM chores WHERE due_date IS NOT NULL"
+                    ).fetchall()
+                ],
+            )
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load every chore with its history."""
+        return await self._hass.async_add_executor_job(self._load)
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Load the database contents in the executor."""
+        if self._conn is None and not os.path.exists(self._path):
+            return None
+
+        with self._conn_lock:
+            conn = self._connect()
+            row = conn.execute(SQL_SELECT_METADATA).fetchone()
+            if row is None:
+                return None
+
+            chores: Dict[str, Dict[str, Any]] = {}
+            for chore_id, data in conn.execute(SQL_SELECT_CHORES):
+                chore_data = json.loads(data)
+                chore_data["history"] = []
+                chores[chore_id] = chore_data
+
+            for (
+                chore_id, timestamp, action, previous_state, new_state, notes, assigned_to
+            ) in conn.execute(SQL_SELECT_HISTORY):
+                if chore_id in chores:
+                    entry = {
+                        "timestamp": timestamp,
+                        "action": action,
+                        "previous_state": previous_state,
+                        "new_state": new_state,
+                        "notes": notes,
+                    }
+                    if assigned_to is not None:
+                        entry["assigned_to"] = assigned_to
+                    chores[chore_id]["history"].append(entry)
+
+            self._history_marks = {
+                chore_id: _history_mark(chore_data["history"])
+                for chore_id, chore_data in chores.items()
+            }
+
+        return {"chores": chores, "metadata": json.loads(row[0])}
+
+    async def async_save(
+        self,
+        chores: Mapping[str, Chore],
+        metadata: Dict[str, Any],
+        dirty: Optional[Set[str]] = None,
+    ) -> int:
+        """Write the dirty chores' rows in a single transaction."""
+        chore_ids = set(chores) if dirty is None else set(dirty)
+        rows = {
+            chore_id: chores[chore_id].to_dict() if chore_id in chores else None
+            for chore_id in chore_ids
+        }
+        return await self._hass.async_add_executor_job(
+            self._save, rows, metadata, dirty is None
+        )
+
+    def _save(
+        self,
+        rows: Dict[str, Optional[Dict[str, Any]]],
+        metadata: Dict[str, Any],
+        full: bool,
+    ) -> int:
+        """Apply row-level changes in the executor."""
+        with self._conn_lock:
+            conn = self._connect()
+            with conn:
+                if full:
+                    conn.execute("DELETE FROM chores")
+                    conn.execute("DELETE FROM history")
+                    self._history_marks = {}
+
+                for chore_id, chore_data in rows.items():
+                    if chore_data is None:
+                        conn.execute(SQL_DELETE_CHORE, (chore_id,))
+                        conn.execute(SQL_TRUNCATE_HISTORY, (chore_id, 0))
+                        self._history_marks.pop(chore_id, None)
+                        continue
+                    self._write_chore(conn, chore_id, chore_data)
+
+                conn.execute(SQL_UPSERT_METADATA, (json.dumps(metadata),))
+        return len(rows)
+
+    def _write_chore(self, conn: sqlite3.Connection, chore_id: str, chore_data: Dict[str, Any]) -> None:
+        """Upsert a chore row and append its new history entries.
+        
+        History is only appended to when the stored rows are still a prefix
+        of it, judged by the first and last stored entries. Otherwise, as
+        after a trim or a restore, the chore's history is rewritten.
+        """
+        history = chore_data.pop("history")
+        conn.execute(
+            SQL_UPSERT_CHORE,
+            (
+                chore_id,
+                chore_data["name"],
+                chore_data["state"],
+                chore_data["due_date"],
+                _due_timestamp(chore_data["due_date"]),
+                chore_data["assigned_to"],
+                chore_data["metadata"]["category"],
+                chore_data["metadata"]["priority"],
+                json.dumps(chore_data),
+            ),
+        )
+
+        stored, first, last = self._history_marks.get(chore_id, (0, None, None))
+        if stored and (
+            len(history) < stored
+            or _entry_key(history[0]) != first
+            or _entry_key(history[stored - 1]) != last
+        ):
+            conn.execute(SQL_TRUNCATE_HISTORY, (chore_id, 0))
+            stored = 0
+        conn.executemany(
+            SQL_INSERT_HISTORY,
+            [
+                (
+                    chore_id,
+                    seq,
+                    entry["timestamp"],
+                    entry["action"],
+                    entry["previous_state"],
+                    entry["new_state"],
+                    entry["notes"],
+                    entry.get("assigned_to"),
+                )
+                for seq, entry in enumerate(history[stored:], start=stored)
+            ],
+        )
+        self._history_marks[chore_id] = _history_mark(history)
+
+    async def async_query_chore_ids(self, **filters: Any) -> List[str]:
+        """Return IDs of chores matching all given filters.
+
+        Supported filters: state, assigned_to, category and due_before.
+        due_before may be a date or a naive or aware datetime; due dates are
+        compared as timestamps, so mixed kinds order correctly.
+        """
+        return await self._hass.async_add_executor_job(self._query_chore_ids, filters)
+
+    def _query_chore_ids(self, filters: Dict[str, Any]) -> List[str]:
+        """Run the prepared filter queries in the executor."""
+        result: Optional[Set[str]] = None
+        with self._conn_lock:
+            conn = self._connect()
+            for name, value in filters.items():
+                if value is None:
+                    continue
+                if name == "due_before":
+                    value = clock.timestamp(value)
+                ids = {row[0] for row in conn.execute(SQL_FILTERS[name], (value,))}
+                result = ids if result is None else result & ids
+            if result is None:
+                result = {row[0] for row in conn.execute("SELECT id FROM chores")}
+        return sorted(result)
+
+    async def async_remove(self) -> None:
+        """Delete the database files."""
+        await self._hass.async_add_executor_job(self._remove)
+
+    def _remove(self) -> None:
+        """Close the connection and delete the database in the executor."""
+        self._close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self._path + suffix):
+                os.remove(self._path + suffix)
+
+    async def async_close(self) -> None:
+        """Close the database connection."""
+        await self._hass.async_add_executor_job(self._close)
+
+    def _close(self) -> None:
+        """Close the connection in the executor."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
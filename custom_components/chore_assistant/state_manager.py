@@ -1,9 +1,11 @@
 """State management for Chore Assistant integration."""
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
-from .models import Chore, ChoreHistoryEntry
+from . import clock
+from .models import Chore
+from .oplog import OP_TRANSITION
 from .storage import ChoreStorage
 from .const import (
     STATE_PENDING,
@@ -13,16 +15,32 @@ from .const import (
     EVENT_CHORE_OVERDUE,
 )
 
+if TYPE_CHECKING:
+    from .assignment import AssignmentEngine
+
 _LOGGER = logging.getLogger(__name__)
 
+# History action recorded for a transition into each state
+HISTORY_ACTIONS = {
+    STATE_COMPLETED: "completed",
+    STATE_PENDING: "reset",
+    STATE_OVERDUE: "overdue",
+}
+
 
 class ChoreStateManager:
     """Manages chore state transitions and validation."""
     
-    def __init__(self, storage: ChoreStorage, hass=None):
+    def __init__(
+        self,
+        storage: ChoreStorage,
+        hass=None,
+        assigner: Optional["AssignmentEngine"] = None,
+    ):
         """Initialize the state manager."""
         self._storage = storage
         self._hass = hass
+        self._assigner = assigner
         self._state_transitions = {
             STATE_PENDING: [STATE_COMPLETED, STATE_OVERDUE],
             STATE_COMPLETED: [STATE_PENDING],
@@ -36,60 +54,76 @@ class ChoreStateManager:
         reason: Optional[str] = None,
         completed_by: Optional[str] = None,
         notes: Optional[str] = None,
+        advance_due_date: bool = False,
     ) -> bool:
-        """Transition a chore to a new state."""
+        """Transition a chore to a new state.
+        
+        The chore's lock is held from the read to the write, so concurrent
+        transitions of the same chore apply one after the other. With
+        advance_due_date, a completed recurring chore moving back to pending
+        falls due one interval after its last completion; otherwise its due
+        date is left alone.
+        """
         try:
-            chore = await self._storage.async_get_chore(chore_id)
-            if not chore:
-                _LOGGER.error("Chore %s not found", chore_id)
-                return False
-            
-            current_state = chore.state
-            if new_state == current_state:
-                _LOGGER.debug("Chore %s already in state %s", chore_id, new_state)
-                return True
-            
-            # Validate state transition
-            if not self._is_valid_transition(current_state, new_state):
-                _LOGGER.error(
-                    "Invalid state transition from %s to %s for chore %s",
-                    current_state,
-                    new_state,
-                    chore_id,
-                )
-                return False
-            
-            # Update chore state
-            old_state = chore.state
-            chore.state = new_state
-            
-            # Update timestamps based on new state
-            if new_state == STATE_COMPLETED:
-                chore.completed_date = datetime.now().date()
-                chore.last_completed = datetime.now()
+            async with self._storage.chore_lock(chore_id):
+                chore = await self._storage.async_get_chore(chore_id)
+                if not chore:
+                    _LOGGER.error("Chore %s not found", chore_id)
+                    return False
+                
+                current_state = chore.state
+                if new_state == current_state:
+                    _LOGGER.debug("Chore %s already in state %s", chore_id, new_state)
+                    return True
+                
+                # Validate state transition
+                if not self._is_valid_transition(current_state, new_state):
+                    _LOGGER.error(
+                        "Invalid state transition from %s to %s for chore %s",
+                        current_state,
+                        new_state,
+                        chore_id,
+                    )
+                    return False
+                
+                # A recurring chore coming round again falls due one interval
+                # after its completion, not on the due date it was done for
+                if (
+                    advance_due_date
+                    and current_state == STATE_COMPLETED
+                    and new_state == STATE_PENDING
+                    and chore.interval_days
+                    and chore.due_date is not None
+                ):
+                    next_due = chore.get_next_due_date()
+                    chore.due_date = (
+                        next_due if isinstance(chore.due_date, datetime) else clock.local_day(next_due)
+                    )
+                
+                # Update chore state
+                old_state = chore.state
+                chore.state = new_state
+                
+                # Hand a chore that comes round again to the next member
+                if new_state == STATE_PENDING and self._assigner and self._assigner.enabled:
+                    chore.assigned_to = self._assigner.assign(chore)
+                
+                # Add history entry
                 if completed_by:
-                    chore.completed_by = completed_by
-            elif new_state == STATE_PENDING and old_state == STATE_COMPLETED:
-                # Reset from completed to pending
-                chore.completed_date = None
-                chore.completed_by = None
-            
-            # Add history entry
-            history_entry = ChoreHistoryEntry(
-                timestamp=datetime.now(),
-                action=f"state_change_{new_state}",
-                old_state=old_state,
-                new_state=new_state,
-                reason=reason,
-                notes=notes,
-            )
-            chore.history.append(history_entry)
-            
-            # Update statistics
-            await self._update_statistics(chore, new_state, old_state)
-            
-            # Save changes
-            await self._storage.update_chore(chore)
+                    notes = f"Completed by {completed_by}" + (f": {notes}" if notes else "")
+                chore.add_history_entry(
+                    HISTORY_ACTIONS.get(new_state, new_state),
+                    previous_state=old_state,
+                    new_state=new_state,
+                    notes=notes or reason,
+                    assigned_to=chore.assigned_to if new_state == STATE_COMPLETED else None,
+                )
+                
+                # Update statistics
+                await self._update_statistics(chore, new_state, old_state)
+                
+                # Save changes
+                await self._storage.async_update_chore(chore, operation=OP_TRANSITION)
             
             # Fire events
             await self._fire_state_change_event(chore, old_state, new_state, reason)
@@ -114,20 +148,7 @@ class ChoreStateManager:
         """Update chore statistics based on state change."""
         try:
             if new_state == STATE_COMPLETED:
-                chore.statistics.total_completions += 1
-                chore.statistics.last_completed = datetime.now()
-                
-                # Calculate completion time
-                if chore.due_date:
-                    days_overdue = (datetime.now().date() - chore.due_date).days
-                    if days_overdue > 0:
-                        chore.statistics.total_overdue_days += days_overdue
-                        chore.statistics.overdue_completions += 1
-                    else:
-                        chore.statistics.on_time_completions += 1
-            
-            elif new_state == STATE_OVERDUE and old_state == STATE_PENDING:
-                chore.statistics.total_overdue_count += 1
+                chore.update_statistics_on_completion()
                 
         except Exception as err:
             _LOGGER.error("Error updating statistics for chore %s: %s", chore.id, err)
@@ -150,7 +171,7 @@ class ChoreStateManager:
                 "name": chore.name,
                 "old_state": old_state,
                 "new_state": new_state,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": clock.now().isoformat(),
             }
             
             if reason:
@@ -173,9 +194,10 @@ class ChoreStateManager:
         try:
             all_chores = await self._storage.async_get_all_chores()
             
+            today = clock.today()
             for chore in all_chores:
                 if chore.state == STATE_PENDING and chore.due_date:
-                    if datetime.now().date() > chore.due_date:
+                    if today > clock.local_day(chore.due_date):
                         success = await self.transition_state(
                             chore.id,
                             STATE_OVERDUE,
@@ -193,6 +215,53 @@ class ChoreStateManager:
             _LOGGER.error("Error checking overdue chores: %s", err)
             return []
     
+    async def find_due_soon_chores(self, days: int) -> List[Chore]:
+        """Return pending chores due today or within the next days."""
+        try:
+            today = clock.today()
+            horizon = today + timedelta(days=days)
+            return [
+                chore
+                for chore in await self._storage.async_get_all_chores()
+                if chore.state == STATE_PENDING
+                and chore.due_date
+                and today <= clock.local_day(chore.due_date) <= horizon
+            ]
+
+        except Exception as err:
+            _LOGGER.error("Error finding chores due soon: %s", err)
+            return []
+
+    async def check_recurring_chores(self) -> List[str]:
+        """Reset completed recurring chores whose due date has arrived.
+        
+        Only this reset moves the due date on by one interval; a manual
+        reset_chore keeps it.
+        """
+        reset_chores = []
+        try:
+            today = clock.today()
+            for chore in await self._storage.async_get_all_chores():
+                if chore.state != STATE_COMPLETED or not chore.interval_days:
+                    continue
+                if chore.due_date and clock.local_day(chore.due_date) <= today:
+                    if await self.transition_state(
+                        chore.id,
+                        STATE_PENDING,
+                        reason="recurring",
+                        advance_due_date=True,
+                    ):
+                        reset_chores.append(chore.id)
+            
+            if reset_chores:
+                _LOGGER.info("Reset %d recurring chores", len(reset_chores))
+            
+            return reset_chores
+            
+        except Exception as err:
+            _LOGGER.error("Error checking recurring chores: %s", err)
+            return []
+    
     async def reset_chore(
         self,
         chore_id: str,
@@ -222,7 +291,7 @@ class ChoreStateManager:
     async def get_chore_state(self, chore_id: str) -> Optional[str]:
         """Get the current state of a chore."""
         try:
-            chore = await self._storage.get_chore(chore_id)
+            chore = await self._storage.async_get_chore(chore_id)
             return chore.state if chore else None
         except Exception as err:
             _LOGGER.error("Error getting state for chore %s: %s", chore_id, err)
@@ -231,19 +300,11 @@ class ChoreStateManager:
     async def get_chore_statistics(self, chore_id: str) -> Optional[Dict[str, Any]]:
         """Get statistics for a chore."""
         try:
-            chore = await self._storage.get_chore(chore_id)
+            chore = await self._storage.async_get_chore(chore_id)
             if not chore:
                 return None
             
-            return {
-                "total_completions": chore.statistics.total_completions,
-                "on_time_completions": chore.statistics.on_time_completions,
-                "overdue_completions": chore.statistics.overdue_completions,
-                "total_overdue_days": chore.statistics.total_overdue_days,
-                "total_overdue_count": chore.statistics.total_overdue_count,
-                "last_completed": chore.statistics.last_completed.isoformat() if chore.statistics.last_completed else None,
-                "average_completion_time": chore.statistics.average_completion_time,
-            }
+            return chore.statistics.to_dict()
         except Exception as err:
             _LOGGER.error("Error getting statistics for chore %s: %s", chore_id, err)
             return None
\ No newline at end of file
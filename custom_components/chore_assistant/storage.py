@@ -1,63 +1,278 @@
 """Persistent storage for Chore Assistant integration."""
 import logging
-import json
 import os
+import heapq
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Any, Set, Tuple, Union
 import asyncio
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from contextlib import AsyncExitStack, asynccontextmanager
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util
 
-from .models import Chore
+from . import clock
+from .backup import BackupCatalog, CatalogBackupReader, StreamingBackupReader
+from .changefeed import ChangeFeed, ChangeRecord
+from .backends import JsonStoreBackend, StorageBackend, available_backends
+from .migrations import async_run_migrations
+from .models import Chore, FrozenChore, history_sort_key
+from .names import ChoreNameIndex
+from .oplog import OperationLog, OP_ADD, OP_UPDATE, OP_REMOVE, OP_TRIM, apply_records
+from .sharding import ShardedStore, shard_for
+from .snapshot import ChoreSnapshot
+from .sqlite_backend import SQLiteBackend
 from .const import (
     DOMAIN,
     STORAGE_KEY,
     STORAGE_VERSION,
-    BACKUP_FILENAME_PREFIX,
-    BACKUP_EXTENSION,
+    STORAGE_BACKEND_JSON,
+    STORAGE_BACKEND_SQLITE,
+    BACKUP_DIRECTORY,
     CONF_BACKUP_RETENTION_DAYS,
+    DEFAULT_HISTORY_LIMIT,
+    BACKUP_RESTORE_CHUNK_SIZE,
+    EVENT_RESTORE_PROGRESS,
+    OPLOG_CHECKPOINT_OPS,
+    OPLOG_CHECKPOINT_INTERVAL,
+    LOAD_BATCH_SIZE,
+    CHORE_LOCK_STRIPES,
+    ERROR_DUPLICATE_CHORE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Listener signature: (changed chore IDs, removed chore IDs)
+ChangeListener = Callable[[Set[str], Set[str]], None]
+# Listener signature: (chores hydrated in one batch of the initial load)
+LoadListener = Callable[[List[Chore]], None]
+
+
+@dataclass
+class _Batch:
+    """Commits deferred by one async_batch block."""
+    # Chore ID -> operation of the last deferred commit that touched it
+    operations: Dict[str, str] = field(default_factory=dict)
+    open: bool = True
+
 
 class ChoreStorage:
     """Manages persistent storage for chores."""
     
-    def __init__(self, hass: HomeAssistant):
-        """Initialize the storage manager."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        shard_count: int = 0,
+        backend: str = STORAGE_BACKEND_JSON,
+        operation_log: bool = False,
+        household_id: Optional[str] = None,
+        unique_names: bool = False,
+    ):
+        """Initialize the storage manager.
+        
+        The JSON backend keeps chores in Home Assistant Store files; a
+        shard_count above zero splits them across that many files so a save
+        only rewrites the shards holding changed chores. The SQLite backend
+        keeps them in an indexed local database instead.
+        
+        With operation_log enabled, mutations are appended to a write-ahead
+        log and folded into the backend at periodic checkpoints.
+        
+        Each household_id gets its own files; None uses the original,
+        unsuffixed file names.
+        
+        Chores are indexed by normalized name; with unique_names, adding a
+        chore whose name matches an existing one raises ValueError.
+        
+        Every commit also publishes a new immutable snapshot of the chores
+        for readers that need a consistent view; see snapshot. Its delta is
+        kept in a change feed for consumers that follow changes; see
+        changes_since.
+        """
         self._hass = hass
-        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._household_id = household_id
+        self._key = STORAGE_KEY if household_id is None else f"{STORAGE_KEY}_{household_id}"
+        self._backend = self._create_backend(hass, backend, shard_count, self._key)
+        self._oplog = OperationLog(hass, key=self._key)
+        # SQLite already commits row-level changes; the log only helps file stores
+        self._oplog_enabled = operation_log and backend != STORAGE_BACKEND_SQLITE
+        self._checkpoint_dirty: Set[str] = set()
+        self._cancel_checkpoint: Optional[Callable[[], None]] = None
+        self._migration_timings: List[Dict[str, Any]] = []
+        backup_directory = hass.config.path(BACKUP_DIRECTORY)
+        if household_id is not None:
+            backup_directory = os.path.join(backup_directory, household_id)
+        self._backup_catalog = BackupCatalog(backup_directory)
+        self._backup_catalog_ready = False
+        self._backup_lock = asyncio.Lock()
         self._data: Dict[str, Any] = {}
         self._chores: Dict[str, Chore] = {}
+        self._snapshot = ChoreSnapshot()
+        self._snapshot_changes: Dict[str, Optional[Chore]] = {}
+        self._snapshot_trimmed: Set[str] = set()
+        self._change_feed = ChangeFeed()
+        self._names = ChoreNameIndex()
+        self._unique_names = unique_names
         self._lock = asyncio.Lock()
+        self._listeners: List[ChangeListener] = []
+        self._chore_locks = [asyncio.Lock() for _ in range(CHORE_LOCK_STRIPES)]
+        self._commit_future: Optional[asyncio.Future] = None
+        self._pending_changed: Set[str] = set()
+        self._pending_removed: Set[str] = set()
+        self._pending_records: List[Dict[str, Any]] = []
+        self._pending_direct = False
+        self._batch: ContextVar[Optional[_Batch]] = ContextVar(
+            f"chore_batch_{id(self)}", default=None
+        )
+        self._open_batches: List[_Batch] = []
+        self._load_listeners: List[LoadListener] = []
+        self._ready = asyncio.Event()
+        self._startup_timings: Dict[str, float] = {}
+    
+    @staticmethod
+    def _create_backend(
+        hass: HomeAssistant, backend: str, shard_count: int, key: str
+    ) -> StorageBackend:
+        """Create the configured storage backend."""
+        if backend == STORAGE_BACKEND_SQLITE:
+            return SQLiteBackend(hass, key=key)
+        if shard_count > 0:
+            return ShardedStore(hass, shard_count, key)
+        return JsonStoreBackend(hass, key)
+    
+    @property
+    def backend(self) -> StorageBackend:
+        """Return the active storage backend."""
+        return self._backend
+    
+    @property
+    def chores(self) -> Mapping[str, Chore]:
+        """Return a read-only mapping of chore ID to chore."""
+        return MappingProxyType(self._chores)
+    
+    @property
+    def snapshot(self) -> ChoreSnapshot:
+        """Return an immutable view of the chores as of the latest commit.
+        
+        Unlike chores, the view and its chores never change once returned,
+        so it can be read across awaits or in the executor without copying
+        and without holding any lock. Mutations inside async_batch appear
+        together when the batch exits. It is empty until the initial load
+        finishes.
+        """
+        return self._snapshot
+    
+    @callback
+    def _async_publish_snapshot(self) -> None:
+        """Swap in a snapshot holding the chores committed since the last one."""
+        if self._snapshot_changes:
+            previous = self._snapshot
+            self._snapshot = previous.evolve(self._snapshot_changes)
+            self._change_feed.record(
+                previous, self._snapshot, self._snapshot_changes, self._snapshot_trimmed
+            )
+            self._snapshot_changes = {}
+            self._snapshot_trimmed = set()
+    
+    @property
+    def change_seq(self) -> int:
+        """Return the sequence number of the latest commit."""
+        return self._change_feed.seq
+    
+    def changes_since(self, seq: int) -> Optional[List[ChangeRecord]]:
+        """Return the deltas of commits after seq, oldest first.
+        
+        None means seq is no longer in the feed, or comes from before a
+        restart; the consumer should resync from snapshot and continue
+        from change_seq.
+        """
+        return self._change_feed.changes_since(seq)
+    
+    @callback
+    def async_add_listener(self, listener: ChangeListener) -> Callable[[], None]:
+        """Register a listener for mutation deltas; returns an unsubscribe callable."""
+        self._listeners.append(listener)
+        
+        @callback
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        
+        return remove_listener
+    
+    @callback
+    def _async_notify_listeners(self, changed: Set[str], removed: Set[str]) -> None:
+        """Notify listeners about chores changed or removed by a commit."""
+        for listener in list(self._listeners):
+            try:
+                listener(changed, removed)
+            except Exception as err:
+                _LOGGER.error("Error in storage change listener: %s", err)
     
     async def async_load(self) -> None:
-        """Load data from storage."""
+        """Load data from storage.
+        
+        Chores are hydrated in batches that are passed to load listeners, and
+        the event loop gets a turn between batches. The storage is marked
+        ready once loading finishes, whether or not it succeeded.
+        """
+        timings = self._startup_timings
+        started = phase_started = time.monotonic()
+        
+        def finish_phase(name: str) -> None:
+            nonlocal phase_started
+            now = time.monotonic()
+            timings[name] = round(now - phase_started, 3)
+            phase_started = now
+        
         async with self._lock:
             try:
-                stored_data = await self._store.async_load()
+                stored_data, legacy_source = await self._async_load_stored_data()
                 if stored_data is None:
                     _LOGGER.info("No stored data found, initializing empty storage")
-                    self._data = {"chores": {}, "metadata": {"version": STORAGE_VERSION}}
-                    self._chores = {}
-                else:
-                    self._data = stored_data
-                    self._chores = {}
-                    
-                    # Migrate data if needed
-                    await self._migrate_data()
-                    
-                    # Load chores
-                    for chore_id, chore_data in self._data.get("chores", {}).items():
-                        try:
-                            chore = Chore.from_dict(chore_data)
-                            self._chores[chore_id] = chore
-                        except Exception as err:
-                            _LOGGER.error("Error loading chore %s: %s", chore_id, err)
+                    stored_data = {"chores": {}, "metadata": {"version": STORAGE_VERSION}}
+                
+                self._data = stored_data
+                self._chores = {}
+                self._names.clear()
+                finish_phase("read")
+                
+                # Replay mutations logged after the last checkpoint
+                checkpoint_seq = self._data.get("metadata", {}).get("oplog_seq", 0)
+                replayed = await self._oplog.async_read(checkpoint_seq)
+                if replayed:
+                    _LOGGER.info("Replaying %d logged chore operations", len(replayed))
+                    apply_records(self._data, replayed)
+                finish_phase("replay")
+                
+                # Migrate data if needed
+                migrated = await self._migrate_data()
+                finish_phase("migrate")
+                
+                # Load chores
+                await self._async_hydrate(self._data.get("chores", {}))
+                finish_phase("hydrate")
+                
+                # The backend rebuilds its records from the chores; drop the raw copy
+                self._data["chores"] = {}
                 
+                # Save migrated data, moving it into the configured layout
+                if (
+                    migrated
+                    or replayed
+                    or self._backend.needs_full_write
+                    or legacy_source is not None
+                ):
+                    await self._async_checkpoint(full=True)
+                if legacy_source is not None:
+                    await legacy_source.async_remove()
+                finish_phase("write")
+            
                 _LOGGER.info("Loaded %d chores from storage", len(self._chores))
                 
             except Exception as err:
@@ -65,158 +280,609 @@ class ChoreStorage:
                 # Initialize empty storage on error
                 self._data = {"chores": {}, "metadata": {"version": STORAGE_VERSION}}
                 self._chores = {}
+                self._names.clear()
+            
+            finally:
+                # Start above any sequence number handed out before a restart,
+                # which holds while commits average under one per microsecond
+                version = max(self._snapshot.version, time.time_ns() // 1000)
+                self._snapshot = ChoreSnapshot.build(self._chores.values(), version)
+                self._snapshot_changes = {}
+                self._snapshot_trimmed = set()
+                self._change_feed.reset(self._snapshot.version)
+                timings["load_total"] = round(time.monotonic() - started, 3)
+                self._load_listeners = []
+                self._ready.set()
     
-    async def _migrate_data(self) -> None:
-        """Migrate data from older versions."""
-        current_version = self._data.get("metadata", {}).get("version", 1)
-        
-        if current_version < STORAGE_VERSION:
-            _LOGGER.info("Migrating storage from version %d to %d", current_version, STORAGE_VERSION)
+    async def _async_hydrate(self, raw_chores: Dict[str, Any]) -> None:
+        """Build chore objects in batches and hand each batch to load listeners."""
+        items = iter(raw_chores.items())
+        while batch_items := list(islice(items, LOAD_BATCH_SIZE)):
+            batch = []
+            for chore_id, chore_data in batch_items:
+                try:
+                    chore = Chore.from_dict(chore_data)
+                    self._chores[chore_id] = chore
+                    self._names.add(chore_id, chore.name)
+                    batch.append(chore)
+                except Exception as err:
+                    _LOGGER.error("Error loading chore %s: %s", chore_id, err)
             
-            # Add migration logic here as needed
-            self._data["metadata"]["version"] = STORAGE_VERSION
+            for listener in list(self._load_listeners):
+                try:
+                    listener(batch)
+                except Exception as err:
+                    _LOGGER.error("Error in storage load listener: %s", err)
             
-            # Save migrated data
-            await self._store.async_save(self._data)
+            # Let queued work run between batches
+            await asyncio.sleep(0)
+    
+    @property
+    def ready(self) -> bool:
+        """Return True once the initial load has finished."""
+        return self._ready.is_set()
+    
+    async def async_wait_ready(self) -> None:
+        """Wait until the initial load has finished."""
+        await self._ready.wait()
+    
+    @property
+    def startup_timings(self) -> Dict[str, float]:
+        """Return the duration in seconds of each startup phase."""
+        return dict(self._startup_timings)
+    
+    @callback
+    def async_add_load_listener(self, listener: LoadListener) -> Callable[[], None]:
+        """Register a listener for batches of chores hydrated during the initial load."""
+        self._load_listeners.append(listener)
+        
+        @callback
+        def remove_listener() -> None:
+            if listener in self._load_listeners:
+                self._load_listeners.remove(listener)
+        
+        return remove_listener
+    
+    async def _async_load_stored_data(
+        self,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[StorageBackend]]:
+        """Load stored data from the configured backend.
+        
+        If the configured backend is empty but another backend has data, that
+        data is returned together with its source so the caller can rewrite it
+        in the configured backend and then remove the old files.
+        """
+        stored_data = await self._backend.async_load()
+        if stored_data is not None:
+            return stored_data, None
+        
+        for source in available_backends(self._hass, exclude=self._backend, key=self._key):
+            stored_data = await source.async_load()
+            if stored_data is not None:
+                _LOGGER.info(
+                    "Migrating %s storage to %s storage", source.name, self._backend.name
+                )
+                return stored_data, source
+        return None, None
+    
+    async def _migrate_data(self) -> bool:
+        """Migrate data from older versions; returns True if data changed."""
+        metadata = self._data.setdefault("metadata", {})
+        if metadata.get("version", 1) >= STORAGE_VERSION:
+            return False
+        
+        self._migration_timings = await async_run_migrations(
+            self._hass, self._data, self._oplog, STORAGE_VERSION
+        )
+        return True
+    
+    async def async_close(self) -> None:
+        """Fold pending logged operations and release backend resources."""
+        async with self._lock:
+            if self._cancel_checkpoint is not None:
+                self._cancel_checkpoint()
+                self._cancel_checkpoint = None
+            if self._oplog.pending:
+                await self._async_checkpoint()
+        await self._backend.async_close()
     
     async def async_save(self) -> None:
         """Save data to storage."""
         async with self._lock:
+            await self._async_checkpoint(full=True)
+    
+    async def _async_checkpoint(self, full: bool = False) -> None:
+        """Fold logged operations into the backend. Caller must hold the lock.
+        
+        The backend write records the last folded sequence number, so a crash
+        before the log is truncated only causes already-applied records to be
+        skipped on replay.
+        """
+        self._data.setdefault("metadata", {})["oplog_seq"] = self._oplog.seq
+        await self._async_write(None if full else self._checkpoint_dirty)
+        self._checkpoint_dirty = set()
+        if self._oplog.pending:
+            await self._oplog.async_truncate()
+    
+    @callback
+    def _async_schedule_checkpoint(self) -> None:
+        """Schedule a checkpoint if none is pending."""
+        if self._cancel_checkpoint is not None:
+            return
+        
+        async def async_run_checkpoint(now) -> None:
+            self._cancel_checkpoint = None
+            async with self._lock:
+                if self._oplog.pending:
+                    await self._async_checkpoint()
+        
+        self._cancel_checkpoint = async_call_later(
+            self._hass, OPLOG_CHECKPOINT_INTERVAL, async_run_checkpoint
+        )
+    
+    async def _async_write(self, dirty: Optional[Set[str]] = None) -> None:
+        """Write the in-memory chores to the backend. Caller must hold the lock.
+        
+        Backends that support partial writes only persist the `dirty` chores;
+        None rewrites everything.
+        """
+        try:
+            written = await self._backend.async_save(
+                self._chores, self._data.setdefault("metadata", {}), dirty
+            )
+            _LOGGER.debug(
+                "Saved %d chores to %s storage (%d units written)",
+                len(self._chores),
+                self._backend.name,
+                written,
+            )
+            
+        except Exception as err:
+            _LOGGER.error("Error saving storage: %s", err)
+            raise
+    
+    def chore_lock(self, chore_id: str) -> asyncio.Lock:
+        """Return the lock guarding read-modify-write of a chore.
+        
+        Locks are striped by chore ID, so mutations of unrelated chores rarely
+        contend while mutations of the same chore are serialized. Hold at most
+        one stripe at a time; whole-store operations take every stripe.
+        """
+        return self._chore_locks[shard_for(chore_id, CHORE_LOCK_STRIPES)]
+    
+    @asynccontextmanager
+    async def _async_lock_all_chores(self):
+        """Hold every chore lock stripe, acquired in a fixed order."""
+        async with AsyncExitStack() as stack:
+            for lock in self._chore_locks:
+                await stack.enter_async_context(lock)
+            yield
+    
+    async def _async_commit(
+        self,
+        changed: Optional[Set[str]] = None,
+        removed: Optional[Set[str]] = None,
+        operation: str = OP_UPDATE,
+    ) -> None:
+        """Persist a mutation and publish its delta once it is durable.
+        
+        Mutations committed while a write is pending are coalesced into the
+        next write, so concurrent callers share one store commit. Inside the
+        calling task's async_batch the mutation is only noted and staged when
+        the batch exits. Must not be called with the storage lock held.
+        """
+        changed = changed or set()
+        removed = removed or set()
+        for chore_id in changed:
+            self._names.add(chore_id, self._chores[chore_id].name)
+        for chore_id in removed:
+            self._names.discard(chore_id)
+        
+        batch = self._batch.get()
+        if batch is not None and batch.open:
+            batch.operations.update(dict.fromkeys(changed, operation))
+            batch.operations.update(dict.fromkeys(removed, OP_REMOVE))
+            return
+        
+        self._stage(changed, removed, operation)
+        self._async_publish_snapshot()
+        await self._async_request_flush()
+    
+    def _stage(self, changed: Set[str], removed: Set[str], operation: str) -> None:
+        """Queue a mutation for the next snapshot and the next flush."""
+        # A chore counts as trimmed only if nothing else changed it since the last snapshot
+        if operation == OP_TRIM:
+            self._snapshot_trimmed |= changed - self._snapshot_changes.keys()
+        else:
+            self._snapshot_trimmed -= changed | removed
+        # Freeze now, like the log records below; the chore may change again
+        self._snapshot_changes.update(
+            (chore_id, self._chores[chore_id].freeze()) for chore_id in changed
+        )
+        self._snapshot_changes.update((chore_id, None) for chore_id in removed)
+        
+        if len(changed) + len(removed) >= OPLOG_CHECKPOINT_OPS:
+            # Large mutations are written straight to the backend
+            self._pending_direct = True
+        elif self._oplog_enabled:
+            # The frozen copy's record is shared with the snapshot's readers
+            self._pending_records.extend(
+                {"op": operation, "id": chore_id, "chore": self._snapshot_changes[chore_id].to_dict()}
+                for chore_id in changed
+            )
+            self._pending_records.extend({"op": OP_REMOVE, "id": chore_id} for chore_id in removed)
+        self._pending_changed = (self._pending_changed - removed) | changed
+        self._pending_removed = (self._pending_removed - changed) | removed
+    
+    @asynccontextmanager
+    async def async_batch(self):
+        """Defer commits made inside the block to one commit when it exits.
+        
+        Only commits made by the calling task, and by tasks it starts inside
+        the block, are deferred; other tasks keep committing on their own. A
+        block nested in another one joins it. Mutations inside the block
+        return before they are durable; the block exits once they all are.
+        """
+        current = self._batch.get()
+        if current is not None and current.open:
+            yield
+            return
+        
+        batch = _Batch()
+        token = self._batch.set(batch)
+        self._open_batches.append(batch)
+        try:
+            yield
+        finally:
+            self._batch.reset(token)
+            self._open_batches.remove(batch)
+            # Tasks started inside the block that commit later commit on their own
+            batch.open = False
+            self._async_stage_batch(batch.operations)
+        if batch.operations:
+            await self._async_request_flush()
+    
+    @callback
+    def _async_stage_batch(self, operations: Dict[str, str]) -> None:
+        """Stage a batch's mutations from the chores as they are now and publish them.
+        
+        Chores the batch changed but another task has since removed, and
+        chores it removed but another task has since added back, were
+        already committed by that task.
+        """
+        by_operation: Dict[str, Set[str]] = {}
+        for chore_id, operation in operations.items():
+            if (operation == OP_REMOVE) == (chore_id in self._chores):
+                continue
+            by_operation.setdefault(operation, set()).add(chore_id)
+        for operation, chore_ids in by_operation.items():
+            if operation == OP_REMOVE:
+                self._stage(set(), chore_ids, operation)
+            else:
+                self._stage(chore_ids, set(), operation)
+        self._async_publish_snapshot()
+    
+    async def _async_request_flush(self) -> None:
+        """Wait for the next flush, scheduling one if none is pending."""
+        if self._commit_future is None:
+            self._commit_future = asyncio.get_running_loop().create_future()
+            self._hass.async_create_task(self._async_flush_commits())
+        await asyncio.shield(self._commit_future)
+    
+    async def _async_flush_commits(self) -> None:
+        """Write every mutation queued since the last flush in one commit."""
+        async with self._lock:
+            future, self._commit_future = self._commit_future, None
+            changed, self._pending_changed = self._pending_changed, set()
+            removed, self._pending_removed = self._pending_removed, set()
+            records, self._pending_records = self._pending_records, []
+            direct, self._pending_direct = self._pending_direct, False
+            touched = changed | removed
+            
             try:
-                # Update data structure
-                self._data["chores"] = {
-                    chore_id: chore.to_dict()
-                    for chore_id, chore in self._chores.items()
-                }
-                
-                await self._store.async_save(self._data)
-                _LOGGER.debug("Saved %d chores to storage", len(self._chores))
-                
+                if self._oplog_enabled and not direct and len(records) < OPLOG_CHECKPOINT_OPS:
+                    await self._oplog.async_append(records)
+                    self._checkpoint_dirty |= touched
+                    if self._oplog.pending >= OPLOG_CHECKPOINT_OPS:
+                        await self._async_checkpoint()
+                    else:
+                        self._async_schedule_checkpoint()
+                else:
+                    self._checkpoint_dirty |= touched
+                    await self._async_checkpoint()
             except Exception as err:
-                _LOGGER.error("Error saving storage: %s", err)
-                raise
+                future.set_exception(err)
+                return
+            
+            future.set_result(None)
+        
+        self._async_notify_listeners(changed, removed)
     
     async def async_add_chore(self, chore: Chore) -> None:
         """Add a new chore."""
-        async with self._lock:
-            if chore.id in self._chores:
-                raise ValueError(f"Chore with ID {chore.id} already exists")
-            
-            self._chores[chore.id] = chore
-            await self.async_save()
+        if chore.id in self._chores:
+            raise ValueError(f"Chore with ID {chore.id} already exists")
+        if not self.name_available(chore.name):
+            raise ValueError(f"{ERROR_DUPLICATE_CHORE}: {chore.name}")
+        
+        self._chores[chore.id] = chore
+        await self._async_commit(changed={chore.id}, operation=OP_ADD)
     
     async def async_get_chore(self, chore_id: str) -> Optional[Chore]:
         """Get a chore by ID."""
         return self._chores.get(chore_id)
     
+    def find_by_name(self, name: str) -> List[Chore]:
+        """Return chores whose name matches ignoring case, accents and spacing."""
+        return [self._chores[chore_id] for chore_id in sorted(self._names.lookup(name))]
+    
+    def search_names(self, name: str, limit: int = 5) -> List[Tuple[Chore, float]]:
+        """Return the chores with the most similar names and their similarity."""
+        return [
+            (self._chores[chore_id], similarity)
+            for chore_id, similarity in self._names.search(name, limit)
+        ]
+    
+    def name_available(self, name: str, chore_id: Optional[str] = None) -> bool:
+        """Return whether a chore may take a name under the uniqueness setting."""
+        if not self._unique_names:
+            return True
+        return not self._names.lookup(name) - {chore_id}
+    
     async def async_get_all_chores(self) -> List[Chore]:
         """Get all chores."""
         return list(self._chores.values())
     
-    async def async_update_chore(self, chore: Chore) -> None:
-        """Update an existing chore."""
+    async def async_query_history(
+        self,
+        chore_ids: Optional[Iterable[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Query history entries in a time range across one or more chores.
+        
+        Each chore's window is located by binary search and the per-chore
+        slices are lazily merged by timestamp, so only offset + limit entries
+        are materialised regardless of how long the histories are. Entries
+        come from the current snapshot.
+        """
+        snapshot = self._snapshot
+        if chore_ids is None:
+            chores = list(snapshot.values())
+        else:
+            chores = [snapshot[chore_id] for chore_id in chore_ids if chore_id in snapshot]
+        
+        total = 0
+        streams = []
+        for chore in chores:
+            lo, hi = chore.get_history_bounds(start, end)
+            if hi <= lo:
+                continue
+            total += hi - lo
+            streams.append(self._iter_history_slice(chore, lo, hi))
+        
+        merged = heapq.merge(*streams, key=lambda item: item[0])
+        entries = [
+            {"chore_id": chore_id, **entry.to_dict()}
+            for _, chore_id, entry in islice(merged, offset, offset + limit)
+        ]
+        
+        return {
+            "entries": entries,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        }
+    
+    async def async_find_chores(
+        self,
+        state: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        category: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+    ) -> List[Chore]:
+        """Get read-only snapshot copies of chores matching all of the given filters.
+        
+        Chores are returned in ID order. due_before may be a date or a naive
+        or aware datetime; due dates are compared as timestamps. With the
+        SQLite backend the indexed queries pick the candidates from the
+        stored rows, and chores whose rows may not match the snapshot are
+        checked in memory, so both backends return the same chores.
+        """
+        due_before_ts = clock.timestamp(due_before) if due_before is not None else None
+        
+        def matches(chore: Chore) -> bool:
+            return (
+                (state is None or chore.state == state)
+                and (assigned_to is None or chore.assigned_to == assigned_to)
+                and (category is None or chore.metadata.category == category)
+                and (
+                    due_before_ts is None
+                    or (chore.due_date is not None and clock.timestamp(chore.due_date) < due_before_ts)
+                )
+            )
+        
+        if not isinstance(self._backend, SQLiteBackend):
+            snapshot = self._snapshot
+            return [snapshot[chore_id] for chore_id in sorted(snapshot) if matches(snapshot[chore_id])]
+        
+        # No flush writes rows while the lock is held, so the rows differ from
+        # the snapshot only for chores not written yet or held by open batches
         async with self._lock:
-            if chore.id not in self._chores:
-                raise ValueError(f"Chore with ID {chore.id} not found")
-            
-            self._chores[chore.id] = chore
-            await self.async_save()
+            snapshot = self._snapshot
+            unwritten = self._pending_changed | self._pending_removed | self._checkpoint_dirty
+            for batch in self._open_batches:
+                unwritten.update(batch.operations)
+            chore_ids = await self._backend.async_query_chore_ids(
+                state=state, assigned_to=assigned_to, category=category, due_before=due_before
+            )
+        matched = {
+            chore_id
+            for chore_id in unwritten.union(chore_ids)
+            if chore_id in snapshot and matches(snapshot[chore_id])
+        }
+        return [snapshot[chore_id] for chore_id in sorted(matched)]
+    
+    @staticmethod
+    def _iter_history_slice(chore: Chore, lo: int, hi: int):
+        """Yield (sort key, chore ID, entry) for a slice of a chore's history."""
+        for entry in islice(chore.history, lo, hi):
+            yield history_sort_key(entry), chore.id, entry
+    
+    async def async_update_chore(self, chore: Chore, operation: str = OP_UPDATE) -> None:
+        """Update an existing chore.
+        
+        Callers that read, modify and write back a chore should hold
+        chore_lock(chore.id) across the whole sequence.
+        """
+        if chore.id not in self._chores:
+            raise ValueError(f"Chore with ID {chore.id} not found")
+        if isinstance(chore, FrozenChore):
+            raise TypeError(f"Chore {chore.id} is a read-only snapshot copy")
+        
+        self._chores[chore.id] = chore
+        await self._async_commit(changed={chore.id}, operation=operation)
     
     async def async_remove_chore(self, chore_id: str) -> bool:
         """Remove a chore."""
-        async with self._lock:
-            if chore_id not in self._chores:
-                return False
-            
-            del self._chores[chore_id]
-            await self.async_save()
-            return True
+        if chore_id not in self._chores:
+            return False
+        
+        del self._chores[chore_id]
+        await self._async_commit(removed={chore_id}, operation=OP_REMOVE)
+        return True
+    
+    async def _async_get_backup_catalog(self) -> BackupCatalog:
+        """Return the backup catalog, importing old single-file backups once."""
+        if not self._backup_catalog_ready and self._household_id is None:
+            imported = await self._hass.async_add_executor_job(
+                self._backup_catalog.import_legacy_backups, self._hass.config.config_dir
+            )
+            if imported:
+                _LOGGER.info("Imported %d backup files into the backup catalog", imported)
+            self._backup_catalog_ready = True
+        return self._backup_catalog
     
     async def async_create_backup(self) -> str:
-        """Create a backup of the current data."""
+        """Create a backup of the current data; returns the backup name."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"{BACKUP_FILENAME_PREFIX}_{timestamp}{BACKUP_EXTENSION}"
-            backup_path = os.path.join(self._hass.config.config_dir, backup_filename)
+            snapshot = self._snapshot
             
-            backup_data = {
-                "timestamp": datetime.now().isoformat(),
-                "version": STORAGE_VERSION,
-                "chores": {
-                    chore_id: chore.to_dict()
-                    for chore_id, chore in self._chores.items()
-                }
-            }
+            async with self._backup_lock:
+                catalog = await self._async_get_backup_catalog()
+                # The snapshot never changes, so it is serialized in the executor
+                entry = await self._hass.async_add_executor_job(
+                    self._create_backup_from_snapshot, catalog, snapshot
+                )
             
-            with open(backup_path, 'w') as f:
-                json.dump(backup_data, f, indent=2)
-            
-            _LOGGER.info("Created backup: %s", backup_filename)
-            return backup_filename
+            _LOGGER.info("Created backup: %s", entry["name"])
+            return entry["name"]
             
         except Exception as err:
             _LOGGER.error("Error creating backup: %s", err)
             raise
     
-    async def async_restore_backup(self, backup_filename: str) -> bool:
-        """Restore from a backup file."""
-        try:
+    @staticmethod
+    def _create_backup_from_snapshot(
+        catalog: BackupCatalog, snapshot: ChoreSnapshot
+    ) -> Dict[str, Any]:
+        """Serialize a snapshot into a new backup; runs in the executor."""
+        records = {chore_id: chore.to_dict() for chore_id, chore in snapshot.items()}
+        return catalog.create_backup(records, STORAGE_VERSION)
+    
+    async def async_list_backups(self) -> List[Dict[str, Any]]:
+        """List backups from the catalog manifest, oldest first."""
+        async with self._backup_lock:
+            catalog = await self._async_get_backup_catalog()
+            return await self._hass.async_add_executor_job(catalog.list_backups)
+    
+    async def async_restore_backup(
+        self, backup_filename: str, chunk_size: int = BACKUP_RESTORE_CHUNK_SIZE
+    ) -> bool:
+        """Restore from a backup file.
+        
+        The backup is parsed and validated in the executor, chunk_size chores
+        at a time, with a progress event after each chunk. The current chores
+        are only replaced once every record has been validated.
+        """
+        restored_chores: Dict[str, Chore] = {}
+        
+        async with self._backup_lock:
+            catalog = await self._async_get_backup_catalog()
+            reader = await self._hass.async_add_executor_job(catalog.open_reader, backup_filename)
+        if reader is None:
+            # Fall back to a single-file backup in the config directory
             backup_path = os.path.join(self._hass.config.config_dir, backup_filename)
-            
-            if not os.path.exists(backup_path):
-                _LOGGER.error("Backup file not found: %s", backup_filename)
+            reader = StreamingBackupReader(backup_path)
+            if not await self._hass.async_add_executor_job(os.path.exists, backup_path):
+                _LOGGER.error("Backup not found: %s", backup_filename)
                 return False
+        
+        try:
             
-            with open(backup_path, 'r') as f:
-                backup_data = json.load(f)
-            
-            # Validate backup data
-            if "chores" not in backup_data:
-                _LOGGER.error("Invalid backup format")
-                return False
-            
-            # Load chores from backup
-            restored_chores = {}
-            for chore_id, chore_data in backup_data["chores"].items():
-                try:
-                    chore = Chore.from_dict(chore_data)
-                    restored_chores[chore_id] = chore
-                except Exception as err:
-                    _LOGGER.error("Error restoring chore %s: %s", chore_id, err)
-            
-            # Replace current data
-            async with self._lock:
-                self._chores = restored_chores
-                await self.async_save()
-            
-            _LOGGER.info("Restored %d chores from backup: %s", len(restored_chores), backup_filename)
-            return True
+            await self._hass.async_add_executor_job(reader.open)
+            while not reader.done:
+                chunk = await self._hass.async_add_executor_job(reader.read_chores, chunk_size)
+                for chore in chunk:
+                    restored_chores[chore.id] = chore
+                self._fire_restore_progress(backup_filename, reader, len(restored_chores))
             
         except Exception as err:
-            _LOGGER.error("Error restoring backup: %s", err)
+            _LOGGER.error("Error restoring backup %s: %s", backup_filename, err)
+            self._fire_restore_progress(
+                backup_filename, reader, len(restored_chores), error=str(err)
+            )
             return False
+        
+        finally:
+            await self._hass.async_add_executor_job(reader.close)
+        
+        # Replace current data once in-flight chore updates have finished
+        async with self._async_lock_all_chores():
+            removed = set(self._chores) - set(restored_chores)
+            self._chores = restored_chores
+            await self._async_commit(changed=set(restored_chores), removed=removed)
+        
+        self._fire_restore_progress(
+            backup_filename, reader, len(restored_chores), completed=True
+        )
+        _LOGGER.info("Restored %d chores from backup: %s", len(restored_chores), backup_filename)
+        return True
+    
+    @callback
+    def _fire_restore_progress(
+        self,
+        backup_filename: str,
+        reader: Union[StreamingBackupReader, CatalogBackupReader],
+        restored: int,
+        completed: bool = False,
+        error: Optional[str] = None,
+    ) -> None:
+        """Fire a restore progress event."""
+        self._hass.bus.async_fire(EVENT_RESTORE_PROGRESS, {
+            "backup": backup_filename,
+            "restored": restored,
+            "bytes_read": reader.bytes_read,
+            "total_bytes": reader.total_bytes,
+            "completed": completed,
+            "error": error,
+        })
     
     async def async_cleanup_old_backups(self, retention_days: int = CONF_BACKUP_RETENTION_DAYS) -> int:
-        """Clean up old backup files."""
+        """Clean up old backups."""
         try:
-            backup_dir = self._hass.config.config_dir
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
-            
-            removed_count = 0
-            for filename in os.listdir(backup_dir):
-                if filename.startswith(BACKUP_FILENAME_PREFIX) and filename.endswith(BACKUP_EXTENSION):
-                    file_path = os.path.join(backup_dir, filename)
-                    
-                    try:
-                        file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                        if file_time < cutoff_date:
-                            os.remove(file_path)
-                            removed_count += 1
-                    except Exception as err:
-                        _LOGGER.error("Error processing backup file %s: %s", filename, err)
+            cutoff_date = clock.now() - timedelta(days=retention_days)
+            
+            async with self._backup_lock:
+                catalog = await self._async_get_backup_catalog()
+                removed_count = await self._hass.async_add_executor_job(
+                    catalog.cleanup, cutoff_date
+                )
             
             if removed_count > 0:
-                _LOGGER.info("Cleaned up %d old backup files", removed_count)
+                _LOGGER.info("Cleaned up %d old backups", removed_count)
             
             return removed_count
             
@@ -227,7 +893,17 @@ class ChoreStorage:
     async def async_get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics."""
         return {
+            "household": self._household_id,
             "total_chores": len(self._chores),
             "storage_version": self._data.get("metadata", {}).get("version", STORAGE_VERSION),
-            "last_updated": datetime.now().isoformat(),
+            "storage_backend": self._backend.name,
+            "storage_shards": getattr(self._backend, "shard_count", 0),
+            "operation_log": self._oplog_enabled,
+            "pending_operations": self._oplog.pending,
+            "last_migration": self._migration_timings,
+            "ready": self.ready,
+            "snapshot_version": self._snapshot.version,
+            "change_feed": self._change_feed.metrics,
+            "startup_timings": self.startup_timings,
+            "last_updated": clock.now().isoformat(),
         }
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""To-do list platform for the Chore Assistant."""
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import slugify
+
+from . import clock
+from .models import Chore
+from .const import (
+    DOMAIN,
+    ATTR_HOUSEHOLD,
+    CONF_TODO_GROUPING,
+    COMMAND_COMPLETE,
+    COMMAND_RESET,
+    REPORT_GROUP_CATEGORY,
+    REPORT_GROUP_ASSIGNEE,
+    STATE_COMPLETED,
+    STATE_OVERDUE,
+)
+
+if TYPE_CHECKING:
+    from .household import Household
+
+_LOGGER = logging.getLogger(__name__)
+
+UNASSIGNED_LIST = "Unassigned"
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: Optional[DiscoveryInfoType] = None,
+) -> None:
+    """Set up the Chore Assistant to-do lists for the YAML household."""
+    if discovery_info is None:
+        return
+    household = hass.data[DOMAIN]["households"][discovery_info[ATTR_HOUSEHOLD]]
+    ChoreTodoLists(household, async_add_entities).async_start()
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Chore Assistant to-do lists for a config entry's household."""
+    household = hass.data[DOMAIN]["households"][entry.entry_id]
+    ChoreTodoLists(household, async_add_entities).async_start()
+
+
+def _todo_item(chore: Chore) -> TodoItem:
+    """Build the to-do item for a chore."""
+    return TodoItem(
+        uid=chore.id,
+        summary=chore.name,
+        status=(
+            TodoItemStatus.COMPLETED
+            if chore.state == STATE_COMPLETED
+            else TodoItemStatus.NEEDS_ACTION
+        ),
+        due=clock.local_day(chore.due_date) if chore.due_date else None,
+        description="Overdue" if chore.state == STATE_OVERDUE else None,
+    )
+
+
+class ChoreTodoLists:
+    """Keeps one to-do list per assignee or category of a household.
+
+    Chores are indexed by list. A storage delta only rebuilds the items of
+    the chores it names, moves them between lists when their assignee or
+    category changed, and writes state only for the lists whose items
+    actually differ. A list is created the first time a group appears.
+    """
+
+    def __init__(self, household: "Household", async_add_entities: AddEntitiesCallback):
+        """Initialize the lists."""
+        self._household = household
+        self._async_add_entities = async_add_entities
+        self._grouping = household.conf.get(CONF_TODO_GROUPING, REPORT_GROUP_ASSIGNEE)
+        self._lists: Dict[str, "ChoreTodoList"] = {}
+        self._list_of: Dict[str, str] = {}
+
+    def _group(self, chore: Chore) -> str:
+        """Return the list a chore belongs on."""
+        if self._grouping == REPORT_GROUP_CATEGORY:
+            return chore.metadata.category
+        return chore.assigned_to or UNASSIGNED_LIST
+
+    @callback
+    def async_start(self) -> None:
+        """Index the chores loaded so far and follow later changes."""
+        storage = self._household.storage
+        self._async_apply(set(storage.chores), set())
+        self._household.async_on_stop(storage.async_add_listener(self._async_apply))
+        if not storage.ready:
+            storage.async_add_load_listener(
+                lambda chores: self._async_apply({chore.id for chore in chores}, set())
+            )
+
+    @callback
+    def _async_apply(self, changed: Set[str], removed: Set[str]) -> None:
+        """Apply a storage delta to the lists."""
+        chores = self._household.storage.chores
+        touched: Set[str] = set()
+        new_lists: List[ChoreTodoList] = []
+
+        for chore_id in sorted(changed | removed):
+            chore = chores.get(chore_id)
+            old_group = self._list_of.get(chore_id)
+            new_group = self._group(chore) if chore is not None else None
+
+            if old_group is not None and old_group != new_group:
+                self._lists[old_group].items.pop(chore_id, None)
+                del self._list_of[chore_id]
+                touched.add(old_group)
+            if new_group is None:
+                continue
+
+            todo_list = self._lists.get(new_group)
+            if todo_list is None:
+                todo_list = ChoreTodoList(self._household, new_group)
+                self._lists[new_group] = todo_list
+                new_lists.append(todo_list)
+            item = _todo_item(chore)
+            if todo_list.items.get(chore_id) != item:
+                todo_list.items[chore_id] = item
+                touched.add(new_group)
+            self._list_of[chore_id] = new_group
+
+        if new_lists:
+            self._async_add_entities(new_lists)
+        for group in touched:
+            todo_list = self._lists[group]
+            if todo_list.hass is not None and todo_list not in new_lists:
+                todo_list.async_write_ha_state()
+
+
+class ChoreTodoList(TodoListEntity):
+    """A household's chores for one assignee or category."""
+
+    _attr_icon = "mdi:broom"
+    _attr_supported_features = TodoListEntityFeature.UPDATE_TODO_ITEM
+
+    def __init__(self, household: "Household", group: str) -> None:
+        """Initialize the list."""
+        self._household = household
+        self.items: Dict[str, TodoItem] = {}
+        self._attr_unique_id = f"chore_assistant_todo_{household.id}_{slugify(group)}"
+        self._attr_name = f"{household.name} {group} chores"
+
+    @property
+    def todo_items(self) -> List[TodoItem]:
+        """Return the list's items."""
+        return list(self.items.values())
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Check off or reopen a chore."""
+        if item.uid not in self.items:
+            raise HomeAssistantError(f"Chore {item.uid} is not on this list")
+        if item.status == self.items[item.uid].status:
+            return
+
+        kind = COMMAND_COMPLETE if item.status == TodoItemStatus.COMPLETED else COMMAND_RESET
+        await self._household.command_queue.async_submit(kind, item.uid, {})
@@ -0,0 +1,149 @@
+"""Service call trace recording for Chore Assistant integration."""
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from . import clock
+from .const import (
+    TRACE_DIRECTORY,
+    TRACE_EXTENSION,
+    TRACE_FORMAT_VERSION,
+    TRACE_FLUSH_INTERVAL,
+    TRACE_FLUSH_SIZE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _encode(record: Dict[str, Any]) -> str:
+    """Serialize one trace line; dates and other values become strings."""
+    return json.dumps(record, separators=(",", ":"), default=str)
+
+
+class ServiceCallTracer:
+    """Records service calls to a JSON lines trace file while started.
+
+    The first line holds every household's chores at the start, so a trace
+    can be replayed against the same data. Each call then adds one line:
+    t (epoch seconds), s (service), d (call data), ms (handler duration),
+    and r (result) or e (error) when there is one. Lines are buffered and
+    appended in the executor every few seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize a stopped tracer."""
+        self._hass = hass
+        self._path: Optional[str] = None
+        self._buffer: List[str] = []
+        self._calls = 0
+        self._cancel_flush: Optional[Callable[[], None]] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether calls are being recorded."""
+        return self._path is not None
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Return the trace file and how many calls it holds."""
+        return {"path": self._path, "calls": self._calls}
+
+    async def async_start(
+        self, chores: Dict[str, Dict[str, Any]], names: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Start a new trace file whose header holds the given chore records.
+
+        chores maps each household ID to its chores' stored records, and
+        names each household ID to its name, so calls naming a household
+        can be replayed.
+        """
+        if self.enabled:
+            await self.async_stop()
+
+        started = clock.now()
+        directory = self._hass.config.path(TRACE_DIRECTORY)
+        path = os.path.join(directory, f"trace_{started.strftime('%Y%m%d_%H%M%S')}{TRACE_EXTENSION}")
+        header = {
+            "v": TRACE_FORMAT_VERSION,
+            "t": started.timestamp(),
+            "households": chores,
+            "names": names or {},
+        }
+        await self._hass.async_add_executor_job(self._write, path, _encode(header) + "\n", "w")
+        self._path = path
+        self._calls = 0
+        _LOGGER.info("Recording service calls to %s", path)
+        return path
+
+    async def async_stop(self) -> Dict[str, Any]:
+        """Write any buffered calls and close the trace."""
+        if not self.enabled:
+            return self.metrics
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        await self._async_flush()
+        metrics = self.metrics
+        self._path = None
+        _LOGGER.info("Stopped recording service calls after %d calls", metrics["calls"])
+        return metrics
+
+    @callback
+    def async_record(
+        self,
+        service: str,
+        data: Dict[str, Any],
+        timestamp: float,
+        duration: float,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Buffer one call; duration is in seconds."""
+        if not self.enabled:
+            return
+        record: Dict[str, Any] = {
+            "t": round(timestamp, 3),
+            "s": service,
+            "d": dict(data),
+            "ms": round(duration * 1000, 3),
+        }
+        if result is not None:
+            record["r"] = result
+        if error is not None:
+            record["e"] = str(error) or type(error).__name__
+        self._buffer.append(_encode(record))
+        self._calls += 1
+
+        if len(self._buffer) >= TRACE_FLUSH_SIZE:
+            self._hass.async_create_task(self._async_flush())
+        elif self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self._hass, TRACE_FLUSH_INTERVAL, self._async_scheduled_flush
+            )
+
+    async def _async_scheduled_flush(self, now) -> None:
+        """Flush after the interval."""
+        self._cancel_flush = None
+        await self._async_flush()
+
+    async def _async_flush(self) -> None:
+        """Append buffered lines to the trace file."""
+        if not self._buffer or self._path is None:
+            return
+        text = "\n".join(self._buffer) + "\n"
+        self._buffer = []
+        try:
+            await self._hass.async_add_executor_job(self._write, self._path, text, "a")
+        except OSError as err:
+            _LOGGER.error("Error writing service call trace: %s", err)
+
+    @staticmethod
+    def _write(path: str, text: str, mode: str) -> None:
+        """Write to the trace file in the executor."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, mode, encoding="utf-8") as file:
+            file.write(text)
@@ -2,8 +2,43 @@
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
 from datetime import datetime, date
+import os
 
 from .const import (
+    DOMAIN,
+    CONF_STORAGE_BACKEND,
+    CONF_STORAGE_SHARDS,
+    CONF_OPERATION_LOG,
+    CONF_DIGEST,
+    CONF_DIGEST_WINDOW,
+    CONF_DUE_SOON_DAYS,
+    CONF_MEMBERS,
+    CONF_ASSIGNMENT_POLICY,
+    CONF_ASSIGNMENT_WINDOW,
+    CONF_TODO_GROUPING,
+    CONF_MAX_CHORE_BYTES,
+    CONF_MAX_HISTORY_ENTRIES,
+    CONF_BUDGET_ACTION,
+    CONF_UNIQUE_NAMES,
+    BUDGET_ACTION_WARN,
+    VALID_BUDGET_ACTIONS,
+    DEFAULT_MAX_CHORE_BYTES,
+    DEFAULT_MAX_HISTORY_ENTRIES,
+    DEFAULT_ANALYZE_LIMIT,
+    MAX_ANALYZE_LIMIT,
+    ASSIGNMENT_LEAST_LOADED,
+    VALID_ASSIGNMENT_POLICIES,
+    DEFAULT_ASSIGNMENT_WINDOW,
+    MAX_ASSIGNMENT_WINDOW,
+    STORAGE_BACKEND_JSON,
+    VALID_STORAGE_BACKENDS,
+    VALID_STATES,
+    DEFAULT_STORAGE_SHARDS,
+    MAX_STORAGE_SHARDS,
+    DEFAULT_DIGEST_WINDOW,
+    MAX_DIGEST_WINDOW,
+    DEFAULT_DUE_SOON_DAYS,
+    MAX_DUE_SOON_DAYS,
     ATTR_CHORE_ID,
     ATTR_CHORE_NAME,
     ATTR_INTERVAL_DAYS,
@@ -13,6 +48,25 @@ from .const import (
     ATTR_CATEGORY,
     ATTR_ESTIMATED_DURATION,
     ATTR_NOTES,
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_HOUSEHOLD,
+    ATTR_POLICY,
+    ATTR_SINCE,
+    ATTR_STATE,
+    ATTR_BACKUP,
+    ATTR_START,
+    ATTR_END,
+    ATTR_LIMIT,
+    ATTR_OFFSET,
+    ATTR_GROUP_BY,
+    ATTR_GROUP,
+    ATTR_DAYS,
+    DEFAULT_HISTORY_LIMIT,
+    DEFAULT_REPORT_DAYS,
+    MAX_REPORT_DAYS,
+    REPORT_GROUP_ASSIGNEE,
+    VALID_REPORT_GROUPS,
+    MAX_HISTORY_LIMIT,
     MIN_CHORE_NAME_LENGTH,
     MAX_CHORE_NAME_LENGTH,
     MIN_INTERVAL_DAYS,
@@ -76,6 +130,56 @@ def validate_due_date(value):
     
     return value
 
+def validate_backup_filename(value):
+    """Validate a backup file name."""
+    value = cv.string(value)
+    if not value or os.path.basename(value) != value or value.startswith("."):
+        raise vol.Invalid("Backup must be a file name without a directory")
+    return value
+
+# Integration configuration schema
+CHORE_ASSISTANT_CONFIG_SCHEMA = vol.Schema({
+    vol.Optional(CONF_STORAGE_BACKEND, default=STORAGE_BACKEND_JSON): vol.In(
+        VALID_STORAGE_BACKENDS
+    ),
+    vol.Optional(CONF_STORAGE_SHARDS, default=DEFAULT_STORAGE_SHARDS): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_STORAGE_SHARDS)
+    ),
+    vol.Optional(CONF_OPERATION_LOG, default=False): cv.boolean,
+    vol.Optional(CONF_DIGEST, default=False): cv.boolean,
+    vol.Optional(CONF_DIGEST_WINDOW, default=DEFAULT_DIGEST_WINDOW): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_DIGEST_WINDOW)
+    ),
+    vol.Optional(CONF_DUE_SOON_DAYS, default=DEFAULT_DUE_SOON_DAYS): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_DUE_SOON_DAYS)
+    ),
+    vol.Optional(CONF_MEMBERS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(CONF_ASSIGNMENT_POLICY, default=ASSIGNMENT_LEAST_LOADED): vol.In(
+        VALID_ASSIGNMENT_POLICIES
+    ),
+    vol.Optional(CONF_ASSIGNMENT_WINDOW, default=DEFAULT_ASSIGNMENT_WINDOW): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_ASSIGNMENT_WINDOW)
+    ),
+    vol.Optional(CONF_TODO_GROUPING, default=REPORT_GROUP_ASSIGNEE): vol.In(
+        VALID_REPORT_GROUPS
+    ),
+    vol.Optional(CONF_MAX_CHORE_BYTES, default=DEFAULT_MAX_CHORE_BYTES): vol.All(
+        vol.Coerce(int), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_MAX_HISTORY_ENTRIES, default=DEFAULT_MAX_HISTORY_ENTRIES): vol.All(
+        vol.Coerce(int), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_BUDGET_ACTION, default=BUDGET_ACTION_WARN): vol.In(
+        VALID_BUDGET_ACTIONS
+    ),
+    vol.Optional(CONF_UNIQUE_NAMES, default=False): cv.boolean,
+})
+
+CONFIG_SCHEMA = vol.Schema(
+    {DOMAIN: vol.All(lambda value: value or {}, CHORE_ASSISTANT_CONFIG_SCHEMA)},
+    extra=vol.ALLOW_EXTRA,
+)
+
 # Service schemas
 ADD_CHORE_SCHEMA = vol.Schema({
     vol.Required(ATTR_CHORE_NAME): validate_chore_name,
@@ -85,21 +189,41 @@ ADD_CHORE_SCHEMA = vol.Schema({
     vol.Optional(ATTR_PRIORITY, default="medium"): validate_priority,
     vol.Optional(ATTR_CATEGORY, default="general"): cv.string,
     vol.Optional(ATTR_ESTIMATED_DURATION, default=30): validate_estimated_duration,
+    vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
 })
 
-REMOVE_CHORE_SCHEMA = vol.Schema({
-    vol.Required(ATTR_CHORE_ID): cv.string,
-})
+REMOVE_CHORE_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Exclusive(ATTR_CHORE_ID, "chore"): cv.string,
+        vol.Exclusive(ATTR_CHORE_NAME, "chore"): cv.string,
+        vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
+        vol.Optional(ATTR_HOUSEHOLD): cv.string,
+    }),
+    cv.has_at_least_one_key(ATTR_CHORE_ID, ATTR_CHORE_NAME),
+)
 
-COMPLETE_CHORE_SCHEMA = vol.Schema({
-    vol.Required(ATTR_CHORE_ID): cv.string,
-    vol.Optional(ATTR_NOTES): cv.string,
-})
+COMPLETE_CHORE_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Exclusive(ATTR_CHORE_ID, "chore"): cv.string,
+        vol.Exclusive(ATTR_CHORE_NAME, "chore"): cv.string,
+        vol.Optional(ATTR_NOTES): cv.string,
+        vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
+        vol.Optional(ATTR_HOUSEHOLD): cv.string,
+    }),
+    cv.has_at_least_one_key(ATTR_CHORE_ID, ATTR_CHORE_NAME),
+)
 
-RESET_CHORE_SCHEMA = vol.Schema({
-    vol.Required(ATTR_CHORE_ID): cv.string,
-    vol.Optional(ATTR_NOTES): cv.string,
-})
+RESET_CHORE_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Exclusive(ATTR_CHORE_ID, "chore"): cv.string,
+        vol.Exclusive(ATTR_CHORE_NAME, "chore"): cv.string,
+        vol.Optional(ATTR_NOTES): cv.string,
+        vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
+        vol.Optional(ATTR_HOUSEHOLD): cv.string,
+    }),
+    cv.has_at_least_one_key(ATTR_CHORE_ID, ATTR_CHORE_NAME),
+)
 
 UPDATE_CHORE_SCHEMA = vol.Schema({
     vol.Required(ATTR_CHORE_ID): cv.string,
@@ -110,12 +234,75 @@ UPDATE_CHORE_SCHEMA = vol.Schema({
     vol.Optional(ATTR_PRIORITY): validate_priority,
     vol.Optional(ATTR_CATEGORY): cv.string,
     vol.Optional(ATTR_ESTIMATED_DURATION): validate_estimated_duration,
+    vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
 })
 
 GET_CHORE_SCHEMA = vol.Schema({
     vol.Required(ATTR_CHORE_ID): cv.string,
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+RESTORE_BACKUP_SCHEMA = vol.Schema({
+    vol.Required(ATTR_BACKUP): validate_backup_filename,
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
 })
 
-LIST_CHORES_SCHEMA = vol.Schema({})
+LIST_CHORES_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_STATE): vol.In(VALID_STATES),
+    vol.Optional(ATTR_ASSIGNED_TO): cv.string,
+    vol.Optional(ATTR_CATEGORY): cv.string,
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+QUERY_HISTORY_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CHORE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_START): cv.datetime,
+    vol.Optional(ATTR_END): cv.datetime,
+    vol.Optional(ATTR_LIMIT, default=DEFAULT_HISTORY_LIMIT): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_HISTORY_LIMIT)
+    ),
+    vol.Optional(ATTR_OFFSET, default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+GET_REPORT_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_GROUP_BY, default=REPORT_GROUP_ASSIGNEE): vol.In(VALID_REPORT_GROUPS),
+    vol.Optional(ATTR_GROUP): cv.string,
+    vol.Optional(ATTR_DAYS, default=DEFAULT_REPORT_DAYS): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_REPORT_DAYS)
+    ),
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+GET_FORECAST_SCHEMA = vol.Schema({
+    vol.Exclusive(ATTR_CHORE_ID, "chore"): cv.string,
+    vol.Exclusive(ATTR_CHORE_NAME, "chore"): cv.string,
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+REBALANCE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_POLICY): vol.In(VALID_ASSIGNMENT_POLICIES),
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+ANALYZE_STORAGE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_LIMIT, default=DEFAULT_ANALYZE_LIMIT): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_ANALYZE_LIMIT)
+    ),
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+GET_CHANGES_SCHEMA = vol.Schema({
+    vol.Required(ATTR_SINCE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
+
+TRACE_SCHEMA = vol.Schema({})
+
+CHECK_OVERDUE_SCHEMA = vol.Schema({})
 
-CHECK_OVERDUE_SCHEMA = vol.Schema({})
\ No newline at end of file
+# Services that only take a household target
+HOUSEHOLD_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_HOUSEHOLD): cv.string,
+})
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""WebSocket API for Chore Assistant integration."""
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    ATTR_HOUSEHOLD,
+    WS_TYPE_CHORES,
+    WS_TYPE_SUBSCRIBE,
+)
+
+if TYPE_CHECKING:
+    from .household import Household
+    from .storage import ChoreStorage
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the chore board commands."""
+    websocket_api.async_register_command(hass, websocket_chores)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _get_household(hass: HomeAssistant, target: Optional[str]) -> Optional["Household"]:
+    """Return a household by config entry ID or name, or the only one."""
+    households: Dict[str, "Household"] = hass.data[DOMAIN]["households"]
+    if target is None:
+        return next(iter(households.values())) if len(households) == 1 else None
+    return households.get(target) or next(
+        (item for item in households.values() if item.name.casefold() == target.casefold()),
+        None,
+    )
+
+
+def _full_state(storage: "ChoreStorage") -> Dict[str, Any]:
+    """Return every chore's compact fields and the sequence number they are at."""
+    return {
+        "seq": storage.change_seq,
+        "resync": True,
+        "chores": {
+            chore_id: chore.to_compact_dict() for chore_id, chore in storage.snapshot.items()
+        },
+    }
+
+
+async def _async_get_storage(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> Optional["ChoreStorage"]:
+    """Return the loaded storage of the message's household, or send an error."""
+    household = _get_household(hass, msg.get(ATTR_HOUSEHOLD))
+    if household is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Unknown household: {msg[ATTR_HOUSEHOLD]}"
+            if ATTR_HOUSEHOLD in msg
+            else "Several households are configured; choose one with household",
+        )
+        return None
+    await household.storage.async_wait_ready()
+    return household.storage
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): WS_TYPE_CHORES,
+    vol.Optional(ATTR_HOUSEHOLD): str,
+})
+@websocket_api.async_response
+async def websocket_chores(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> None:
+    """Return every chore of a household in one message."""
+    storage = await _async_get_storage(hass, connection, msg)
+    if storage is not None:
+        connection.send_result(msg["id"], _full_state(storage))
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): WS_TYPE_SUBSCRIBE,
+    vol.Optional(ATTR_HOUSEHOLD): str,
+})
+@websocket_api.async_response
+async def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> None:
+    """Send every chore of a household, then the fields that change as commits happen.
+
+    Each event after the first holds one commit's delta from the change
+    feed. If the subscriber falls out of the feed, the next event holds
+    every chore again with resync set.
+    """
+    storage = await _async_get_storage(hass, connection, msg)
+    if storage is None:
+        return
+    seq = storage.change_seq
+
+    @callback
+    def forward_changes(changed, removed) -> None:
+        """Send the deltas committed since the last event."""
+        nonlocal seq
+        records = storage.changes_since(seq)
+        if records is None:
+            _LOGGER.debug("Subscriber %s fell behind the change feed; resyncing", msg["id"])
+            connection.send_message(websocket_api.event_message(msg["id"], _full_state(storage)))
+        else:
+            for record in records:
+                connection.send_message(websocket_api.event_message(msg["id"], record.to_dict()))
+        seq = storage.change_seq
+
+    connection.subscriptions[msg["id"]] = storage.async_add_listener(forward_changes)
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], _full_state(storage)))
@@ -0,0 +1,94 @@
+"""Measure Store write amplification for the single-file and sharded layouts.
+
+Usage: python scripts/benchmark_storage.py [--chores 2000] [--history 20]
+                                           [--saves 200] [--shards 16]
+
+Each save updates one random chore, which is the common case for service
+calls. Write amplification is the bytes written per save divided by the
+serialized size of the chore that actually changed.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import ha_standin
+
+models = ha_standin.load_integration_module("models")
+storage_module = ha_standin.load_integration_module("storage")
+
+
+def build_chores(count: int, history: int):
+    """Generate chores with a few weeks of history each."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    chores = []
+    for index in range(count):
+        chore = models.Chore(
+            id=f"{index:08x}",
+            name=f"Chore {index}",
+            state="pending",
+            created_date=start,
+            due_date=start + timedelta(days=7),
+            assigned_to=random.choice(["alex", "sam", "jordan", "casey"]),
+        )
+        for step in range(history):
+            chore.history.append(
+                models.ChoreHistoryEntry(
+                    timestamp=start + timedelta(days=step),
+                    action="completed",
+                    previous_state="pending",
+                    new_state="completed",
+                )
+            )
+        chores.append(chore)
+    return chores
+
+
+async def run_layout(label: str, shard_count: int, args) -> None:
+    """Populate storage in one layout and time single-chore saves."""
+    random.seed(args.seed)
+    ha_standin.Store.reset()
+    hass = ha_standin.HomeAssistant()
+    storage = storage_module.ChoreStorage(hass, shard_count=shard_count)
+    await storage.async_load()
+
+    chores = build_chores(args.chores, args.history)
+    storage._chores = {chore.id: chore for chore in chores}
+    await storage.async_save()
+
+    ha_standin.Store.writes.clear()
+    changed_bytes = 0
+    started = time.perf_counter()
+    for _ in range(args.saves):
+        chore = random.choice(chores)
+        chore.add_history_entry("updated", notes="benchmark")
+        changed_bytes += len(json.dumps(chore.to_dict()))
+        await storage.async_update_chore(chore)
+    elapsed = time.perf_counter() - started
+
+    written = sum(size for _, size in ha_standin.Store.writes)
+    print(
+        f"{label:<18} {written / args.saves:>14,.0f} {written / changed_bytes:>10.1f}x"
+        f" {len(ha_standin.Store.writes) / args.saves:>12.1f} {elapsed / args.saves * 1000:>10.2f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chores", type=int, default=2000)
+    parser.add_argument("--history", type=int, default=20)
+    parser.add_argument("--saves", type=int, default=200)
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.chores} chores, {args.history} history entries each, {args.saves} saves")
+    print(f"{'layout':<18} {'bytes/save':>14} {'amplif.':>11} {'files/save':>12} {'ms/save':>10}")
+    await run_layout("single file", 0, args)
+    await run_layout(f"{args.shards} shards", args.shards, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
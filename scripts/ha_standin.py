@@ -0,0 +1,201 @@
+"""Local stand-ins for the parts of Home Assistant used by Chore Assistant.
+
+Offline tools (benchmarks, simulations, replays) use these to drive the
+integration's storage and state management without a running Home
+Assistant instance. Call install() before importing the integration, then
+load_integration_module() to import submodules without running the
+integration's setup code.
+"""
+import asyncio
+import importlib
+import json
+import os
+import sys
+import types
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.chore_assistant"
+
+
+class Store:
+    """Replacement for homeassistant.helpers.storage.Store.
+
+    Keeps files in memory unless use_directory() points it at a Home
+    Assistant config directory, and records every write so tools can
+    measure how many bytes a save costs.
+    """
+
+    files: Dict[str, str] = {}
+    writes: List[Tuple[str, int]] = []
+    directory: Optional[str] = None
+
+    def __init__(self, hass, version, key, private=False, atomic_writes=False, minor_version=1):
+        self.hass = hass
+        self.version = version
+        self.key = key
+
+    @property
+    def path(self) -> Optional[str]:
+        if Store.directory is None:
+            return None
+        return os.path.join(Store.directory, ".storage", self.key)
+
+    async def async_load(self) -> Optional[Any]:
+        if self.path is not None:
+            if not os.path.exists(self.path):
+                return None
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)["data"]
+        raw = Store.files.get(self.key)
+        if raw is None:
+            return None
+        return json.loads(raw)["data"]
+
+    async def async_save(self, data: Any) -> None:
+        raw = json.dumps(
+            {"version": self.version, "minor_version": 1, "key": self.key, "data": data}
+        )
+        Store.writes.append((self.key, len(raw)))
+        if self.path is None:
+            Store.files[self.key] = raw
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(raw)
+        os.replace(temp_path, self.path)
+
+    async def async_remove(self) -> None:
+        if self.path is not None:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        Store.files.pop(self.key, None)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all in-memory files and recorded writes."""
+        cls.files = {}
+        cls.writes = []
+
+    @classmethod
+    def use_directory(cls, config_dir: Optional[str]) -> None:
+        """Read and write real Store files under config_dir/.storage."""
+        cls.directory = config_dir
+
+
+class Bus:
+    """Event bus that records fired events."""
+
+    def __init__(self):
+        self.events: List[Tuple[str, Any]] = []
+        self._listeners: Dict[str, List[Any]] = {}
+
+    def async_fire(self, event_type, event_data=None, *args, **kwargs):
+        self.events.append((event_type, event_data))
+        for listener in list(self._listeners.get(event_type, [])):
+            listener(types.SimpleNamespace(event_type=event_type, data=event_data or {}))
+
+    def async_listen(self, event_type, listener):
+        self._listeners.setdefault(event_type, []).append(listener)
+        return lambda: self._listeners[event_type].remove(listener)
+
+    async_listen_once = async_listen
+
+
+class HomeAssistant:
+    """Minimal hass object: data, bus, config dir and executor jobs."""
+
+    def __init__(self, config_dir: Optional[str] = None):
+        self.data: Dict[str, Any] = {}
+        self.bus = Bus()
+        config_dir = config_dir or os.getcwd()
+        self.config = types.SimpleNamespace(
+            config_dir=config_dir,
+            path=lambda *parts: os.path.join(config_dir, *parts),
+        )
+
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+    def async_create_task(self, target, name=None, eager_start=False):
+        return asyncio.ensure_future(target)
+
+    async_create_background_task = async_create_task
+
+
+def _module(name: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    sys.modules[name] = module
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def install() -> None:
+    """Register the stand-in modules under the homeassistant namespace."""
+    if "homeassistant" in sys.modules and getattr(sys.modules["homeassistant"], "STANDIN", False):
+        return
+
+    root = _module("homeassistant")
+    root.STANDIN = True
+
+    core = _module("homeassistant.core")
+    core.HomeAssistant = HomeAssistant
+    core.callback = lambda func: func
+    core.Event = types.SimpleNamespace
+    core.ServiceCall = types.SimpleNamespace
+    core.ServiceResponse = dict
+    core.CALLBACK_TYPE = object
+
+    exceptions = _module("homeassistant.exceptions")
+    exceptions.HomeAssistantError = type("HomeAssistantError", (Exception,), {})
+
+    _module("homeassistant.helpers")
+    storage = _module("homeassistant.helpers.storage")
+    storage.Store = Store
+
+    event = _module("homeassistant.helpers.event")
+
+    def async_call_later(hass, delay, action):
+        handle = asyncio.get_running_loop().call_later(
+            delay, lambda: asyncio.ensure_future(action(None))
+        )
+        return handle.cancel
+
+    event.async_call_later = async_call_later
+    # Scheduled callbacks never fire in benchmarks
+    event.async_track_time_change = lambda hass, action, **kwargs: lambda: None
+
+    _module("homeassistant.util")
+    dt_util = _module("homeassistant.util.dt")
+    dt_util.UTC = timezone.utc
+    dt_util.DEFAULT_TIME_ZONE = timezone.utc
+    dt_util.utcnow = lambda: datetime.now(timezone.utc)
+    dt_util.now = lambda time_zone=None: datetime.now(timezone.utc)
+
+    def as_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    dt_util.as_utc = as_utc
+    dt_util.utc_from_timestamp = lambda timestamp: datetime.fromtimestamp(timestamp, timezone.utc)
+    dt_util.as_local = as_utc
+
+    # Import submodules without running the integration's setup module
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    importlib.import_module("custom_components")
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [os.path.join(REPO_ROOT, *PACKAGE.split("."))]
+    sys.modules[PACKAGE] = package
+
+
+def load_integration_module(name: str) -> types.ModuleType:
+    """Import a Chore Assistant submodule against the stand-ins."""
+    install()
+    return importlib.import_module(f"{PACKAGE}.{name}")
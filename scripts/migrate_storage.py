@@ -0,0 +1,68 @@
+"""Move Chore Assistant data between the JSON and SQLite storage backends.
+
+Usage: python scripts/migrate_storage.py --config /config --to sqlite
+       python scripts/migrate_storage.py --config /config --to json [--shards 16]
+
+Stop Home Assistant before running this, then set `storage_backend` (and
+`storage_shards`) in configuration.yaml to match the target. The source
+files are kept unless --remove-source is given.
+"""
+import argparse
+import asyncio
+import sys
+
+import ha_standin
+
+backends = ha_standin.load_integration_module("backends")
+sharding = ha_standin.load_integration_module("sharding")
+sqlite_backend = ha_standin.load_integration_module("sqlite_backend")
+
+
+async def find_source(hass, exclude):
+    """Return the first backend other than the target that holds data."""
+    for backend in backends.available_backends(hass, exclude=exclude):
+        if await backend.async_load() is not None:
+            return backend
+    return None
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", required=True, help="Home Assistant config directory")
+    parser.add_argument("--to", required=True, choices=["json", "sqlite"])
+    parser.add_argument("--shards", type=int, default=0, help="shard count for the JSON target")
+    parser.add_argument("--remove-source", action="store_true")
+    args = parser.parse_args()
+
+    ha_standin.Store.use_directory(args.config)
+    hass = ha_standin.HomeAssistant(args.config)
+
+    if args.to == "sqlite":
+        target = sqlite_backend.SQLiteBackend(hass)
+    elif args.shards > 0:
+        target = sharding.ShardedStore(hass, args.shards)
+    else:
+        target = backends.JsonStoreBackend(hass)
+
+    if await target.async_load() is not None:
+        print(f"Target {target.name} storage already holds data; refusing to overwrite it")
+        await target.async_close()
+        return 1
+
+    source = await find_source(hass, target)
+    if source is None:
+        print("No Chore Assistant data found to migrate")
+        await target.async_close()
+        return 1
+
+    count = await backends.async_migrate_backend(
+        source, target, remove_source=args.remove_source
+    )
+    await source.async_close()
+    await target.async_close()
+    print(f"Migrated {count} chores from {source.name} storage to {target.name} storage")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
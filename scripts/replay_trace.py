@@ -0,0 +1,284 @@
+"""Replay a recorded service call trace against fresh storage.
+
+Usage: python scripts/replay_trace.py TRACE [--speed 1] [--concurrency 64]
+                                            [--backend json] [--shards 0]
+                                            [--operation-log]
+
+TRACE is a file written between chore_assistant.start_trace and stop_trace.
+Each household starts from the chores in the trace header, in a fresh
+in-memory store with the given layout. Calls are then dispatched at their
+recorded offsets divided by --speed, or back to back with --speed 0, while a
+virtual clock reports each call's recorded time. Calls overlap as they did
+in production, up to --concurrency at once.
+
+Calls run through the same service actions the integration's handlers
+use, with mutations going through each household's command queue. Backup,
+diagnostics and trace calls, and calls to services this tool does not know,
+are skipped and counted in the report. The report compares recorded and
+replayed latency percentiles per service.
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime
+
+import ha_standin
+
+actions = ha_standin.load_integration_module("actions")
+clock = ha_standin.load_integration_module("clock")
+const = ha_standin.load_integration_module("const")
+household_module = ha_standin.load_integration_module("household")
+models = ha_standin.load_integration_module("models")
+
+SKIPPED_SERVICES = {
+    const.SERVICE_CREATE_BACKUP,
+    const.SERVICE_LIST_BACKUPS,
+    const.SERVICE_RESTORE_BACKUP,
+    const.SERVICE_GET_DIAGNOSTICS,
+    const.SERVICE_START_TRACE,
+    const.SERVICE_STOP_TRACE,
+}
+
+
+def parse_date(value):
+    """Return a due date recorded as an ISO string."""
+    if not isinstance(value, str):
+        return value
+    return datetime.fromisoformat(value) if "T" in value or " " in value else date.fromisoformat(value)
+
+
+def parse_datetime(value):
+    """Return a datetime recorded as an ISO string."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def percentile(values, fraction: float) -> float:
+    """Return a percentile of sorted values."""
+    if not values:
+        return 0.0
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def read_trace(path: str):
+    """Return the trace header and its call records."""
+    with open(path, encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        if header.get("v") != const.TRACE_FORMAT_VERSION:
+            raise SystemExit(f"Unsupported trace version: {header.get('v')}")
+        records = []
+        for line in file:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # The final line may be torn if Home Assistant stopped mid-write
+                break
+    return header, records
+
+
+# Fields the service schemas turn into dates and datetimes before the handlers see them
+DATE_FIELDS = (const.ATTR_DUE_DATE,)
+DATETIME_FIELDS = ("start", "end")
+
+
+def restore_types(data):
+    """Return recorded call data with the types the service schemas produce."""
+    data = dict(data)
+    for field in DATE_FIELDS:
+        if field in data:
+            data[field] = parse_date(data[field])
+    for field in DATETIME_FIELDS:
+        if field in data:
+            data[field] = parse_datetime(data[field])
+    return data
+
+
+def service_action(action):
+    """Return a replay action that calls a service action with the call data."""
+
+    async def async_run(household, data, record):
+        result = action(household, data)
+        if asyncio.iscoroutine(result):
+            await result
+
+    return async_run
+
+
+def queued(kind: str, resolve: bool = True):
+    """Return a replay action that submits a command to the household's queue."""
+
+    async def async_submit(household, data, record):
+        chore_id = (
+            actions.resolve_chore_id(household, data) if resolve else data.get(const.ATTR_CHORE_ID)
+        )
+        await household.command_queue.async_submit(kind, chore_id, data)
+
+    return async_submit
+
+
+async def add_chore(household, data, record):
+    """Add a chore under the ID it was given when recorded."""
+    result = record.get("r") or {}
+    await actions.async_add_chore(household, data, result.get(const.ATTR_CHORE_ID))
+
+
+async def remove_chore(household, data, record):
+    """Remove a chore by ID or name."""
+    await actions.async_remove_chore(household, actions.resolve_chore_id(household, data))
+
+
+async def check_recurring(household, data, record):
+    """Run the recurring reset."""
+    await household.state_manager.check_recurring_chores()
+
+
+# Each replay action takes the household, the call data and the trace record
+REPLAY_ACTIONS = {
+    const.SERVICE_ADD_CHORE: add_chore,
+    const.SERVICE_REMOVE_CHORE: remove_chore,
+    const.SERVICE_COMPLETE_CHORE: queued(const.COMMAND_COMPLETE),
+    const.SERVICE_RESET_CHORE: queued(const.COMMAND_RESET),
+    const.SERVICE_UPDATE_CHORE: queued(const.COMMAND_UPDATE, resolve=False),
+    const.SERVICE_LIST_CHORES: service_action(actions.async_list_chores),
+    "check_recurring": check_recurring,
+    const.SERVICE_QUERY_HISTORY: service_action(actions.async_query_history),
+    const.SERVICE_GET_REPORT: service_action(actions.get_report),
+    const.SERVICE_GET_FORECAST: service_action(actions.get_forecast),
+    const.SERVICE_REBALANCE: service_action(actions.async_rebalance),
+    const.SERVICE_ANALYZE_STORAGE: service_action(actions.analyze_storage),
+    const.SERVICE_GET_CHANGES: service_action(actions.get_changes),
+}
+
+
+class Replayer:
+    """Applies trace records to households built from the trace header.
+
+    Each call goes through the same household resolution, chore name
+    resolution and service actions as the integration's handlers; only
+    schema validation and the entity registry are left out.
+    """
+
+    def __init__(self, households):
+        """Initialize with households keyed by ID."""
+        self.households = households
+
+    async def dispatch(self, record) -> None:
+        """Apply one recorded call."""
+        service = record["s"]
+        data = restore_types(record["d"])
+        household = await actions.async_resolve_household(self.households, service, data)
+        await REPLAY_ACTIONS[service](household, data, record)
+
+
+async def build_households(header, args):
+    """Create one household per trace household, seeded with its chores."""
+    hass = ha_standin.HomeAssistant(tempfile.mkdtemp(prefix="chore_replay_"))
+    conf = {
+        const.CONF_STORAGE_BACKEND: args.backend,
+        const.CONF_STORAGE_SHARDS: args.shards,
+        const.CONF_OPERATION_LOG: args.operation_log,
+    }
+    households = {}
+    for household_id, chores in header["households"].items():
+        household = household_module.Household(
+            hass,
+            household_id,
+            header.get("names", {}).get(household_id, household_id),
+            conf,
+            {
+                const.COMMAND_COMPLETE: actions.async_apply_complete,
+                const.COMMAND_RESET: actions.async_apply_reset,
+                const.COMMAND_UPDATE: actions.async_apply_update,
+            },
+        )
+        household.async_start()
+        await household.storage.async_wait_ready()
+        async with household.storage.async_batch():
+            for record in chores.values():
+                await household.storage.async_add_chore(models.Chore.from_dict(record))
+        households[household_id] = household
+    return households
+
+
+async def replay(args) -> None:
+    """Replay the trace and print throughput and latency."""
+    header, records = read_trace(args.trace)
+    virtual = clock.VirtualClock(clock.get_clock().utcnow())
+    virtual.set(datetime.fromtimestamp(header["t"]).astimezone())
+    clock.set_clock(virtual)
+    ha_standin.Store.reset()
+    households = await build_households(header, args)
+    replayer = Replayer(households)
+
+    recorded = defaultdict(list)
+    replayed = defaultdict(list)
+    errors = defaultdict(int)
+    skipped = Counter()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run(record) -> None:
+        async with semaphore:
+            virtual.set(datetime.fromtimestamp(record["t"]).astimezone())
+            started = time.perf_counter()
+            try:
+                await replayer.dispatch(record)
+            except Exception:
+                errors[record["s"]] += 1
+            replayed[record["s"]].append((time.perf_counter() - started) * 1000)
+
+    tasks = []
+    loop = asyncio.get_running_loop()
+    first = records[0]["t"] if records else 0
+    started = loop.time()
+    for record in records:
+        if record["s"] in SKIPPED_SERVICES or record["s"] not in REPLAY_ACTIONS:
+            skipped[record["s"]] += 1
+            continue
+        recorded[record["s"]].append(record["ms"])
+        if args.speed > 0:
+            delay = started + (record["t"] - first) / args.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(run(record)))
+    await asyncio.gather(*tasks)
+    elapsed = loop.time() - started
+
+    for household in households.values():
+        await household.async_stop()
+    clock.set_clock(None)
+
+    calls = sum(len(values) for values in replayed.values())
+    speed = f"{args.speed:g}x" if args.speed > 0 else "max speed"
+    print(f"{calls} calls replayed at {speed} in {elapsed:.2f}s: {calls / elapsed:,.0f} calls/s")
+    for service, count in sorted(skipped.items()):
+        print(f"skipped {count} {service} calls")
+    print(
+        f"{'service':<18} {'calls':>6} {'errors':>6} {'rec p50':>8} {'rec p95':>8}"
+        f" {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for service in sorted(replayed):
+        times = sorted(replayed[service])
+        original = sorted(recorded[service])
+        print(
+            f"{service:<18} {len(times):>6} {errors[service]:>6}"
+            f" {percentile(original, 0.5):>8.2f} {percentile(original, 0.95):>8.2f}"
+            f" {percentile(times, 0.5):>8.2f} {percentile(times, 0.95):>8.2f}"
+            f" {percentile(times, 0.99):>8.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--backend", default=const.STORAGE_BACKEND_JSON)
+    parser.add_argument("--shards", type=int, default=0)
+    parser.add_argument("--operation-log", action="store_true")
+    asyncio.run(replay(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Fast-forward a generated household through simulated days.
+
+Usage: python scripts/simulate_household.py [--days 365] [--chores 50]
+                                            [--members 4] [--on-time 0.8]
+                                            [--late 0.5] [--shards 16] [--seed 1]
+
+Time comes from a VirtualClock, so a year of midnight sweeps, completions,
+recurrence resets and overdue checks replays in seconds. Each day the sweep
+runs at midnight, then members complete chores through the command queue:
+a chore due today is done with probability --on-time, an overdue one with
+probability --late. After every sweep the run checks that no pending chore
+is past due, no overdue chore is not yet due, and no chore was reset into a
+cycle that is already over. It exits with status 1 if any check failed.
+"""
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+import ha_standin
+
+clock = ha_standin.load_integration_module("clock")
+const = ha_standin.load_integration_module("const")
+household_module = ha_standin.load_integration_module("household")
+models = ha_standin.load_integration_module("models")
+
+INTERVALS = [1, 2, 3, 7, 7, 14, 30]
+
+
+async def apply_complete(household, chore_id: str, data) -> None:
+    """Complete a chore from a queued command."""
+    await household.state_manager.complete_chore(
+        chore_id, completed_by=data.get("completed_by")
+    )
+
+
+def build_chores(count: int, start: date):
+    """Generate chores with assorted intervals, first due within one interval."""
+    chores = []
+    for index in range(count):
+        interval = random.choice(INTERVALS)
+        chores.append(
+            models.Chore(
+                id=f"{index:08x}",
+                name=f"Chore {index}",
+                state=const.STATE_PENDING,
+                created_date=clock.now(),
+                due_date=start + timedelta(days=random.randrange(interval)),
+                interval_days=interval,
+                metadata=models.ChoreMetadata(
+                    priority=random.choice(["low", "medium", "high"]),
+                    estimated_duration=random.choice([5, 15, 30, 60]),
+                ),
+            )
+        )
+    return chores
+
+
+def check_invariants(household, today: date, reset_ids) -> list:
+    """Return descriptions of chores in a state the sweep should have prevented."""
+    due_day = clock.local_day
+    problems = []
+    for chore in household.storage.chores.values():
+        if chore.due_date is None:
+            continue
+        day = due_day(chore.due_date)
+        if chore.state == const.STATE_PENDING and day < today:
+            problems.append(f"{chore.id} pending but due {day}")
+        elif chore.state == const.STATE_OVERDUE and day >= today:
+            problems.append(f"{chore.id} overdue but due {day}")
+        if chore.id in reset_ids and day < today:
+            problems.append(f"{chore.id} reset into a cycle due {day}")
+    return problems
+
+
+async def simulate(args) -> int:
+    """Run the simulation and print its summary; return the exit status."""
+    random.seed(args.seed)
+    ha_standin.Store.reset()
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    virtual = clock.VirtualClock(start)
+    clock.set_clock(virtual)
+
+    hass = ha_standin.HomeAssistant()
+    events = Counter()
+    for event_type in (const.EVENT_CHORE_OVERDUE, const.EVENT_CHORE_DUE_SOON):
+        hass.bus.async_listen(event_type, lambda event, kind=event_type: events.update([kind]))
+
+    members = [f"member{index}" for index in range(args.members)]
+    household = household_module.Household(
+        hass,
+        const.DEFAULT_HOUSEHOLD,
+        const.DEFAULT_HOUSEHOLD_NAME,
+        {const.CONF_MEMBERS: members, const.CONF_STORAGE_SHARDS: args.shards},
+        {const.COMMAND_COMPLETE: apply_complete},
+    )
+    household.async_start()
+    await household.storage.async_wait_ready()
+    async with household.storage.async_batch():
+        for chore in build_chores(args.chores, start.date()):
+            chore.assigned_to = household.assigner.assign(chore)
+            await household.storage.async_add_chore(chore)
+
+    problems = []
+    counts = Counter()
+    sweep_seconds = []
+    started = time.perf_counter()
+    for day in range(args.days):
+        midnight = virtual.advance(timedelta(days=1) if day else timedelta())
+        today = clock.today()
+
+        history_before = {
+            chore_id: len(chore.history) for chore_id, chore in household.storage.chores.items()
+        }
+        sweep_started = time.perf_counter()
+        await household.async_midnight_sweep(midnight)
+        sweep_seconds.append(time.perf_counter() - sweep_started)
+
+        reset_ids = {
+            chore_id
+            for chore_id, chore in household.storage.chores.items()
+            if any(
+                entry.action == "reset" for entry in chore.history[history_before[chore_id]:]
+            )
+        }
+        for problem in check_invariants(household, today, reset_ids):
+            problems.append(f"{today}: {problem}")
+
+        # Members work through the day's chores in the evening
+        virtual.set(midnight + timedelta(hours=18))
+        submissions = []
+        for chore in household.storage.chores.values():
+            if chore.state == const.STATE_COMPLETED or chore.due_date is None:
+                continue
+            late = chore.state == const.STATE_OVERDUE
+            due_today = clock.local_day(chore.due_date) == today
+            if (late and random.random() < args.late) or (
+                due_today and random.random() < args.on_time
+            ):
+                submissions.append(
+                    household.command_queue.async_submit(
+                        const.COMMAND_COMPLETE, chore.id, {"completed_by": chore.assigned_to}
+                    )
+                )
+        await asyncio.gather(*submissions)
+        virtual.set(midnight)
+
+    elapsed = time.perf_counter() - started
+    for chore in household.storage.chores.values():
+        counts.update(entry.action for entry in chore.history)
+    await household.async_stop()
+    clock.set_clock(None)
+
+    sweep_seconds.sort()
+    transitions = counts["completed"] + counts["reset"] + counts["overdue"]
+    print(
+        f"{args.days} days, {args.chores} chores, {args.members} members, "
+        f"{args.shards} shards in {elapsed:.2f}s"
+    )
+    print(
+        f"completed {counts['completed']}, reset {counts['reset']}, "
+        f"overdue {counts['overdue']}; {transitions / elapsed:,.0f} transitions/s"
+    )
+    print(
+        f"sweep p50 {sweep_seconds[len(sweep_seconds) // 2] * 1000:.2f} ms, "
+        f"p95 {sweep_seconds[int(len(sweep_seconds) * 0.95)] * 1000:.2f} ms, "
+        f"max {sweep_seconds[-1] * 1000:.2f} ms"
+    )
+    print(f"events: {dict(events)}")
+    print(f"command queue: {household.command_queue.metrics}")
+    print(f"loads: {household.assigner.loads()}")
+    if problems:
+        print(f"{len(problems)} invariant violations, first {min(len(problems), 10)}:")
+        for problem in problems[:10]:
+            print(f"  {problem}")
+        return 1
+    print("no invariant violations")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--chores", type=int, default=50)
+    parser.add_argument("--members", type=int, default=4)
+    parser.add_argument("--on-time", type=float, default=0.8)
+    parser.add_argument("--late", type=float, default=0.5)
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(simulate(args)))
+
+
+if __name__ == "__main__":
+    main()